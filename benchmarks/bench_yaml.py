@@ -0,0 +1,47 @@
+"""Compare YAML throughput of the libyaml and pure Python implementations.
+
+Run with `python benchmarks/bench_yaml.py`.
+"""
+
+import timeit
+
+import yaml  # type: ignore
+from synthetic import synthetic_manifest
+
+from ict import _yaml
+
+SIZES = [10, 100, 1000]
+
+
+def _bench(func, number: int = 5) -> float:
+    """Return the best time per call, in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number
+
+
+def main() -> None:
+    """Print load and dump throughput for each manifest size."""
+    print(f"libyaml available: {_yaml.LIBYAML}")
+    print(f"{'inputs':>8} {'size kB':>8} {'op':>5} {'pure MB/s':>10} {'C MB/s':>10}")
+    for size in SIZES:
+        data = synthetic_manifest(size)
+        text = yaml.dump(data, Dumper=yaml.SafeDumper)
+        megabytes = len(text.encode("utf-8")) / 1e6
+        ops = {
+            "load": (
+                lambda: yaml.load(text, Loader=yaml.SafeLoader),  # nosec B506
+                lambda: _yaml.safe_load(text),
+            ),
+            "dump": (
+                lambda: yaml.dump(data, Dumper=yaml.SafeDumper),
+                lambda: _yaml.safe_dump(data),
+            ),
+        }
+        for name, (pure, fast) in ops.items():
+            print(
+                f"{size:>8} {megabytes * 1e3:>8.1f} {name:>5} "
+                f"{megabytes / _bench(pure):>10.2f} {megabytes / _bench(fast):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Fixtures for the benchmark suite."""
+
+import json
+
+import pytest
+from synthetic import synthetic_manifest
+
+from ict import ICT, _yaml
+
+# number of inputs (and UI items) of the synthetic manifests
+SIZES = [10, 100, 500]
+
+
+@pytest.fixture(params=SIZES, ids=[f"n{size}" for size in SIZES])
+def manifest(request) -> dict:
+    """Synthetic manifest as a dict."""
+    return synthetic_manifest(request.param, n_outputs=max(1, request.param // 10))
+
+
+@pytest.fixture
+def ict(manifest) -> ICT:
+    """Synthetic manifest as a validated ICT."""
+    return ICT(**manifest)
+
+
+@pytest.fixture
+def yaml_file(manifest, tmp_path):
+    """Synthetic manifest written as YAML."""
+    path = tmp_path.joinpath("spec.yaml")
+    with path.open("w", encoding="utf-8") as file:
+        _yaml.safe_dump(manifest, file)
+    return path
+
+
+@pytest.fixture
+def json_file(manifest, tmp_path):
+    """Synthetic manifest written as JSON."""
+    path = tmp_path.joinpath("spec.json")
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return path
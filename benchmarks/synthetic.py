@@ -0,0 +1,129 @@
+"""Synthetic ICT manifests for benchmarks."""
+
+import copy
+
+_UI_TEMPLATES = [
+    {"type": "text", "default": "value"},
+    {"type": "number", "default": 1, "integer": True, "range": [0, 10]},
+    {"type": "checkbox", "default": False},
+    {"type": "select", "fields": ["a", "b", "c"]},
+    {"type": "multiselect", "fields": ["a", "b", "c"], "limit": 2},
+    {"type": "color", "fields": [255, 0, 0]},
+    {"type": "datetime", "format": "YYYY-MM-DD"},
+    {"type": "path", "ext": [".tif", ".ome.tif"]},
+    {"type": "file", "ext": [".csv"], "limit": 3, "size": 1024},
+]
+_IO_TYPES = ["string", "number", "array", "boolean", "path"]
+
+
+def synthetic_manifest(n_inputs: int, n_outputs: int = 1) -> dict:
+    """Return a valid ICT manifest with `n_inputs` inputs and UI items."""
+    inputs = [
+        {
+            "name": f"input{i}",
+            "type": _IO_TYPES[i % len(_IO_TYPES)],
+            "description": f"Input number {i}",
+            "required": i % 2 == 0,
+            "format": {
+                "uri": "http://edamontology.org/format_3727",
+                "term": f"term{i % 10}",
+            },
+        }
+        for i in range(n_inputs)
+    ]
+    outputs = [
+        {
+            "name": "outDir" if i == 0 else f"output{i}",
+            "type": "path",
+            "description": f"Output number {i}",
+            "required": True,
+            "format": ["image collection"],
+        }
+        for i in range(n_outputs)
+    ]
+    ui = []
+    for i in range(n_inputs):
+        item = copy.deepcopy(_UI_TEMPLATES[i % len(_UI_TEMPLATES)])
+        item.update(
+            {
+                "key": f"inputs.input{i}",
+                "title": f"Input {i}",
+                "description": f"Pick input {i}",
+            }
+        )
+        if i > 0:
+            item["condition"] = f"inputs.input{i - 1}=='value'"
+        ui.append(item)
+    return {
+        "specVersion": "1.0.0",
+        "name": "bench/synthetic",
+        "version": "1.2.3",
+        "container": "bench/synthetic-tool:1.2.3",
+        "entrypoint": "/opt/executables/main.sh",
+        "title": "Synthetic Tool",
+        "description": "Synthetic tool used in benchmarks",
+        "author": ["Jane Doe", "John Smith"],
+        "contact": "jane.doe@example.com",
+        "repository": "https://github.com/example/synthetic",
+        "documentation": "https://example.com/docs",
+        "citation": "10.1234/synthetic",
+        "hardware": {
+            "cpu": {"type": "x86_64", "min": "100m", "recommended": "2"},
+            "memory": {"min": "129Mi", "recommended": "2Gi"},
+            "gpu": {"enabled": True, "required": False, "type": "cuda11"},
+        },
+        "inputs": inputs,
+        "outputs": outputs,
+        "ui": ui,
+    }
+
+
+def synthetic_versions(n_versions: int) -> list[str]:
+    """Return `n_versions` distinct semantic versions, shuffled."""
+    versions = [
+        f"{i % 13}.{(i * 7) % 11}.{i}" + ("-rc1" if i % 5 == 0 else "")
+        for i in range(n_versions)
+    ]
+    return sorted(versions, key=hash)
+
+
+def synthetic_wipp_manifest(n_inputs: int) -> dict:
+    """Return a WIPP plugin manifest with `n_inputs` inputs and UI items."""
+    wipp_types = ["string", "number", "integer", "boolean", "enum", "collection"]
+    inputs = []
+    ui = []
+    for i in range(n_inputs):
+        type_ = wipp_types[i % len(wipp_types)]
+        inp = {
+            "name": f"input{i}",
+            "type": type_,
+            "description": f"Input number {i}",
+            "required": i % 2 == 0,
+        }
+        if type_ == "enum":
+            inp["options"] = {"values": ["a", "b", "c"]}
+        inputs.append(inp)
+        ui.append(
+            {
+                "key": f"inputs.input{i}",
+                "title": f"Input {i}",
+                "description": f"Pick input {i}",
+            }
+        )
+    return {
+        "name": "Synthetic Plugin",
+        "version": "1.2.3",
+        "title": "Synthetic Plugin",
+        "description": "Synthetic plugin used in benchmarks",
+        "author": "Jane Doe (jane.doe@example.com), John Smith",
+        "institution": "Example Institute",
+        "repository": "https://github.com/example/synthetic",
+        "website": "https://example.com",
+        "citation": "",
+        "containerId": "bench/synthetic-plugin:1.2.3",
+        "baseCommand": ["python3", "-m", "synthetic"],
+        "inputs": inputs,
+        "outputs": [{"name": "outDir", "type": "collection", "description": "Output"}],
+        "ui": ui,
+        "resourceRequirements": {"ramMin": 2048, "coresMin": 1, "gpu": False},
+    }
@@ -0,0 +1,49 @@
+"""Benchmark binary serialization against JSON and YAML."""
+
+import json
+
+import pytest
+
+from ict import ICT, _yaml
+
+pytest.importorskip("msgpack")
+
+
+def test_to_bytes(benchmark, ict):
+    """Serialize to bytes."""
+    benchmark(ict.to_bytes)
+
+
+def test_to_json(benchmark, ict):
+    """Serialize to JSON."""
+    benchmark(ict.model_dump_json, by_alias=True, exclude_none=True)
+
+
+def test_to_yaml(benchmark, ict):
+    """Serialize to YAML."""
+    benchmark(
+        lambda: _yaml.safe_dump(
+            ict.model_dump(mode="json", by_alias=True, exclude_none=True)
+        )
+    )
+
+
+@pytest.mark.parametrize("trusted", [False, True], ids=["validated", "trusted"])
+def test_from_bytes(benchmark, ict, trusted):
+    """Deserialize from bytes."""
+    data = ict.to_bytes()
+    benchmark(ICT.from_bytes, data, trusted=trusted)
+
+
+def test_from_json(benchmark, ict):
+    """Deserialize and validate from JSON."""
+    data = ict.model_dump_json(by_alias=True, exclude_none=True)
+    benchmark(lambda: ICT(**json.loads(data)))
+
+
+def test_from_yaml(benchmark, ict):
+    """Deserialize and validate from YAML."""
+    data = _yaml.safe_dump(
+        ict.model_dump(mode="json", by_alias=True, exclude_none=True)
+    )
+    benchmark(lambda: ICT(**_yaml.safe_load(data)))
@@ -0,0 +1,49 @@
+"""Benchmark ICTCatalog queries."""
+
+import pytest
+from synthetic import synthetic_manifest
+
+from ict import ICT
+from ict.catalog import ICTCatalog
+
+N_TOOLS = 100_000
+
+
+@pytest.fixture(scope="module")
+def catalog() -> ICTCatalog:
+    """Catalog of synthetic tools spread over 1000 names."""
+    base = ICT(**synthetic_manifest(5))
+    catalog = ICTCatalog()
+    for i in range(N_TOOLS):
+        version = base.version.model_validate(f"{i % 7}.{i % 13}.{i // 1000}")
+        catalog.add(
+            base.model_copy(
+                update={
+                    "name": f"bench/tool{i % 1000}",
+                    "version": version,
+                    "container": f"bench/tool{i % 1000}:{version}",
+                }
+            )
+        )
+    return catalog
+
+
+def test_latest(benchmark, catalog):
+    """Resolve the latest version satisfying a constraint."""
+    benchmark(catalog.latest, "bench/tool500", ">=3.0.0,<5.0.0")
+
+
+def test_by_container(benchmark, catalog):
+    """Look up tools by container image."""
+    benchmark(catalog.by_container, "bench/tool500:3.6.12")
+
+
+def test_query(benchmark, catalog):
+    """Combine several filters."""
+    benchmark(catalog.query, name="bench/tool500", io_type="path", max_cpu=1)
+
+
+def test_add_remove(benchmark, catalog):
+    """Add then remove a tool."""
+    ict = next(iter(catalog)).model_copy(update={"name": "bench/new"})
+    benchmark(lambda: (catalog.add(ict), catalog.remove(ict.name, ict.version)))
@@ -0,0 +1,24 @@
+"""Benchmark Parquet export and lazy reading of ICT collections."""
+
+import pytest
+from synthetic import synthetic_manifest
+
+from ict import ICT
+
+pytest.importorskip("pyarrow")
+from ict.columnar import ParquetCatalog, write_parquet  # noqa: E402
+
+ICTS = [ICT(**synthetic_manifest(8, 8)) for _ in range(1000)]
+
+
+def test_write_parquet(benchmark, tmp_path):
+    """Write 1000 ICTs to Parquet."""
+    benchmark(write_parquet, ICTS, tmp_path)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_read_parquet(benchmark, tmp_path, trusted):
+    """Rebuild 1000 ICTs from Parquet."""
+    write_parquet(ICTS, tmp_path)
+    catalog = ParquetCatalog(tmp_path, trusted=trusted)
+    benchmark(list, catalog)
@@ -0,0 +1,27 @@
+"""Benchmark CWL CommandLineTool generation."""
+
+from ict.tools import clear_clt_cache, clt_dict, to_clt_many
+
+
+def test_to_clt(benchmark, ict):
+    """Convert an ICT to a CommandLineTool."""
+    benchmark(ict.to_clt)
+
+
+def test_clt_dict(benchmark, ict):
+    """Build the CommandLineTool dict of an ICT."""
+    benchmark(clt_dict, ict, False)
+
+
+def test_save_clt(benchmark, ict, tmp_path):
+    """Save an ICT as a CommandLineTool."""
+    benchmark(ict.save_clt, tmp_path.joinpath("tool.cwl"))
+
+
+def test_to_clt_many(benchmark, ict):
+    """Convert a catalog of 1000 ICTs, 100 of them distinct, from a cold cache."""
+    icts = [
+        ict.model_copy(update={"container": f"bench/synthetic:{i % 100}"})
+        for i in range(1000)
+    ]
+    benchmark.pedantic(to_clt_many, (icts,), setup=clear_clt_cache, rounds=5)
@@ -0,0 +1,23 @@
+"""Benchmark the scheduling overhead of LocalExecutor."""
+
+from pathlib import Path
+
+from ict import validate
+from ict.executor import Backend, BackendResult, Job, LocalExecutor
+
+SPEC = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
+
+
+class NoopBackend(Backend):
+    """Backend returning at once, to measure the executor alone."""
+
+    def run(self, job, allocation, workdir):
+        return BackendResult(0)
+
+
+def test_run_1000_jobs(benchmark, tmp_path):
+    """Pack 1000 instant jobs onto 400 cores."""
+    jobs = [Job(ict=validate(SPEC), workdir=tmp_path)] * 1000
+    executor = LocalExecutor(NoopBackend(), cores=400, memory=0)
+    report = benchmark(executor.run, jobs)
+    assert len(report.succeeded) == 1000
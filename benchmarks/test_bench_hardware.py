@@ -0,0 +1,48 @@
+"""Benchmark attribute access on HardwareRequirements."""
+
+import pytest
+from synthetic import synthetic_manifest
+
+from ict import ICT
+from ict.hardware import HardwareRequirements, parse_memory
+
+HARDWARE = HardwareRequirements(
+    cpu={"type": "x86_64", "min": "100m", "recommended": "2"},
+    memory={"min": "129Mi", "recommended": "2Gi"},
+)
+
+
+@pytest.mark.parametrize("name", ["cpu", "cpu_min", "memory_recommended", "gpu_type"])
+def test_attribute(benchmark, name):
+    """Read a field, or a flattened field of a present or missing section."""
+    benchmark(getattr, HARDWARE, name)
+
+
+@pytest.mark.parametrize("value", ["100m", "2", "129Mi"])
+def test_parse_quantity(benchmark, value):
+    """Parse a quantity, uncached."""
+    benchmark(parse_memory.__wrapped__, value)
+
+
+def test_matcher_rank(benchmark):
+    """Rank 500 nodes for 2000 tools."""
+    np = pytest.importorskip("numpy")
+    from ict.hardware.matching import HardwareMatcher
+
+    rng = np.random.default_rng(0)
+    icts = [
+        ICT(**synthetic_manifest(1, 1)).model_copy(
+            update={
+                "hardware": HardwareRequirements(
+                    cpu={"min": f"{rng.integers(1, 8) * 250}m"},
+                    memory={"min": f"{rng.integers(1, 16)}Gi"},
+                )
+            }
+        )
+        for _ in range(2000)
+    ]
+    matcher = HardwareMatcher(icts)
+    nodes = np.column_stack(
+        (rng.integers(1, 33, 500), rng.integers(1, 129, 500) * 2**30, np.zeros(500))
+    )
+    benchmark(matcher.rank, nodes)
@@ -0,0 +1,11 @@
+"""Benchmark serialization of ICT objects."""
+
+
+def test_model_dump(benchmark, ict):
+    """Dump an ICT as a JSON compatible dict."""
+    benchmark(ict.model_dump, mode="json", exclude_none=True, by_alias=True)
+
+
+def test_save_yaml(benchmark, ict, tmp_path):
+    """Save an ICT as YAML."""
+    benchmark(ict.save_yaml, tmp_path.joinpath("spec.yaml"))
@@ -0,0 +1,43 @@
+"""Benchmark validation of ICT manifests."""
+
+import copy
+
+import pytest
+
+from ict import check, dumps_trusted, loads_trusted, validate
+
+
+def test_validate_dict(benchmark, manifest):
+    """Validate a manifest already loaded as a dict."""
+    benchmark(validate, manifest)
+
+
+def test_validate_yaml(benchmark, yaml_file):
+    """Validate a YAML manifest."""
+    benchmark(validate, yaml_file)
+
+
+def test_validate_json(benchmark, json_file):
+    """Validate a JSON manifest."""
+    benchmark(validate, json_file)
+
+
+def test_validate_ui(benchmark, ict):
+    """Match the ui items with the inputs and outputs, linear in their number."""
+    benchmark(ict.validate_ui)
+
+
+def test_loads_trusted(benchmark, ict):
+    """Reload a validated manifest with `loads_trusted`, skipping validation."""
+    data = dumps_trusted(ict)
+    benchmark(loads_trusted, data)
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_check_invalid(benchmark, manifest, fail_fast):
+    """Collect the error records of a manifest with an invalid input type."""
+    invalid = copy.deepcopy(manifest)
+    for io in invalid["inputs"]:
+        io["type"] = "bogus"
+    records = benchmark(check, invalid, fail_fast)
+    assert records
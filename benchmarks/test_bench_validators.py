@@ -0,0 +1,25 @@
+"""Benchmark the cost of individual field validators."""
+
+from ict.metadata import Metadata
+from ict.semver import Version
+from ict.ui.objects import ConditionalStatement, UIKey
+
+
+def test_check_container(benchmark):
+    """Validate a container reference."""
+    benchmark(Metadata.check_container, "wipp/wipp-thresh-plugin:1.1.1")
+
+
+def test_check_conditional_statement(benchmark):
+    """Validate a conditional statement."""
+    benchmark(ConditionalStatement, "inputs.thresholdtype=='Manual'")
+
+
+def test_check_ui_key(benchmark):
+    """Validate a ui key."""
+    benchmark(UIKey, "inputs.thresholdtype")
+
+
+def test_semantic_version(benchmark):
+    """Validate a version string."""
+    benchmark(Version.semantic_version, "12.4.7-rc3")
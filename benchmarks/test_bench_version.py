@@ -0,0 +1,36 @@
+"""Benchmark Version comparisons."""
+
+import pytest
+from synthetic import synthetic_versions
+
+from ict.semver import Version
+
+N_VERSIONS = [100, 1000]
+
+
+@pytest.fixture(params=N_VERSIONS, ids=[f"n{n}" for n in N_VERSIONS])
+def versions(request) -> list[Version]:
+    """Shuffled Version objects."""
+    return [Version(ver) for ver in synthetic_versions(request.param)]
+
+
+def test_version_parse(benchmark):
+    """Validate a version string."""
+    benchmark(Version, "12.4.7-rc3")
+
+
+def test_version_lt(benchmark):
+    """Compare two versions."""
+    left, right = Version("1.10.3"), Version("1.10.4")
+    benchmark(left.__lt__, right)
+
+
+def test_version_eq(benchmark):
+    """Compare two versions for equality."""
+    left, right = Version("1.10.3"), Version("1.10.3")
+    benchmark(left.__eq__, right)
+
+
+def test_version_sorted(benchmark, versions):
+    """Sort a list of versions."""
+    benchmark(sorted, versions)
@@ -0,0 +1,59 @@
+"""Benchmark conversion of WIPP manifests to ICT."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from synthetic import synthetic_wipp_manifest
+
+from ict import ICT
+from ict.wipp_utils import WIPPPlugin, convert_wipp_many, convert_wipp_ui_list
+
+SIZES = [10, 100]
+
+
+@pytest.fixture(params=SIZES, ids=[f"n{size}" for size in SIZES])
+def wipp_file(request, tmp_path):
+    """Synthetic WIPP manifest written as JSON."""
+    path = tmp_path.joinpath("plugin.json")
+    path.write_text(json.dumps(synthetic_wipp_manifest(request.param)))
+    return path
+
+
+def test_from_wipp(benchmark, wipp_file):
+    """Convert a WIPP manifest file to ICT."""
+    benchmark(ICT.from_wipp, wipp_file)
+
+
+def test_from_wipp_polus(benchmark, wipp_file):
+    """Load a WIPP manifest with polus.plugins, then convert it to ICT."""
+    pytest.importorskip("polus.plugins")
+    from polus.plugins._plugins.classes import _load_plugin  # type: ignore
+
+    benchmark(lambda: ICT.from_wipp(_load_plugin(wipp_file)))
+
+
+@pytest.mark.parametrize("module", ["ict.wipp_utils", "polus.plugins"])
+def test_import_time(benchmark, module):
+    """Import a WIPP manifest parser in a fresh interpreter."""
+    pytest.importorskip(module)
+    benchmark.pedantic(
+        subprocess.run,
+        ([sys.executable, "-c", f"import {module}"],),
+        {"check": True},
+        rounds=5,
+    )
+
+
+def test_convert_wipp_many(benchmark, wipp_file, tmp_path):
+    """Convert a batch of 50 WIPP manifests to ICT YAML files."""
+    paths = [wipp_file] * 50
+    benchmark.pedantic(convert_wipp_many, (paths, tmp_path.joinpath("out")), rounds=3)
+
+
+@pytest.mark.parametrize("n_inputs", [100, 1000])
+def test_convert_wipp_ui_list(benchmark, n_inputs):
+    """Convert the UI of a WIPP plugin."""
+    wipp = WIPPPlugin(**synthetic_wipp_manifest(n_inputs))
+    benchmark(convert_wipp_ui_list, wipp.ui, wipp.inputs)
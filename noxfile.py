@@ -11,6 +11,23 @@ def export_json(session: Session) -> None:
     session.run("python", "jsonschema.py")
 
 
+@session(python=["3.10"])
+def benchmark(session: Session) -> None:
+    """Run the benchmark suite and compare it with the saved baseline.
+
+    Extra arguments are passed to pytest, e.g.
+    `nox -s benchmark -- --benchmark-save=baseline` to store a baseline.
+    """
+    session.install(".")
+    session.install("pytest", "pytest-benchmark")
+
+    args = session.posargs or [
+        "--benchmark-compare",
+        "--benchmark-compare-fail=mean:15%",
+    ]
+    session.run("pytest", "benchmarks", *args)
+
+
 # from polusai.microjson
 @session(python=["3.10"])
 def typescript(session: Session):
@@ -1,15 +1,34 @@
 """ICT Python API."""
 
-from pathlib import Path
-
+from ict._version import __version__
+from ict.cache import ValidationCache
 from ict.model import ICT
-from ict.validate import validate
+from ict.trusted import dumps_trusted, loads_trusted
+from ict.validate import (
+    ErrorRecord,
+    ValidationFailure,
+    ValidationResult,
+    check,
+    find_manifests,
+    iter_validate,
+    validate,
+    validate_many,
+)
 
-with Path(__file__).with_name("VERSION").open(
-    "r",
-    encoding="utf-8",
-) as version_file:
-    VERSION = version_file.read().strip()
+VERSION = __version__
 
-__all__ = ["ICT", "validate", "VERSION"]
-__version__ = VERSION
+__all__ = [
+    "ICT",
+    "ValidationCache",
+    "validate",
+    "iter_validate",
+    "validate_many",
+    "find_manifests",
+    "check",
+    "ErrorRecord",
+    "ValidationFailure",
+    "ValidationResult",
+    "dumps_trusted",
+    "loads_trusted",
+    "VERSION",
+]
@@ -0,0 +1,195 @@
+"""Build ICT objects from trusted data without running validators.
+
+The input is the JSON-compatible dict produced by
+`ICT.model_dump(mode="json", by_alias=True)` for an ICT that was
+already validated. Every nested object is created with
+`model_construct`, so the caller is responsible for the data being
+valid.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from pydantic import AnyHttpUrl, BaseModel
+
+from ict.hardware import CPU, GPU, HardwareRequirements, Memory
+from ict.io import IO
+from ict.io.objects import TypesEnum as IOTypesEnum
+from ict.metadata.objects import DOI, Author
+from ict.model import ICT
+from ict.semver import Version
+from ict.ui.objects import (
+    ConditionalStatement,
+    UICheckbox,
+    UIColor,
+    UIDatetime,
+    UIFile,
+    UIKey,
+    UIMultiselect,
+    UINumber,
+    UIPath,
+    UISelect,
+    UIText,
+    W3Format,
+)
+
+UI_MODELS: dict[str, type[BaseModel]] = {
+    "text": UIText,
+    "number": UINumber,
+    "checkbox": UICheckbox,
+    "select": UISelect,
+    "multiselect": UIMultiselect,
+    "color": UIColor,
+    "datetime": UIDatetime,
+    "path": UIPath,
+    "file": UIFile,
+}
+# for each UI type, the (alias, field name) pairs that differ
+_UI_ALIASES: dict[str, tuple[tuple[str, str], ...]] = {
+    type_: tuple(
+        (field.alias, name)
+        for name, field in model.model_fields.items()
+        if field.alias is not None and field.alias != name
+    )
+    for type_, model in UI_MODELS.items()
+}
+
+
+_object_setattr = object.__setattr__
+
+
+@lru_cache(maxsize=None)
+def _template(model: type[BaseModel]) -> dict[str, Any]:
+    """Return the fields of `model` in order, with their default values."""
+    return {
+        name: None if field.is_required() else field.default
+        for name, field in model.model_fields.items()
+    }
+
+
+def _construct(model: type[BaseModel], values: dict[str, Any]) -> Any:
+    """Create a `model` instance from field values, without validation.
+
+    Equivalent to `model.model_construct(**values)` with the fields set
+    to None left unset, but several times faster since the field names
+    are already known.
+    """
+    fields = _template(model).copy()
+    fields.update(values)
+    obj = model.__new__(model)
+    _object_setattr(obj, "__dict__", fields)
+    _object_setattr(
+        obj,
+        "__pydantic_fields_set__",
+        {name for name, value in values.items() if value is not None},
+    )
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _root(model: type[BaseModel], value: Any) -> Any:
+    """Create a RootModel instance without validation."""
+    obj = model.__new__(model)
+    _object_setattr(obj, "__dict__", {"root": value})
+    _object_setattr(obj, "__pydantic_fields_set__", {"root"})
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _url(value: Optional[str]) -> Optional[AnyHttpUrl]:
+    """Return a Url object from its str form."""
+    return None if value is None else AnyHttpUrl(value)
+
+
+def construct_io(data: dict) -> IO:
+    """Construct an IO object."""
+    return _construct(
+        IO,
+        {
+            "name": data["name"],
+            "io_type": IOTypesEnum(data["type"]),
+            "description": data.get("description"),
+            "required": data["required"],
+            "io_format": data["format"],
+        },
+    )
+
+
+def construct_ui(data: dict) -> Any:
+    """Construct the UI item matching the `type` of `data`."""
+    type_ = data["type"]
+    values = dict(data)
+    for alias, name in _UI_ALIASES[type_]:
+        if alias in values:
+            values[name] = values.pop(alias)
+    values["key"] = _root(UIKey, values["key"])
+    if values.get("condition") is not None:
+        values["condition"] = _root(ConditionalStatement, values["condition"])
+    if values.get("number_range") is not None:
+        values["number_range"] = tuple(values["number_range"])
+    if "w3_format" in values:
+        values["w3_format"] = W3Format(values["w3_format"])
+    return _construct(UI_MODELS[type_], values)
+
+
+def construct_hardware(data: dict) -> HardwareRequirements:
+    """Construct a HardwareRequirements object."""
+    cpu, memory, gpu = data.get("cpu"), data.get("memory"), data.get("gpu")
+    if cpu is not None:
+        cpu = _construct(
+            CPU,
+            {
+                "cpu_type": cpu.get("type"),
+                "cpu_min": cpu.get("min"),
+                "cpu_recommended": cpu.get("recommended"),
+            },
+        )
+    if memory is not None:
+        memory = _construct(
+            Memory,
+            {
+                "memory_min": memory.get("min"),
+                "memory_recommended": memory.get("recommended"),
+            },
+        )
+    if gpu is not None:
+        gpu = _construct(
+            GPU,
+            {
+                "gpu_enabled": gpu.get("enabled"),
+                "gpu_required": gpu.get("required"),
+                "gpu_type": gpu.get("type"),
+            },
+        )
+    return _construct(HardwareRequirements, {"cpu": cpu, "memory": memory, "gpu": gpu})
+
+
+def construct_ict(data: dict) -> ICT:
+    """Construct an ICT object and all its nested objects."""
+    contact = data["contact"]
+    citation = data.get("citation")
+    hardware = data.get("hardware")
+    return _construct(
+        ICT,
+        {
+            "specVersion": _root(Version, data["specVersion"]),
+            "name": data["name"],
+            "version": _root(Version, data["version"]),
+            "container": data["container"],
+            "entrypoint": data["entrypoint"],
+            "title": data.get("title") or data["name"],
+            "description": data.get("description"),
+            "author": [_root(Author, author) for author in data["author"]],
+            # the union validator keeps emails as str and parses anything else as url
+            "contact": _url(contact) if "://" in contact else contact,
+            "repository": _url(data["repository"]),
+            "documentation": _url(data.get("documentation")),
+            "citation": None if citation is None else _root(DOI, citation),
+            "inputs": [construct_io(io) for io in data["inputs"]],
+            "outputs": [construct_io(io) for io in data["outputs"]],
+            "ui": [construct_ui(ui) for ui in data["ui"]],
+            "hardware": None if hardware is None else construct_hardware(hardware),
+        },
+    )
@@ -0,0 +1,82 @@
+"""Flat rows of ICT objects, shared by the SQLite registry and the Parquet export."""
+
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from ict.hardware import HardwareRequirements
+
+# columns of `hardware_row`, in order
+HARDWARE_COLUMNS = (
+    "has_cpu",
+    "cpu_type",
+    "cpu_min",
+    "cpu_recommended",
+    "has_memory",
+    "memory_min",
+    "memory_recommended",
+    "has_gpu",
+    "gpu_enabled",
+    "gpu_required",
+    "gpu_type",
+)
+
+
+def optional_str(value: Any) -> Optional[str]:
+    """Return str(value), keeping None."""
+    return None if value is None else str(value)
+
+
+def _optional_bool(value: Any) -> Optional[bool]:
+    """Return bool(value), keeping None."""
+    return None if value is None else bool(value)
+
+
+def hardware_row(hardware: HardwareRequirements) -> tuple:
+    """Return the requirements as a row of `HARDWARE_COLUMNS`.
+
+    The `has_*` columns tell a missing section from a section whose
+    fields are all None.
+    """
+    cpu, memory, gpu = hardware.cpu, hardware.memory, hardware.gpu
+    return (
+        cpu is not None,
+        cpu and cpu.cpu_type,
+        cpu and cpu.cpu_min,
+        cpu and cpu.cpu_recommended,
+        memory is not None,
+        memory and memory.memory_min,
+        memory and memory.memory_recommended,
+        gpu is not None,
+        gpu and gpu.gpu_enabled,
+        gpu and gpu.gpu_required,
+        gpu and gpu.gpu_type,
+    )
+
+
+def hardware_data(row: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the requirements, as dumped by alias, from a row of `HARDWARE_COLUMNS`.
+
+    Booleans may be stored as integers, e.g. by SQLite.
+    """
+    return {
+        "cpu": {
+            "type": row["cpu_type"],
+            "min": row["cpu_min"],
+            "recommended": row["cpu_recommended"],
+        }
+        if row["has_cpu"]
+        else None,
+        "memory": {
+            "min": row["memory_min"],
+            "recommended": row["memory_recommended"],
+        }
+        if row["has_memory"]
+        else None,
+        "gpu": {
+            "enabled": _optional_bool(row["gpu_enabled"]),
+            "required": _optional_bool(row["gpu_required"]),
+            "type": row["gpu_type"],
+        }
+        if row["has_gpu"]
+        else None,
+    }
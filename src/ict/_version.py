@@ -0,0 +1,6 @@
+"""Version of the ict package, read once from the VERSION file."""
+
+from pathlib import Path
+
+with Path(__file__).with_name("VERSION").open("r", encoding="utf-8") as _file:
+    __version__ = _file.read().strip()
@@ -0,0 +1,48 @@
+"""YAML loading and dumping.
+
+All YAML I/O of the package goes through this module, which uses the
+libyaml based `CSafeLoader`/`CSafeDumper` when PyYAML was built with
+libyaml and falls back to the pure Python implementations otherwise.
+"""
+
+from typing import IO, Any, Iterator, Optional, Union
+
+import yaml  # type: ignore
+
+try:
+    from yaml import CDumper as Dumper  # type: ignore
+    from yaml import CSafeDumper as SafeDumper  # type: ignore
+    from yaml import CSafeLoader as SafeLoader  # type: ignore
+
+    LIBYAML = True
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import Dumper, SafeDumper, SafeLoader  # type: ignore
+
+    LIBYAML = False
+
+YAMLError = yaml.YAMLError
+Stream = Union[str, bytes, IO]
+
+
+def safe_load(stream: Stream) -> Any:
+    """Parse a single YAML document."""
+    return yaml.load(stream, Loader=SafeLoader)  # nosec B506
+
+
+def safe_load_all(stream: Stream) -> Iterator[Any]:
+    """Parse every YAML document in a stream, one at a time."""
+    return yaml.load_all(stream, Loader=SafeLoader)  # nosec B506
+
+
+def safe_dump(data: Any, stream: Optional[IO] = None, **kwargs) -> Optional[str]:
+    """Serialize `data` as YAML, returning a str if no stream is given."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def dump(data: Any, stream: Optional[IO] = None, **kwargs) -> Optional[str]:
+    """Serialize `data` as YAML, allowing arbitrary Python objects.
+
+    Same output as `yaml.dump`, used where the data may hold objects
+    that `safe_dump` refuses to represent.
+    """
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
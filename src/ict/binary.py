@@ -0,0 +1,176 @@
+"""Compact binary serialization of ICT objects.
+
+An ICT is encoded as a msgpack array whose layout follows the ICT
+schema: fields are stored by position instead of by name, and the IO
+and UI types are stored as small integers. The payload is prefixed by a
+header made of a magic number, the format version and a SHA-256 digest
+of the payload. The digest detects accidental corruption, not tampering:
+anyone can recompute it over modified data.
+
+Requires the optional `msgpack` dependency (`pip install ict[binary]`).
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from ict._construct import construct_ict
+from ict.io.objects import TypesEnum as IOTypesEnum
+from ict.model import ICT
+from ict.ui.objects import TypesEnum as UITypesEnum
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+MAGIC = b"ICTB"
+FORMAT_VERSION = 1
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_HEADER_SIZE = len(MAGIC) + 1 + _DIGEST_SIZE
+
+IO_TYPES = [type_.value for type_ in IOTypesEnum]
+UI_TYPES = [type_.value for type_ in UITypesEnum]
+_IO_CODES = {type_: code for code, type_ in enumerate(IO_TYPES)}
+_UI_CODES = {type_: code for code, type_ in enumerate(UI_TYPES)}
+_UI_COMMON = ("type", "key", "title", "description", "customType", "condition")
+_METADATA = (
+    "specVersion",
+    "name",
+    "version",
+    "container",
+    "entrypoint",
+    "title",
+    "description",
+    "author",
+    "contact",
+    "repository",
+    "documentation",
+    "citation",
+)
+_HARDWARE = {
+    "cpu": ("type", "min", "recommended"),
+    "memory": ("min", "recommended"),
+    "gpu": ("enabled", "required", "type"),
+}
+
+
+def _require_msgpack() -> None:
+    """Raise ImportError if msgpack is not installed."""
+    if msgpack is None:
+        raise ImportError(
+            "Binary serialization requires msgpack, install it with "
+            "`pip install ict[binary]`"
+        )
+
+
+def _encode_io(io: dict) -> list:
+    """Encode a dumped IO object."""
+    return [
+        io["name"],
+        _IO_CODES[io["type"]],
+        io.get("description"),
+        io["required"],
+        io["format"],
+    ]
+
+
+def _decode_io(io: list) -> dict:
+    """Decode an IO object into its dumped form."""
+    name, type_, description, required, format_ = io
+    return {
+        "name": name,
+        "type": IO_TYPES[type_],
+        "description": description,
+        "required": required,
+        "format": format_,
+    }
+
+
+def _encode_ui(ui: dict) -> list:
+    """Encode a dumped UI item, fields specific to its type go in a dict."""
+    common = [ui.get(key) for key in _UI_COMMON]
+    common[0] = _UI_CODES[common[0]]
+    extra = {key: value for key, value in ui.items() if key not in _UI_COMMON}
+    return [*common, extra]
+
+
+def _decode_ui(ui: list) -> dict:
+    """Decode a UI item into its dumped form."""
+    data = dict(zip(_UI_COMMON, ui))
+    data["type"] = UI_TYPES[data["type"]]
+    data = {key: value for key, value in data.items() if value is not None}
+    data.update(ui[-1])
+    return data
+
+
+def _encode_hardware(hardware: Optional[dict]) -> Optional[list]:
+    """Encode dumped hardware requirements."""
+    if hardware is None:
+        return None
+    return [
+        None
+        if hardware.get(section) is None
+        else [hardware[section].get(key) for key in keys]
+        for section, keys in _HARDWARE.items()
+    ]
+
+
+def _decode_hardware(hardware: Optional[list]) -> Optional[dict]:
+    """Decode hardware requirements into their dumped form."""
+    if hardware is None:
+        return None
+    return {
+        section: None if values is None else dict(zip(keys, values))
+        for (section, keys), values in zip(_HARDWARE.items(), hardware)
+    }
+
+
+def dumps(ict_: ICT) -> bytes:
+    """Serialize an ICT to bytes."""
+    _require_msgpack()
+    data = ict_.model_dump(mode="json", by_alias=True)
+    body = [data[key] for key in _METADATA]
+    body.append([_encode_io(io) for io in data["inputs"]])
+    body.append([_encode_io(io) for io in data["outputs"]])
+    body.append([_encode_ui(ui) for ui in data["ui"]])
+    body.append(_encode_hardware(data.get("hardware")))
+    payload = msgpack.packb(body, use_bin_type=True)
+    return MAGIC + bytes([FORMAT_VERSION]) + hashlib.sha256(payload).digest() + payload
+
+
+def _unpack(data: bytes) -> dict:
+    """Check the header and decode the payload into a dumped ICT."""
+    _require_msgpack()
+    if len(data) < _HEADER_SIZE:
+        raise ValueError("Truncated binary ICT: incomplete header")
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a binary ICT: bad magic number")
+    if data[len(MAGIC)] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary ICT format version: {data[len(MAGIC)]}")
+    payload = data[_HEADER_SIZE:]
+    if hashlib.sha256(payload).digest() != data[len(MAGIC) + 1 : _HEADER_SIZE]:
+        raise ValueError("Corrupted binary ICT: digest mismatch")
+    body = msgpack.unpackb(payload, raw=False)
+    ict_: dict[str, Any] = dict(zip(_METADATA, body))
+    inputs, outputs, ui, hardware = body[len(_METADATA) :]
+    ict_["inputs"] = [_decode_io(io) for io in inputs]
+    ict_["outputs"] = [_decode_io(io) for io in outputs]
+    ict_["ui"] = [_decode_ui(item) for item in ui]
+    ict_["hardware"] = _decode_hardware(hardware)
+    return ict_
+
+
+def loads(data: bytes, trusted: bool = False) -> ICT:
+    """Deserialize an ICT from bytes produced by `dumps`.
+
+    Args:
+        data: serialized ICT.
+        trusted: skip validation and build the ICT directly. Only use it
+            for bytes produced by `dumps` from a validated ICT and read
+            from storage only you can write to. The digest is checked in
+            both cases, but it only detects corruption, not tampering.
+    """
+    ict_ = _unpack(data)
+    if trusted:
+        return construct_ict(ict_)
+    return ICT(**ict_)
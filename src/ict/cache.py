@@ -0,0 +1,190 @@
+"""Persistent cache of ICT validation results."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, TypeVar
+
+import pydantic
+
+from ict._construct import construct_ict
+from ict._version import __version__
+
+StrPath = TypeVar("StrPath", str, Path)
+
+# bump when the layout of cached entries changes
+CACHE_FORMAT = "2"
+
+_SALT = f"ict={__version__};pydantic={pydantic.VERSION};cache={CACHE_FORMAT}"
+
+
+class CachedValidationError(ValueError):
+    """Validation error of a manifest validated with a `ValidationCache`.
+
+    It is raised both when the manifest is first found invalid, chained to
+    the original exception, and when the error is replayed from the cache,
+    so the same manifest always raises the same exception type.
+
+    Attributes:
+        error_type: name of the original exception, e.g. `ValidationError`.
+        details: per-field errors reported by pydantic, if any.
+        records: error records as dicts, see `ict.validate.ErrorRecord`.
+    """
+
+    def __init__(
+        self,
+        error_type: str,
+        message: str,
+        details: list[dict],
+        records: Optional[list[dict]] = None,
+    ):
+        super().__init__(message)
+        self.error_type = error_type
+        self.details = details
+        self.records = records
+
+
+class ValidationCache:
+    """On-disk LRU cache of validation results keyed by manifest content.
+
+    Entries are stored in a SQLite database, which makes the cache safe
+    to share between concurrent processes. The key of an entry is a hash
+    of the raw manifest bytes, the file suffix, and the versions of this
+    library and pydantic, so upgrading either invalidates old entries.
+
+    Args:
+        path: path of the SQLite database, created if missing.
+        max_entries: maximum number of entries kept, the least recently
+            used entries are evicted first.
+    """
+
+    def __init__(self, path: StrPath, max_entries: int = 10_000):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __getstate__(self) -> dict:
+        """Drop the connection when pickled (e.g. sent to a worker process)."""
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        return state
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, ict TEXT, error TEXT, last_used REAL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used)"
+            )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def key(raw: bytes, suffix: str) -> str:
+        """Return the cache key of a manifest."""
+        hash_ = hashlib.sha256(_SALT.encode("utf-8"))
+        hash_.update(suffix.encode("utf-8"))
+        hash_.update(b"\0")
+        hash_.update(raw)
+        return hash_.hexdigest()
+
+    def get(self, key: str):
+        """Return the cached ICT for `key`, or None if missing.
+
+        Raises `CachedValidationError` if the cached result is an error.
+        """
+        row = self._connection.execute(
+            "SELECT ict, error FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._connection.execute(
+            "UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        ict_, error = row
+        if error is not None:
+            error_ = json.loads(error)
+            raise CachedValidationError(
+                error_["error_type"],
+                error_["message"],
+                error_["details"],
+                error_.get("records"),
+            )
+        # entries hold the JSON dump of an ICT that passed validation
+        return construct_ict(json.loads(ict_))
+
+    def put(self, key: str, ict_) -> None:
+        """Cache a validated ICT."""
+        self._put(key, ict_.model_dump_json(by_alias=True), None)
+
+    def put_error(
+        self,
+        key: str,
+        error_type: str,
+        message: str,
+        details: list[dict],
+        records: Optional[list[dict]] = None,
+    ):
+        """Cache a validation error."""
+        error = {
+            "error_type": error_type,
+            "message": message,
+            "details": details,
+            "records": records,
+        }
+        self._put(key, None, json.dumps(error, default=str))
+
+    def _put(self, key: str, ict_: Optional[str], error: Optional[str]) -> None:
+        """Insert an entry and evict the least recently used ones."""
+        conn = self._connection
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, ict_, error, time.time()),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN ("
+                    "SELECT key FROM entries ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self._connection.execute("DELETE FROM entries")
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters of this cache object and its size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
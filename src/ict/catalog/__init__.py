@@ -0,0 +1,6 @@
+"""Collections of ICT objects."""
+
+from .catalog import ICTCatalog
+from .versions import VersionIndex
+
+__all__ = ["ICTCatalog", "VersionIndex"]
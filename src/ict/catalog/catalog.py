@@ -0,0 +1,236 @@
+"""In-memory catalog of ICT objects with secondary indexes."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from typing import Optional, Union
+
+from ict.model import ICT
+from ict.semver import Version
+
+from .versions import Constraint, VersionIndex
+
+ToolKey = tuple[str, tuple]  # (name, version sort key)
+DIRECTIONS = ("inputs", "outputs")
+
+
+def _tool_key(name: str, version: Union[Version, str]) -> ToolKey:
+    """Return the key of a name and version.
+
+    Versions are compared by precedence, as in `VersionIndex`, so that
+    equal versions written differently (`1.0.0-01`, `1.0.0-1`) share a key.
+    """
+    if not isinstance(version, Version):
+        version = Version(version)
+    return (name, version.sort_key)
+
+
+def _key(ict_: ICT) -> ToolKey:
+    """Return the key identifying an ICT in a catalog."""
+    return _tool_key(ict_.name, ict_.version)
+
+
+def _format_terms(io_format: Union[list[str], dict]) -> list[str]:
+    """Return the ontology terms of an IO format."""
+    if isinstance(io_format, dict):
+        term = io_format.get("term")
+        return [term] if isinstance(term, str) else []
+    return list(io_format)
+
+
+class ICTCatalog:
+    """Collection of ICT objects with indexes for common queries.
+
+    Indexes are updated incrementally by `add` and `remove`:
+
+    - name -> versions (`VersionIndex`)
+    - container -> ICTs
+    - author -> ICTs
+    - IO format term -> ICTs
+    - IO type, per direction and for either direction -> ICTs
+    - GPU required -> ICTs
+    - minimum CPU, kept sorted for "fits in N cores" queries
+
+    ICTs are identified by (name, version), adding an ICT with the same
+    name and an equal version replaces the previous one.
+    """
+
+    def __init__(self, icts: Iterable[ICT] = ()):
+        self._tools: dict[ToolKey, ICT] = {}
+        self._versions = VersionIndex()
+        self._by_container: dict[str, set[ToolKey]] = {}
+        self._by_author: dict[str, set[ToolKey]] = {}
+        self._by_format: dict[str, set[ToolKey]] = {}
+        # (direction, type), direction is None for either
+        self._by_io_type: dict[tuple[Optional[str], str], set[ToolKey]] = {}
+        self._gpu_required: set[ToolKey] = set()
+        self._cpu_min: dict[ToolKey, int] = {}
+        self._cpu_sorted: list[tuple[int, ToolKey]] = []
+        for ict_ in icts:
+            self.add(ict_)
+
+    def _entries(self, ict_: ICT) -> Iterator[tuple[dict, object]]:
+        """Yield the (index, value) pairs under which an ICT is indexed."""
+        yield self._by_container, ict_.container
+        for author in ict_.author:
+            yield self._by_author, str(author)
+        for direction in DIRECTIONS:
+            for io in getattr(ict_, direction):
+                yield self._by_io_type, (direction, io.io_type.value)
+                yield self._by_io_type, (None, io.io_type.value)
+                for term in _format_terms(io.io_format):
+                    yield self._by_format, term
+
+    def add(self, ict_: ICT) -> None:
+        """Add an ICT and index it.
+
+        Raises: ValueError if a CPU or memory quantity of the ICT is not
+            valid, the catalog is then left unchanged.
+        """
+        hardware = ict_.hardware
+        try:
+            cpu = (hardware and hardware.quantities()["cpu_min"]) or 0
+        except ValueError as exc:
+            raise ValueError(f"{ict_.name} {ict_.version}: {exc}") from exc
+        key = _key(ict_)
+        if key in self._tools:
+            self.remove(ict_.name, ict_.version)
+        self._tools[key] = ict_
+        self._versions.add(ict_)
+        for index, value in self._entries(ict_):
+            index.setdefault(value, set()).add(key)
+        if hardware and hardware.gpu and hardware.gpu.gpu_required:
+            self._gpu_required.add(key)
+        self._cpu_min[key] = cpu
+        insort(self._cpu_sorted, (cpu, key))
+
+    def remove(self, name: str, version: Union[Version, str]) -> ICT:
+        """Remove an ICT and its index entries, raise KeyError if missing."""
+        key = _tool_key(name, version)
+        ict_ = self._tools.pop(key)
+        self._versions.remove(name, version)
+        for index, value in self._entries(ict_):
+            keys = index.get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+        self._gpu_required.discard(key)
+        cpu = self._cpu_min.pop(key)
+        i = bisect_right(self._cpu_sorted, (cpu, key)) - 1
+        del self._cpu_sorted[i]
+        return ict_
+
+    def get(self, name: str, version: Union[Version, str]) -> Optional[ICT]:
+        """Return the ICT with the given name and version, if any."""
+        return self._tools.get(_tool_key(name, version))
+
+    def latest(
+        self, name: str, constraint: Constraint = None, prerelease: bool = False
+    ) -> Optional[ICT]:
+        """Return the newest version of `name` satisfying `constraint`, if any."""
+        return self._versions.latest(name, constraint, prerelease)
+
+    def versions(self, name: str) -> list[Version]:
+        """Return every version of `name`, in ascending order."""
+        return self._versions.versions(name)
+
+    def by_container(self, container: str) -> list[ICT]:
+        """Return the ICTs using a container image."""
+        return self._lookup(self._by_container.get(container, ()))
+
+    def by_author(self, author: str) -> list[ICT]:
+        """Return the ICTs of an author."""
+        return self._lookup(self._by_author.get(author, ()))
+
+    def by_format(self, term: str) -> list[ICT]:
+        """Return the ICTs with an input or output of the given format term."""
+        return self._lookup(self._by_format.get(term, ()))
+
+    def by_io_type(self, io_type: str, direction: Optional[str] = None) -> list[ICT]:
+        """Return the ICTs with an input and/or output of the given type."""
+        return self._lookup(self._by_io_type.get((direction, io_type), ()))
+
+    def gpu_required(self) -> list[ICT]:
+        """Return the ICTs that require a GPU."""
+        return self._lookup(self._gpu_required)
+
+    def fits_cpu(self, cores: float) -> list[ICT]:
+        """Return the ICTs whose minimum CPU is at most `cores`."""
+        # (limit + 1,) sorts after every (limit, key) entry
+        i = bisect_left(self._cpu_sorted, (int(cores * 1000) + 1,))
+        return [self._tools[key] for _, key in self._cpu_sorted[:i]]
+
+    def _lookup(self, keys: Iterable[ToolKey]) -> list[ICT]:
+        """Return the ICTs of a set of keys."""
+        return [self._tools[key] for key in keys]
+
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        name: Optional[str] = None,
+        constraint: Constraint = None,
+        prerelease: bool = False,
+        container: Optional[str] = None,
+        author: Optional[str] = None,
+        io_format: Optional[str] = None,
+        io_type: Optional[str] = None,
+        direction: Optional[str] = None,
+        gpu_required: Optional[bool] = None,
+        max_cpu: Optional[float] = None,
+    ) -> list[ICT]:
+        """Return the ICTs matching every given filter.
+
+        Args:
+            name: ICT name, optionally restricted by `constraint`.
+            constraint: version constraint, e.g. `">=1.1.0,<2.0.0"`.
+            prerelease: include prerelease versions of `name`.
+            container: container image.
+            author: author name.
+            io_format: format term of an input or output.
+            io_type: type of an input or output, restricted to one
+                `direction` (`"inputs"` or `"outputs"`) if given.
+            gpu_required: whether the ICT requires a GPU.
+            max_cpu: maximum number of cores available.
+        """
+        candidates: list[set[ToolKey]] = []
+        if name is not None:
+            selected = self._versions.select(name, constraint, prerelease)
+            candidates.append({_key(ict_) for ict_ in selected})
+        if container is not None:
+            candidates.append(self._by_container.get(container, set()))
+        if author is not None:
+            candidates.append(self._by_author.get(author, set()))
+        if io_format is not None:
+            candidates.append(self._by_format.get(io_format, set()))
+        if io_type is not None:
+            candidates.append(self._by_io_type.get((direction, io_type), set()))
+        if gpu_required:
+            candidates.append(self._gpu_required)
+
+        if candidates:
+            # check membership against the larger sets
+            candidates.sort(key=len)
+            keys: Iterable[ToolKey] = (
+                key
+                for key in candidates[0]
+                if all(key in other for other in candidates[1:])
+            )
+        else:
+            keys = self._tools
+        if gpu_required is False:
+            keys = (key for key in keys if key not in self._gpu_required)
+        if max_cpu is not None:
+            limit = int(max_cpu * 1000)
+            keys = (key for key in keys if self._cpu_min[key] <= limit)
+        return self._lookup(keys)
+
+    def __iter__(self) -> Iterator[ICT]:
+        """Iterate over every ICT in the catalog."""
+        return iter(self._tools.values())
+
+    def __contains__(self, ict_: ICT) -> bool:
+        """Return True if an ICT with the same name and version is in the catalog."""
+        return _key(ict_) in self._tools
+
+    def __len__(self) -> int:
+        """Return the number of ICTs in the catalog."""
+        return len(self._tools)
@@ -0,0 +1,143 @@
+"""Index of ICT objects by name and version."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Optional, Union
+
+from ict.model import ICT
+from ict.semver import Version, VersionConstraint
+
+Constraint = Union[VersionConstraint, str, None]
+
+
+@lru_cache(maxsize=1024)
+def _parse_constraint(constraint: str) -> VersionConstraint:
+    """Parse a constraint, reusing constraints seen recently."""
+    return VersionConstraint(constraint)
+
+
+def _constraint(constraint: Constraint) -> Optional[VersionConstraint]:
+    """Return a VersionConstraint from a str, if needed."""
+    if constraint is None or isinstance(constraint, VersionConstraint):
+        return constraint
+    return _parse_constraint(constraint)
+
+
+class VersionIndex:
+    """ICT objects grouped by name and kept sorted by version.
+
+    Lookups by constraint use binary search over the sorted versions of
+    a name, so they take logarithmic time in the number of versions.
+    """
+
+    def __init__(self, icts: Iterable[ICT] = ()):
+        # for each name, sort keys and ICTs in ascending version order
+        self._keys: dict[str, list[tuple]] = {}
+        self._icts: dict[str, list[ICT]] = {}
+        for ict_ in icts:
+            self.add(ict_)
+
+    def add(self, ict_: ICT) -> None:
+        """Add an ICT, replacing any ICT with the same name and version."""
+        keys = self._keys.setdefault(ict_.name, [])
+        icts = self._icts.setdefault(ict_.name, [])
+        key = ict_.version.sort_key
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            icts[i] = ict_
+            return
+        keys.insert(i, key)
+        icts.insert(i, ict_)
+
+    def remove(self, name: str, version: Union[Version, str]) -> ICT:
+        """Remove and return an ICT, raise KeyError if missing."""
+        i = self._position(name, version)
+        if i is None:
+            raise KeyError(f"{name}=={version}")
+        del self._keys[name][i]
+        ict_ = self._icts[name].pop(i)
+        if not self._keys[name]:
+            del self._keys[name]
+            del self._icts[name]
+        return ict_
+
+    def _position(self, name: str, version: Union[Version, str]) -> Optional[int]:
+        """Return the position of a version of `name`, if present."""
+        keys = self._keys.get(name)
+        if not keys:
+            return None
+        if not isinstance(version, Version):
+            version = Version(version)
+        i = bisect_left(keys, version.sort_key)
+        if i < len(keys) and keys[i] == version.sort_key:
+            return i
+        return None
+
+    def get(self, name: str, version: Union[Version, str]) -> Optional[ICT]:
+        """Return the ICT with the given name and version, if any."""
+        i = self._position(name, version)
+        return None if i is None else self._icts[name][i]
+
+    def versions(self, name: str) -> list[Version]:
+        """Return every version of `name`, in ascending order."""
+        return [ict_.version for ict_ in self._icts.get(name, [])]
+
+    def _range(self, name: str, constraint: Optional[VersionConstraint]):
+        """Return the slice of versions of `name` within the constraint bounds."""
+        keys = self._keys.get(name, [])
+        lo, hi = 0, len(keys)
+        if constraint is None:
+            return lo, hi
+        lower, upper = constraint.lower, constraint.upper
+        if lower is not None:
+            bisect = bisect_left if lower.inclusive else bisect_right
+            lo = bisect(keys, lower.key)
+        if upper is not None:
+            bisect = bisect_right if upper.inclusive else bisect_left
+            hi = bisect(keys, upper.key)
+        return lo, hi
+
+    def select(
+        self, name: str, constraint: Constraint = None, prerelease: bool = False
+    ) -> Iterator[ICT]:
+        """Yield the ICTs of `name` satisfying `constraint`, newest first.
+
+        Args:
+            name: name of the ICT, e.g. `wipp/threshold`.
+            constraint: `VersionConstraint` or its string form, e.g.
+                `">=1.1.0,<2.0.0"`. Any version matches if omitted.
+            prerelease: also yield prerelease versions.
+        """
+        constraint_ = _constraint(constraint)
+        lo, hi = self._range(name, constraint_)
+        keys, icts = self._keys.get(name, []), self._icts.get(name, [])
+        excluded = constraint_.excluded if constraint_ is not None else ()
+        for i in range(hi - 1, lo - 1, -1):
+            key = keys[i]
+            if key in excluded or (not prerelease and key[3] == 0):
+                continue
+            yield icts[i]
+
+    def latest(
+        self, name: str, constraint: Constraint = None, prerelease: bool = False
+    ) -> Optional[ICT]:
+        """Return the newest ICT of `name` satisfying `constraint`, if any."""
+        return next(self.select(name, constraint, prerelease), None)
+
+    def names(self) -> list[str]:
+        """Return every indexed name."""
+        return list(self._keys)
+
+    def __iter__(self) -> Iterator[ICT]:
+        """Iterate over every indexed ICT."""
+        for icts in self._icts.values():
+            yield from icts
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if any version of `name` is indexed."""
+        return name in self._keys
+
+    def __len__(self) -> int:
+        """Return the number of indexed ICTs."""
+        return sum(len(keys) for keys in self._keys.values())
@@ -0,0 +1,215 @@
+"""Command line interface of the ict package."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from ict.export import export_cwl
+from ict.validate import find_manifests, validate_many
+from ict.watch import ManifestWatcher, WatchEvent
+from ict.wipp_utils import convert_wipp_many
+
+
+def _validate(args: argparse.Namespace) -> int:
+    """Run the `validate` command."""
+    paths = find_manifests(args.paths)
+    failed = 0
+    report = []
+    for result in validate_many(paths, workers=args.jobs, fail_fast=args.fail_fast):
+        if result.ok:
+            continue
+        failed += 1
+        records = result.error.records  # type: ignore
+        if args.json:
+            report.append(
+                {
+                    "source": result.source,
+                    "errors": [record.model_dump() for record in records],
+                }
+            )
+        for record in records:
+            message = record.message.splitlines()[0]
+            print(
+                f"{result.source}#{record.pointer}: {record.code}: {message}",
+                file=sys.stderr,
+            )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif args.fail_fast and failed:
+        print(f"stopped at the first invalid manifest of {len(paths)}")
+    else:
+        print(f"{failed} invalid of {len(paths)} manifests")
+    return 1 if failed else 0
+
+
+def _export_cwl(args: argparse.Namespace) -> int:
+    """Run the `export-cwl` command."""
+    summary = export_cwl(
+        args.src,
+        args.out,
+        jobs=args.jobs,
+        network_access=args.network_access,
+        force=args.force,
+    )
+    print(
+        f"{summary.exported} exported, {summary.unchanged} unchanged, "
+        f"{len(summary.failures)} failed in {summary.elapsed:.2f}s "
+        f"({summary.throughput:.1f} files/s)"
+    )
+    for result in summary.failures:
+        message = result.error.message.splitlines()[0]  # type: ignore
+        print(f"FAILED {result.source}: {message}", file=sys.stderr)
+    return 1 if summary.failures else 0
+
+
+def _convert_wipp(args: argparse.Namespace) -> int:
+    """Run the `convert-wipp` command."""
+    report = convert_wipp_many(args.manifests, args.out, workers=args.jobs)
+    if args.report is not None:
+        args.report.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+    stages = ", ".join(
+        f"{stage} {duration:.2f}s" for stage, duration in report.stage_totals.items()
+    )
+    print(
+        f"{report.converted} converted ({report.with_defaults} with defaults), "
+        f"{report.failed} failed in {report.elapsed:.2f}s [{stages}]"
+    )
+    for result in report.results:
+        if result.error is not None:
+            message = result.error.message.splitlines()[0]
+            print(f"FAILED {result.source}: {message}", file=sys.stderr)
+        elif result.defaults:
+            print(f"DEFAULTS {result.source}: {', '.join(result.defaults)}")
+    return 1 if report.failed else 0
+
+
+def _print_event(event: WatchEvent) -> None:
+    """Print the change of a watched manifest."""
+    line = f"{event.status.upper()} {event.source}"
+    if event.error is not None:
+        line += f": {event.error.message.splitlines()[0]}"
+    print(line, flush=True)
+
+
+def _watch(args: argparse.Namespace) -> int:
+    """Run the `watch` command."""
+    watcher = ManifestWatcher(args.root)
+    if args.once:
+        for event in watcher.scan():
+            _print_event(event)
+        return 1 if watcher.errors else 0
+    try:
+        for events in watcher.watch(args.interval):
+            for event in events:
+                _print_event(event)
+            print(
+                f"{watcher.valid} valid, {len(watcher.errors)} invalid",
+                flush=True,
+            )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the `ict` command."""
+    parser = argparse.ArgumentParser(prog="ict", description="ICT command line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser(
+        "validate",
+        help="validate manifests",
+        description="Validate manifests, and the .yaml, .yml and .json manifests "
+        "below directories, printing one line per problem with its JSON pointer.",
+    )
+    validate.add_argument(
+        "paths", type=Path, nargs="+", help="manifests or directories"
+    )
+    validate.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of worker processes"
+    )
+    validate.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop at the first invalid manifest",
+    )
+    validate.add_argument(
+        "--json", action="store_true", help="print the problems as JSON"
+    )
+    validate.set_defaults(func=_validate)
+
+    export = commands.add_parser(
+        "export-cwl",
+        help="export a directory of manifests as CWL CommandLineTools",
+        description="Validate every .yaml, .yml and .json manifest below SRC "
+        "and save it as a CommandLineTool below OUT. Sources unchanged since "
+        "the last export are skipped.",
+    )
+    export.add_argument("src", type=Path, help="directory of the manifests")
+    export.add_argument("out", type=Path, help="directory of the CommandLineTools")
+    export.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of worker processes"
+    )
+    export.add_argument(
+        "--network-access",
+        action="store_true",
+        help="add the NetworkAccess requirement",
+    )
+    export.add_argument(
+        "--force", action="store_true", help="export unchanged sources too"
+    )
+    export.set_defaults(func=_export_cwl)
+
+    convert = commands.add_parser(
+        "convert-wipp",
+        help="convert WIPP plugin manifests to ICT",
+        description="Convert WIPP plugin manifests to ICT YAML files, reporting "
+        "the fields that were set to default values.",
+    )
+    convert.add_argument(
+        "manifests", type=Path, nargs="+", help="WIPP manifests (plugin.json)"
+    )
+    convert.add_argument(
+        "-o", "--out", type=Path, required=True, help="directory of the ICT files"
+    )
+    convert.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of worker processes"
+    )
+    convert.add_argument(
+        "--report", type=Path, default=None, help="write a JSON report to this file"
+    )
+    convert.set_defaults(func=_convert_wipp)
+
+    watch = commands.add_parser(
+        "watch",
+        help="re-validate manifests as they change",
+        description="Validate every .yaml, .yml and .json manifest below ROOT, "
+        "then poll for changes and re-validate only the changed manifests.",
+    )
+    watch.add_argument("root", type=Path, help="directory of the manifests")
+    watch.add_argument(
+        "-i",
+        "--interval",
+        type=float,
+        default=1.0,
+        help="seconds between two scans (default: 1)",
+    )
+    watch.add_argument(
+        "--once",
+        action="store_true",
+        help="scan once and exit, with status 1 if a manifest is invalid",
+    )
+    watch.set_defaults(func=_watch)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the `ict` command, return its exit status."""
+    args = _parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""Columnar export of ICT collections to Arrow tables and Parquet files.
+
+A collection is flattened into four tables linked by `tool_id`, the
+position of the ICT in the collection:
+
+- `metadata`: one row per ICT.
+- `io`: one row per input and output, in order.
+- `ui`: one row per UI item, with the item itself as JSON.
+- `hardware`: one row per ICT with hardware requirements. The CPU and
+  memory quantities are also parsed to millicores and bytes.
+
+The tables are built and written in batches of ICTs, so exporting a
+catalog only holds one batch in memory, and `ParquetCatalog` reads them
+back the same way.
+
+Requires the optional `pyarrow` dependency (`pip install ict[parquet]`).
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Optional, TypeVar
+
+from ict._construct import construct_ict
+from ict._rows import hardware_data, hardware_row, optional_str
+from ict.model import ICT
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None  # type: ignore
+
+StrPath = TypeVar("StrPath", str, Path)
+
+TABLES = ("metadata", "io", "ui", "hardware")
+# number of ICTs per record batch and Parquet row group
+BATCH_SIZE = 1024
+
+
+def _require_pyarrow() -> None:
+    """Raise ImportError if pyarrow is not installed."""
+    if pa is None:
+        raise ImportError(
+            "Columnar export requires pyarrow, install it with "
+            "`pip install ict[parquet]`"
+        )
+
+
+@lru_cache(maxsize=None)
+def _schemas() -> dict[str, "pa.Schema"]:
+    """Return the schema of each table."""
+    string, int64, boolean = pa.string(), pa.int64(), pa.bool_()
+    return {
+        "metadata": pa.schema(
+            [
+                ("tool_id", int64),
+                ("name", string),
+                ("version", string),
+                ("major", int64),
+                ("minor", int64),
+                ("patch", int64),
+                ("prerelease", string),
+                ("spec_version", string),
+                ("container", string),
+                ("entrypoint", string),
+                ("title", string),
+                ("description", string),
+                ("author", pa.list_(string)),
+                ("contact", string),
+                ("repository", string),
+                ("documentation", string),
+                ("citation", string),
+            ]
+        ),
+        "io": pa.schema(
+            [
+                ("tool_id", int64),
+                ("direction", string),
+                ("position", int64),
+                ("name", string),
+                ("type", string),
+                ("description", string),
+                ("required", boolean),
+                ("format", string),  # JSON, a list of terms or an ontology term
+            ]
+        ),
+        "ui": pa.schema(
+            [
+                ("tool_id", int64),
+                ("position", int64),
+                ("key", string),
+                ("type", string),
+                ("item", string),  # JSON
+            ]
+        ),
+        "hardware": pa.schema(
+            [
+                ("tool_id", int64),
+                ("has_cpu", boolean),
+                ("cpu_type", string),
+                ("cpu_min", string),
+                ("cpu_recommended", string),
+                ("has_memory", boolean),
+                ("memory_min", string),
+                ("memory_recommended", string),
+                ("has_gpu", boolean),
+                ("gpu_enabled", boolean),
+                ("gpu_required", boolean),
+                ("gpu_type", string),
+                ("cpu_min_millicores", int64),
+                ("cpu_recommended_millicores", int64),
+                ("memory_min_bytes", int64),
+                ("memory_recommended_bytes", int64),
+            ]
+        ),
+    }
+
+
+def _rows(tool_id: int, ict_: ICT) -> dict[str, list[tuple]]:
+    """Return the rows of an ICT in each table, columns in schema order."""
+    info = ict_.version.info
+    rows: dict[str, list[tuple]] = {
+        "metadata": [
+            (
+                tool_id,
+                ict_.name,
+                ict_.version.root,
+                info.major,
+                info.minor,
+                info.patch,
+                info.prerelease,
+                ict_.specVersion.root,
+                ict_.container,
+                str(ict_.entrypoint),
+                ict_.title,
+                ict_.description,
+                [str(author) for author in ict_.author],
+                str(ict_.contact),
+                str(ict_.repository),
+                optional_str(ict_.documentation),
+                optional_str(ict_.citation),
+            )
+        ],
+        "io": [
+            (
+                tool_id,
+                direction,
+                position,
+                io.name,
+                io.io_type.value,
+                io.description,
+                io.required,
+                json.dumps(io.io_format),
+            )
+            for direction in ("inputs", "outputs")
+            for position, io in enumerate(getattr(ict_, direction))
+        ],
+        "ui": [
+            (
+                tool_id,
+                position,
+                ui.key.root,
+                ui.ui_type,
+                json.dumps(
+                    ui.model_dump(mode="json", exclude_none=True, by_alias=True)
+                ),
+            )
+            for position, ui in enumerate(ict_.ui)
+        ],
+        "hardware": [],
+    }
+    hardware = ict_.hardware
+    if hardware is not None:
+        rows["hardware"].append(
+            (
+                tool_id,
+                *hardware_row(hardware),
+                hardware.cpu_min_millicores,
+                hardware.cpu_recommended_millicores,
+                hardware.memory_min_bytes,
+                hardware.memory_recommended_bytes,
+            )
+        )
+    return rows
+
+
+def _record_batches(rows: dict[str, list[tuple]]) -> dict[str, "pa.RecordBatch"]:
+    """Return the record batch of each table from its rows."""
+    batches = {}
+    for table, schema in _schemas().items():
+        columns = list(zip(*rows[table])) or [()] * len(schema)
+        batches[table] = pa.RecordBatch.from_arrays(
+            [
+                pa.array(column, type=field.type)
+                for column, field in zip(columns, schema)
+            ],
+            schema=schema,
+        )
+    return batches
+
+
+def iter_record_batches(
+    icts: Iterable[ICT], batch_size: int = BATCH_SIZE
+) -> Iterator[dict[str, "pa.RecordBatch"]]:
+    """Yield the record batch of each table for every `batch_size` ICTs."""
+    _require_pyarrow()
+    rows: dict[str, list[tuple]] = {table: [] for table in TABLES}
+    count = 0
+    for tool_id, ict_ in enumerate(icts):
+        for table, table_rows in _rows(tool_id, ict_).items():
+            rows[table].extend(table_rows)
+        count += 1
+        if count == batch_size:
+            yield _record_batches(rows)
+            rows = {table: [] for table in TABLES}
+            count = 0
+    if count:
+        yield _record_batches(rows)
+
+
+def to_arrow(
+    icts: Iterable[ICT], batch_size: int = BATCH_SIZE
+) -> dict[str, "pa.Table"]:
+    """Return the Arrow tables of a collection of ICTs, by table name."""
+    batches: dict[str, list] = {table: [] for table in TABLES}
+    for batch in iter_record_batches(icts, batch_size):
+        for table, record_batch in batch.items():
+            batches[table].append(record_batch)
+    schemas = _schemas()
+    return {
+        table: pa.Table.from_batches(batches[table], schema=schemas[table])
+        for table in TABLES
+    }
+
+
+def write_parquet(
+    icts: Iterable[ICT],
+    out: StrPath,
+    batch_size: int = BATCH_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """Write a collection of ICTs to one Parquet file per table.
+
+    ICTs are consumed and written `batch_size` at a time, each batch being
+    a row group of every file.
+
+    Args:
+        icts: the ICTs, e.g. a generator reading them from disk.
+        out: directory of the files, `<table>.parquet`, created if missing.
+        batch_size: number of ICTs per row group.
+        compression: Parquet compression codec.
+
+    Returns: the number of ICTs written.
+    """
+    _require_pyarrow()
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    writers = {
+        table: pq.ParquetWriter(
+            out.joinpath(f"{table}.parquet"), schema, compression=compression
+        )
+        for table, schema in _schemas().items()
+    }
+    count = 0
+    try:
+        for batch in iter_record_batches(icts, batch_size):
+            for table, record_batch in batch.items():
+                if record_batch.num_rows:
+                    writers[table].write_batch(record_batch)
+            count += batch["metadata"].num_rows
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return count
+
+
+class _Groups:
+    """Rows of a table sorted by tool_id, taken in increasing tool_id order."""
+
+    def __init__(self, rows: Iterable[dict]):
+        self._groups = groupby(rows, key=itemgetter("tool_id"))
+        self._next = next(self._groups, None)
+
+    def take(self, tool_id: int) -> list[dict]:
+        """Return the rows of `tool_id`, skipping the rows before them."""
+        while self._next is not None and self._next[0] < tool_id:
+            self._next = next(self._groups, None)
+        if self._next is None or self._next[0] != tool_id:
+            return []
+        rows = list(self._next[1])
+        self._next = next(self._groups, None)
+        return rows
+
+
+def _ict_data(
+    metadata: dict, io_rows: list[dict], ui_rows: list[dict], hardware: list[dict]
+) -> dict[str, Any]:
+    """Return the data of an ICT, as dumped by alias, from its rows."""
+    data: dict[str, Any] = {
+        "specVersion": metadata["spec_version"],
+        "name": metadata["name"],
+        "version": metadata["version"],
+        "container": metadata["container"],
+        "entrypoint": metadata["entrypoint"],
+        "title": metadata["title"],
+        "description": metadata["description"],
+        "author": metadata["author"],
+        "contact": metadata["contact"],
+        "repository": metadata["repository"],
+        "documentation": metadata["documentation"],
+        "citation": metadata["citation"],
+        "inputs": [],
+        "outputs": [],
+        "ui": [json.loads(row["item"]) for row in ui_rows],
+    }
+    for row in io_rows:
+        data[row["direction"]].append(
+            {
+                "name": row["name"],
+                "type": row["type"],
+                "description": row["description"],
+                "required": row["required"],
+                "format": json.loads(row["format"]),
+            }
+        )
+    for row in hardware:
+        data["hardware"] = hardware_data(row)
+    return data
+
+
+class ParquetCatalog:
+    """ICT collection written by `write_parquet`, read lazily.
+
+    Iterating reads the files one batch of rows at a time and rebuilds
+    each ICT when it is reached. The tables can also be read directly with
+    `table` for analytics.
+
+    Args:
+        path: directory of the Parquet files.
+        batch_size: number of rows read at a time from each file.
+        trusted: rebuild the ICTs without validation, only for files
+            written by `write_parquet` from valid ICTs.
+    """
+
+    def __init__(
+        self, path: StrPath, batch_size: int = BATCH_SIZE, trusted: bool = False
+    ):
+        _require_pyarrow()
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.trusted = trusted
+
+    def _file(self, table: str) -> Path:
+        """Return the path of the file of a table."""
+        return self.path.joinpath(f"{table}.parquet")
+
+    def _build(self, data: dict[str, Any]) -> ICT:
+        """Return the ICT of its data, validated unless trusted."""
+        return construct_ict(data) if self.trusted else ICT(**data)
+
+    def _iter_rows(self, table: str) -> Iterator[dict]:
+        """Yield the rows of a table, reading one batch at a time."""
+        parquet_file = pq.ParquetFile(self._file(table))
+        for batch in parquet_file.iter_batches(batch_size=self.batch_size):
+            yield from batch.to_pylist()
+
+    def table(self, name: str, columns: Optional[list[str]] = None) -> "pa.Table":
+        """Return a whole table, or some of its columns."""
+        return pq.read_table(self._file(name), columns=columns)
+
+    def load(self, tool_id: int) -> ICT:
+        """Rebuild one ICT, raise KeyError if missing."""
+        filters = [("tool_id", "=", tool_id)]
+        rows = {
+            table: pq.read_table(self._file(table), filters=filters).to_pylist()
+            for table in TABLES
+        }
+        if not rows["metadata"]:
+            raise KeyError(tool_id)
+        return self._build(
+            _ict_data(rows["metadata"][0], rows["io"], rows["ui"], rows["hardware"])
+        )
+
+    def __iter__(self) -> Iterator[ICT]:
+        """Rebuild every ICT, in order, one at a time."""
+        io_rows = _Groups(self._iter_rows("io"))
+        ui_rows = _Groups(self._iter_rows("ui"))
+        hardware = _Groups(self._iter_rows("hardware"))
+        for metadata in self._iter_rows("metadata"):
+            tool_id = metadata["tool_id"]
+            yield self._build(
+                _ict_data(
+                    metadata,
+                    io_rows.take(tool_id),
+                    ui_rows.take(tool_id),
+                    hardware.take(tool_id),
+                )
+            )
+
+    def __len__(self) -> int:
+        """Return the number of ICTs."""
+        return pq.ParquetFile(self._file("metadata")).metadata.num_rows
@@ -0,0 +1,445 @@
+"""Local execution of ICT tools, packed onto the cores and memory available.
+
+Jobs are started as soon as the resources they need are free: a job gets
+its recommended CPU and memory when available, its minimum otherwise.
+Smaller jobs may start before larger ones queued earlier when only they
+fit. The tools are run by a `Backend`:
+
+- `SubprocessBackend` runs the entrypoint of the tool as a local process,
+  without its container. It is meant for tests and for tools installed
+  on the machine.
+- `CWLToolBackend` runs the CommandLineTool of the tool with `cwltool`.
+"""
+
+import importlib.util
+import json
+import os
+import queue
+import subprocess  # nosec
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from pydantic import BaseModel, Field
+
+from ict._yaml import dump
+from ict.model import ICT
+
+# CPU of a tool without requirements, in millicores
+DEFAULT_CPU = 1000
+# number of characters of stderr kept in a JobResult
+STDERR_TAIL = 4000
+
+
+class Allocation(NamedTuple):
+    """Resources given to a running job."""
+
+    millicores: int
+    memory: int  # bytes
+
+
+class BackendResult(NamedTuple):
+    """Outcome of running a job."""
+
+    returncode: int
+    stderr: str = ""
+
+
+class Job(BaseModel):
+    """Run of a tool with a set of parameters."""
+
+    ict: ICT
+    params: dict[str, Any] = Field(
+        default_factory=dict, description="Values of the inputs, by name."
+    )
+    workdir: Optional[Path] = Field(
+        None, description="Working directory, a temporary one if missing."
+    )
+
+
+class JobResult(BaseModel):
+    """Outcome and timings of a job.
+
+    Times are in seconds from the start of `LocalExecutor.run`, every job
+    being submitted at 0.
+    """
+
+    index: int = Field(description="Position of the job in the queue.")
+    name: str = Field(description="Name of the tool.")
+    returncode: Optional[int] = Field(
+        None, description="Exit code, None if the job did not run."
+    )
+    error: Optional[str] = Field(None, description="Why the job failed, if it did.")
+    millicores: int = Field(0, description="CPU allocated, in millicores.")
+    memory: int = Field(0, description="Memory allocated, in bytes.")
+    started: float = Field(0.0, description="When the job started.")
+    finished: float = Field(0.0, description="When the job finished.")
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the job ran and exited with code 0."""
+        return self.returncode == 0 and self.error is None
+
+    @property
+    def queue_latency(self) -> float:
+        """Return the time spent waiting for resources, in seconds."""
+        return self.started
+
+    @property
+    def run_latency(self) -> float:
+        """Return the time spent running, in seconds."""
+        return self.finished - self.started
+
+
+class LatencySummary(BaseModel):
+    """Distribution of a latency over jobs, in seconds."""
+
+    mean: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: list[float]) -> "LatencySummary":
+        """Summarize a list of latencies."""
+        if not values:
+            return cls()
+        values = sorted(values)
+        last = len(values) - 1
+        return cls(
+            mean=sum(values) / len(values),
+            p50=values[round(0.50 * last)],
+            p95=values[round(0.95 * last)],
+            max=values[-1],
+        )
+
+
+class ExecutionReport(BaseModel):
+    """Outcome of `LocalExecutor.run`."""
+
+    results: list[JobResult] = Field(
+        default_factory=list, description="One result per job, in queue order."
+    )
+    elapsed: float = Field(0.0, description="Duration of the run, in seconds.")
+
+    @property
+    def succeeded(self) -> list[JobResult]:
+        """Return the results of the jobs that succeeded."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[JobResult]:
+        """Return the results of the jobs that failed or did not run."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def queue_latency(self) -> LatencySummary:
+        """Return the distribution of the time spent waiting for resources."""
+        return LatencySummary.from_values([r.queue_latency for r in self.results])
+
+    @property
+    def run_latency(self) -> LatencySummary:
+        """Return the distribution of the time spent running."""
+        return LatencySummary.from_values([r.run_latency for r in self.results])
+
+
+def _total_memory() -> int:
+    """Return the physical memory of the machine in bytes, 0 if unknown."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return 0
+
+
+def _requests(ict_: ICT) -> tuple[Allocation, Allocation]:
+    """Return the minimum and recommended resources of a tool.
+
+    Raises: ValueError if a CPU or memory quantity of the tool is not valid.
+    """
+    hardware = ict_.hardware
+    if hardware is None:
+        return Allocation(DEFAULT_CPU, 0), Allocation(DEFAULT_CPU, 0)
+    quantities = hardware.quantities()
+    cpu_min = quantities["cpu_min"] or DEFAULT_CPU
+    memory_min = quantities["memory_min"] or 0
+    minimum = Allocation(cpu_min, memory_min)
+    recommended = Allocation(
+        max(quantities["cpu_recommended"] or cpu_min, cpu_min),
+        max(quantities["memory_recommended"] or memory_min, memory_min),
+    )
+    return minimum, recommended
+
+
+class Backend:
+    """Runs jobs, called from one thread per running job."""
+
+    def run(self, job: Job, allocation: Allocation, workdir: Path) -> BackendResult:
+        """Run a job in `workdir` with the resources allocated to it."""
+        raise NotImplementedError
+
+
+def _param_args(name: str, value: Any) -> list[str]:
+    """Return the command line arguments of a parameter."""
+    if value is None or value is False:
+        return []
+    if value is True:
+        return [f"--{name}"]
+    if isinstance(value, dict):  # CWL File or Directory
+        value = value.get("path", value.get("location"))
+    if isinstance(value, (list, tuple)):
+        return [f"--{name}", *(str(item) for item in value)]
+    return [f"--{name}", str(value)]
+
+
+class SubprocessBackend(Backend):
+    """Run the entrypoint of a tool as a local process.
+
+    Parameters are passed as `--<name> <value>`, as in the CommandLineTool
+    of the tool. The allocation is given to the process in the
+    `ICT_MILLICORES` and `ICT_MEMORY` environment variables.
+
+    Args:
+        base_command: command run instead of the entrypoint of the tool.
+        timeout: maximum duration of a job, in seconds.
+    """
+
+    def __init__(
+        self, base_command: Optional[list[str]] = None, timeout: Optional[float] = None
+    ):
+        self.base_command = base_command
+        self.timeout = timeout
+
+    def command(self, job: Job) -> list[str]:
+        """Return the command line of a job."""
+        command = list(self.base_command or [str(job.ict.entrypoint)])
+        for name, value in job.params.items():
+            command.extend(_param_args(name, value))
+        return command
+
+    def run(self, job: Job, allocation: Allocation, workdir: Path) -> BackendResult:
+        """Run a job in `workdir` with the resources allocated to it."""
+        env = dict(
+            os.environ,
+            ICT_MILLICORES=str(allocation.millicores),
+            ICT_MEMORY=str(allocation.memory),
+        )
+        process = subprocess.run(  # nosec
+            self.command(job),
+            cwd=workdir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=self.timeout,
+            check=False,
+        )
+        return BackendResult(
+            process.returncode,
+            process.stderr.decode("utf-8", "replace")[-STDERR_TAIL:],
+        )
+
+
+class CWLToolBackend(Backend):
+    """Run the CommandLineTool of a tool with cwltool.
+
+    The allocation is set as the ResourceRequirement of the tool and its
+    entrypoint as the base command. Outputs are written to the working
+    directory of the job.
+
+    Args:
+        network_access: allow the tools to access the network.
+        args: extra arguments of cwltool, e.g. `["--singularity"]`.
+    """
+
+    def __init__(self, network_access: bool = False, args: Optional[list[str]] = None):
+        if importlib.util.find_spec("cwltool") is None:
+            raise ImportError(
+                "CWLToolBackend requires cwltool, install it with `pip install cwltool`"
+            )
+        self.network_access = network_access
+        self.args = args or []
+
+    def tool(self, job: Job, allocation: Allocation) -> dict:
+        """Return the CommandLineTool run for a job.
+
+        Raises: ValueError if an output of the tool has no CWL equivalent,
+            only `outDir` outputs are supported.
+        """
+        clt = job.ict.to_clt(self.network_access)
+        unsupported = [
+            name
+            for name, output in clt["outputs"].items()
+            if not isinstance(output, dict)
+        ]
+        if unsupported:
+            raise ValueError(
+                f"Outputs of {job.ict.name} have no CWL equivalent: "
+                f"{', '.join(unsupported)}"
+            )
+        clt.setdefault("baseCommand", str(job.ict.entrypoint))
+        clt["requirements"]["ResourceRequirement"] = {
+            "coresMin": allocation.millicores / 1000,
+            "ramMin": max(allocation.memory // 2**20, 1),
+        }
+        return clt
+
+    def run(self, job: Job, allocation: Allocation, workdir: Path) -> BackendResult:
+        """Run a job in `workdir` with the resources allocated to it."""
+        clt = self.tool(job, allocation)
+        tool = workdir.joinpath("tool.cwl")
+        with tool.open("w", encoding="utf-8") as file:
+            dump(clt, file)
+        params = workdir.joinpath("params.json")
+        params.write_text(json.dumps(job.params), encoding="utf-8")
+        process = subprocess.run(  # nosec
+            [
+                sys.executable,
+                "-m",
+                "cwltool",
+                "--outdir",
+                str(workdir.joinpath("outputs")),
+                *self.args,
+                str(tool),
+                str(params),
+            ],
+            cwd=workdir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+        return BackendResult(
+            process.returncode,
+            process.stderr.decode("utf-8", "replace")[-STDERR_TAIL:],
+        )
+
+
+class LocalExecutor:
+    """Run jobs on the local machine, within its CPU and memory.
+
+    Args:
+        backend: how jobs are run, `SubprocessBackend()` by default.
+        cores: number of cores available, all of them by default.
+        memory: memory available in bytes, the physical memory by default.
+            If unknown, memory is not taken into account.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Backend] = None,
+        cores: Optional[float] = None,
+        memory: Optional[int] = None,
+    ):
+        self.backend = backend or SubprocessBackend()
+        self.millicores = round((cores or os.cpu_count() or 1) * 1000)
+        self.memory = _total_memory() if memory is None else memory
+
+    def _allocate(
+        self, minimum: Allocation, recommended: Allocation, free: Allocation
+    ) -> Optional[Allocation]:
+        """Return the resources to give to a job, None if they are not free."""
+        memory_free = free.memory if self.memory else sys.maxsize
+        for request in (recommended, minimum):
+            if request.millicores <= free.millicores and request.memory <= memory_free:
+                return request
+        return None
+
+    def _run_job(
+        self,
+        index: int,
+        job: Job,
+        allocation: Allocation,
+        start: float,
+        done: "queue.SimpleQueue[tuple[int, JobResult]]",
+    ) -> None:
+        """Run a job and put its result in `done`."""
+        result = JobResult(
+            index=index,
+            name=job.ict.name,
+            millicores=allocation.millicores,
+            memory=allocation.memory,
+            started=time.perf_counter() - start,
+        )
+        try:
+            if job.workdir is None:
+                with tempfile.TemporaryDirectory(prefix="ict-") as workdir:
+                    outcome = self.backend.run(job, allocation, Path(workdir))
+            else:
+                job.workdir.mkdir(parents=True, exist_ok=True)
+                outcome = self.backend.run(job, allocation, job.workdir)
+            result.returncode = outcome.returncode
+            if outcome.returncode != 0:
+                result.error = outcome.stderr or f"exit code {outcome.returncode}"
+        except Exception as exc:  # pylint: disable=broad-except
+            result.error = f"{type(exc).__name__}: {exc}"
+        result.finished = time.perf_counter() - start
+        done.put((index, result))
+
+    def run(self, jobs: Iterable[Job]) -> ExecutionReport:
+        """Run every job and return their results, in queue order.
+
+        Jobs needing more than the machine has, or with hardware
+        requirements that are not valid, fail without running.
+        """
+        start = time.perf_counter()
+        results: list[Optional[JobResult]] = []
+        pending: list[tuple[int, Job, Allocation, Allocation]] = []
+        capacity = Allocation(self.millicores, self.memory)
+        for index, job in enumerate(jobs):
+            results.append(None)
+            try:
+                minimum, recommended = _requests(job.ict)
+            except ValueError as exc:
+                results[index] = JobResult(
+                    index=index, name=job.ict.name, error=f"ValueError: {exc}"
+                )
+                continue
+            if self._allocate(minimum, minimum, capacity) is None:
+                results[index] = JobResult(
+                    index=index,
+                    name=job.ict.name,
+                    error=f"requires {minimum.millicores / 1000:g} cores and "
+                    f"{minimum.memory} bytes of memory, more than available",
+                )
+                continue
+            pending.append((index, job, minimum, recommended))
+
+        done: "queue.SimpleQueue[tuple[int, JobResult]]" = queue.SimpleQueue()
+        allocated: dict[int, Allocation] = {}
+        free = capacity
+        # no pending job can start with less CPU free than this
+        smallest = min((minimum.millicores for _, _, minimum, _ in pending), default=0)
+        while pending or allocated:
+            waiting = []
+            for position, (index, job, minimum, recommended) in enumerate(pending):
+                if free.millicores < smallest:
+                    waiting.extend(pending[position:])
+                    break
+                allocation = self._allocate(minimum, recommended, free)
+                if allocation is None:
+                    waiting.append((index, job, minimum, recommended))
+                    continue
+                allocated[index] = allocation
+                free = Allocation(
+                    free.millicores - allocation.millicores,
+                    free.memory - allocation.memory,
+                )
+                threading.Thread(
+                    target=self._run_job,
+                    args=(index, job, allocation, start, done),
+                    daemon=True,
+                ).start()
+            pending = waiting
+            index, result = done.get()
+            results[index] = result
+            allocation = allocated.pop(index)
+            free = Allocation(
+                free.millicores + allocation.millicores,
+                free.memory + allocation.memory,
+            )
+        return ExecutionReport(
+            results=results,  # type: ignore
+            elapsed=time.perf_counter() - start,
+        )
@@ -0,0 +1,202 @@
+"""Bulk export of ICT manifests to CWL CommandLineTools."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from ict._version import __version__
+from ict.validate import (
+    SUFFIXES,
+    ValidationFailure,
+    ValidationResult,
+    _run_chunked,
+    validate,
+)
+
+StrPath = TypeVar("StrPath", str, Path)
+
+STATE_FILE = ".ict-export.json"
+STATE_FORMAT = 1
+
+
+class ExportSummary(BaseModel):
+    """Outcome of `export_cwl`."""
+
+    exported: int = Field(0, description="Number of CommandLineTools written.")
+    unchanged: int = Field(0, description="Number of sources skipped as unchanged.")
+    failures: list[ValidationResult] = Field(
+        default_factory=list, description="Sources that could not be exported."
+    )
+    elapsed: float = Field(0.0, description="Duration of the export, in seconds.")
+
+    @property
+    def total(self) -> int:
+        """Return the number of sources found."""
+        return self.exported + self.unchanged + len(self.failures)
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of sources processed per second."""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+
+def _export_path(
+    source: Path, target: Path, network_access: bool
+) -> Optional[ValidationFailure]:
+    """Validate one manifest and save its CommandLineTool."""
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        validate(source).save_clt(target, network_access)
+    except Exception as exc:  # pylint: disable=broad-except
+        return ValidationFailure.from_exception(exc)
+    return None
+
+
+def _export_chunk(
+    tasks: list[tuple[Path, Path]], network_access: bool
+) -> list[Optional[ValidationFailure]]:
+    """Export a chunk of manifests inside a worker process."""
+    return [_export_path(source, target, network_access) for source, target in tasks]
+
+
+def _load_state(path: Path, network_access: bool) -> dict[str, str]:
+    """Return the source hashes of the previous export, if still valid."""
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if state.get("format") != STATE_FORMAT or state.get("settings") != {
+        "ict": __version__,
+        "network_access": network_access,
+    }:
+        return {}
+    return state.get("sources", {})
+
+
+def _save_state(path: Path, network_access: bool, sources: dict[str, str]) -> None:
+    """Store the source hashes of the export."""
+    state = {
+        "format": STATE_FORMAT,
+        "settings": {"ict": __version__, "network_access": network_access},
+        "sources": dict(sorted(sources.items())),
+    }
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=1), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _scan(src: Path, out: Path) -> dict[Path, list[Path]]:
+    """Return the manifests below `src`, grouped by the path they export to.
+
+    The export state file and the `out` tree are skipped, in case `out` is
+    inside `src`.
+    """
+    out_resolved = out.resolve()
+    targets: dict[Path, list[Path]] = {}
+    for source in sorted(src.rglob("*")):
+        if (
+            source.suffix not in SUFFIXES
+            or source.name == STATE_FILE
+            or not source.is_file()
+        ):
+            continue
+        resolved = source.resolve()
+        if resolved == out_resolved or out_resolved in resolved.parents:
+            continue
+        target = out.joinpath(source.relative_to(src)).with_suffix(".cwl")
+        targets.setdefault(target, []).append(source)
+    return targets
+
+
+def export_cwl(
+    src: StrPath,
+    out: StrPath,
+    jobs: Optional[int] = None,
+    network_access: bool = False,
+    force: bool = False,
+) -> ExportSummary:
+    """Export every manifest of a directory tree as a CommandLineTool.
+
+    Each `.yaml`, `.yml` or `.json` file below `src` is validated and
+    saved with `ICT.save_clt` to the same relative path below `out`, with
+    a `.cwl` suffix. The hash of every exported source is stored in
+    `out/.ict-export.json`, and sources whose hash did not change since
+    the last export are skipped if their output still exists. Sources
+    that would be exported to the same path, such as `a.yaml` and
+    `a.json`, are all reported as failures.
+
+    Args:
+        src: directory of the manifests.
+        out: directory of the CommandLineTools, created if missing.
+        jobs: number of worker processes. Defaults to the number of
+            CPUs. With `jobs=1` the export runs in this process.
+        network_access: passed to `ICT.save_clt`.
+        force: export every source, even unchanged ones.
+    """
+    start = time.perf_counter()
+    src, out = Path(src), Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    state_path = out.joinpath(STATE_FILE)
+    previous = {} if force else _load_state(state_path, network_access)
+    summary = ExportSummary()
+    hashes: dict[str, str] = {}
+    tasks: list[tuple[Path, Path]] = []
+    for target, sources in _scan(src, out).items():
+        if len(sources) > 1:
+            # which source would win is arbitrary, export none of them
+            names = ", ".join(source.relative_to(src).as_posix() for source in sources)
+            failure = ValidationFailure(
+                error_type="ValueError",
+                message=f"{names} would all be exported to {target}",
+            )
+            summary.failures.extend(
+                ValidationResult(source=str(source), error=failure)
+                for source in sources
+            )
+            continue
+        source = sources[0]
+        relative = source.relative_to(src).as_posix()
+        try:
+            hashes[relative] = hashlib.sha256(source.read_bytes()).hexdigest()
+        except OSError as exc:
+            # e.g. unreadable, or deleted since the scan
+            summary.failures.append(
+                ValidationResult(
+                    source=str(source), error=ValidationFailure.from_exception(exc)
+                )
+            )
+            continue
+        if previous.get(relative) == hashes[relative] and target.exists():
+            summary.unchanged += 1
+        else:
+            tasks.append((source, target))
+
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    failures: list[Optional[ValidationFailure]]
+    if workers <= 1:
+        failures = _export_chunk(tasks, network_access)
+    else:
+        failures = [None] * len(tasks)
+        for start, results in _run_chunked(
+            _export_chunk,
+            tasks,
+            workers,
+            network_access,
+            on_error=lambda task, failure: failure,
+        ):
+            failures[start : start + len(results)] = results
+
+    for (source, _), failure in zip(tasks, failures):
+        if failure is None:
+            summary.exported += 1
+        else:
+            hashes.pop(source.relative_to(src).as_posix())
+            summary.failures.append(ValidationResult(source=str(source), error=failure))
+    _save_state(state_path, network_access, hashes)
+    summary.elapsed = time.perf_counter() - start
+    return summary
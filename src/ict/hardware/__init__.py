@@ -1,5 +1,6 @@
 """Hardware Requirements for ICT."""
 
 from ict.hardware.objects import CPU, GPU, HardwareRequirements, Memory
+from ict.hardware.quantities import parse_cpu, parse_memory
 
-__all__ = ["CPU", "Memory", "GPU", "HardwareRequirements"]
+__all__ = ["CPU", "Memory", "GPU", "HardwareRequirements", "parse_cpu", "parse_memory"]
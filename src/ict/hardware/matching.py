@@ -0,0 +1,134 @@
+"""Vectorized matching of ICT hardware requirements with compute nodes.
+
+Requires the optional `numpy` dependency (`pip install ict[matching]`).
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ict.model import ICT
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+# columns of the node capacity array
+CORES, MEMORY, GPU = 0, 1, 2
+
+
+def _require_numpy() -> None:
+    """Raise ImportError if numpy is not installed."""
+    if np is None:
+        raise ImportError(
+            "Hardware matching requires numpy, install it with "
+            "`pip install ict[matching]`"
+        )
+
+
+class HardwareMatcher:
+    """Find the nodes able to run each tool of a catalog.
+
+    The requirements of the tools are parsed once into arrays, so that
+    matching them with a set of nodes is a few array operations.
+
+    Args:
+        icts: the tools, in the order of the rows of the results.
+
+    Raises: ValueError if a tool has a CPU or memory quantity that is
+        not valid.
+    """
+
+    def __init__(self, icts: Iterable["ICT"]):
+        _require_numpy()
+        rows = []
+        for ict_ in icts:
+            hardware = ict_.hardware
+            if hardware is None:
+                rows.append((0, 0, 0, 0, False))
+                continue
+            try:
+                quantities = hardware.quantities()
+            except ValueError as exc:
+                raise ValueError(f"{ict_.name} {ict_.version}: {exc}") from exc
+            cpu_min = quantities["cpu_min"] or 0
+            memory_min = quantities["memory_min"] or 0
+            rows.append(
+                (
+                    cpu_min,
+                    quantities["cpu_recommended"] or cpu_min,
+                    memory_min,
+                    quantities["memory_recommended"] or memory_min,
+                    bool(hardware.gpu_required),
+                )
+            )
+        table = np.array(rows, dtype=np.float64).reshape(-1, 5)
+        self.cpu_min = table[:, 0]
+        self.cpu_recommended = table[:, 1]
+        self.memory_min = table[:, 2]
+        self.memory_recommended = table[:, 3]
+        self.gpu_required = table[:, 4].astype(bool)
+
+    def __len__(self) -> int:
+        """Return the number of tools."""
+        return len(self.cpu_min)
+
+    @staticmethod
+    def _nodes(nodes: Any) -> "np.ndarray":
+        """Return node capacities as an array of (millicores, bytes, gpu) rows."""
+        nodes = np.asarray(nodes, dtype=np.float64).reshape(-1, 3)
+        return np.column_stack(
+            (nodes[:, CORES] * 1000, nodes[:, MEMORY], nodes[:, GPU] > 0)
+        )
+
+    def fits(self, nodes: Any) -> "np.ndarray":
+        """Return a (tools, nodes) boolean array, True if the node can run the tool.
+
+        Args:
+            nodes: array of shape (nodes, 3) whose columns are the number
+                of cores, the memory in bytes and whether a GPU is present.
+        """
+        nodes = self._nodes(nodes)
+        return (
+            (nodes[:, 0] >= self.cpu_min[:, None])
+            & (nodes[:, 1] >= self.memory_min[:, None])
+            & ((nodes[:, 2] > 0) | ~self.gpu_required[:, None])
+        )
+
+    def rank(self, nodes: Any) -> tuple["np.ndarray", "np.ndarray"]:
+        """Rank the nodes able to run each tool, best fit first.
+
+        Nodes meeting more of the recommended CPU and memory come first.
+        Among them, the nodes with the least capacity left over come
+        first, to keep the larger nodes for the tools that need them.
+
+        Args:
+            nodes: array of shape (nodes, 3) whose columns are the number
+                of cores, the memory in bytes and whether a GPU is present.
+
+        Returns: `order`, a (tools, nodes) array of node indices, and
+            `counts`, the number of nodes able to run each tool. The nodes
+            of tool `i` are `order[i, :counts[i]]`.
+        """
+        fits = self.fits(nodes)
+        nodes = self._nodes(nodes)
+        cpu, memory = nodes[:, 0], nodes[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # share of the recommended resources provided, from 0 to 2
+            score = np.minimum(
+                np.nan_to_num(cpu / self.cpu_recommended[:, None], nan=1.0, posinf=1.0),
+                1.0,
+            ) + np.minimum(
+                np.nan_to_num(
+                    memory / self.memory_recommended[:, None], nan=1.0, posinf=1.0
+                ),
+                1.0,
+            )
+            # capacity left over, relative to the largest node
+            waste = (cpu - self.cpu_recommended[:, None]) / cpu.max(initial=1.0) + (
+                memory - self.memory_recommended[:, None]
+            ) / memory.max(initial=1.0)
+        # sort by fits, then score, then waste; lexsort uses the last key first
+        order = np.lexsort((np.abs(waste), -score, ~fits), axis=1)
+        return order, fits.sum(axis=1)
@@ -1,9 +1,11 @@
 # pylint: disable=no-member
 """Hardware Requirements for ICT."""
-from typing import Annotated, Optional, Union
+from typing import Annotated, Any, Optional, Union
 
 from pydantic import BaseModel, BeforeValidator, Field
 
+from ict.hardware.quantities import parse_cpu, parse_memory
+
 
 def validate_str(s_t: Union[int, float, str]) -> Union[str, None]:
     """Return a string from int, float, or str."""
@@ -82,16 +84,20 @@ class GPU(BaseModel):
     )
 
 
-ATTRIBUTES = [
-    "cpu_type",
-    "cpu_min",
-    "cpu_recommended",
-    "memory_min",
-    "memory_recommended",
-    "gpu_enabled",
-    "gpu_required",
-    "gpu_type",
-]
+def _flattened(name: str) -> property:
+    """Return a property reading `name` from its section, e.g. `cpu_min` from `cpu`.
+
+    The property is None when the section is missing.
+    """
+    section = name.split("_")[0]
+
+    def getter(self: "HardwareRequirements") -> Any:
+        section_ = self.__dict__[section]
+        return None if section_ is None else section_.__dict__[name]
+
+    getter.__name__ = name
+    getter.__doc__ = f"Return `{section}.{name}`, None if there is no `{section}`."
+    return property(getter)
 
 
 class HardwareRequirements(BaseModel):
@@ -101,8 +107,54 @@ class HardwareRequirements(BaseModel):
     memory: Optional[Memory] = Field(None, description="Memory requirements.")
     gpu: Optional[GPU] = Field(None, description="GPU requirements.")
 
-    def __getattribute__(self, name: str) -> Union[CPU, Memory, GPU]:
-        """Get attribute."""
-        if name in ATTRIBUTES:
-            return super().__getattribute__(name.split("_")[0]).__getattribute__(name)
-        return super().__getattribute__(name)
+    cpu_type = _flattened("cpu_type")
+    cpu_min = _flattened("cpu_min")
+    cpu_recommended = _flattened("cpu_recommended")
+    memory_min = _flattened("memory_min")
+    memory_recommended = _flattened("memory_recommended")
+    gpu_enabled = _flattened("gpu_enabled")
+    gpu_required = _flattened("gpu_required")
+    gpu_type = _flattened("gpu_type")
+
+    @property
+    def cpu_min_millicores(self) -> Optional[int]:
+        """Return `cpu_min` in millicores, None if missing or not valid."""
+        return parse_cpu(self.cpu_min)
+
+    @property
+    def cpu_recommended_millicores(self) -> Optional[int]:
+        """Return `cpu_recommended` in millicores, None if missing or not valid."""
+        return parse_cpu(self.cpu_recommended)
+
+    @property
+    def memory_min_bytes(self) -> Optional[int]:
+        """Return `memory_min` in bytes, None if missing or not valid."""
+        return parse_memory(self.memory_min)
+
+    @property
+    def memory_recommended_bytes(self) -> Optional[int]:
+        """Return `memory_recommended` in bytes, None if missing or not valid."""
+        return parse_memory(self.memory_recommended)
+
+    def quantities(self) -> dict[str, Optional[int]]:
+        """Return the CPU quantities in millicores and the memory ones in bytes.
+
+        Keys are `cpu_min`, `cpu_recommended`, `memory_min` and
+        `memory_recommended`, missing quantities are None.
+
+        Raises: ValueError if a quantity is set but not valid.
+        """
+        parsed = {
+            "cpu_min": self.cpu_min_millicores,
+            "cpu_recommended": self.cpu_recommended_millicores,
+            "memory_min": self.memory_min_bytes,
+            "memory_recommended": self.memory_recommended_bytes,
+        }
+        invalid = [
+            f"{name}={getattr(self, name)!r}"
+            for name, value in parsed.items()
+            if value is None and getattr(self, name) is not None
+        ]
+        if invalid:
+            raise ValueError(f"Invalid hardware quantities: {', '.join(invalid)}")
+        return parsed
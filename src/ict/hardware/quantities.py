@@ -0,0 +1,57 @@
+"""Parsing of CPU and memory quantities.
+
+Quantities follow the Kubernetes notation: CPU in cores or millicores
+(`2`, `0.5`, `100m`), memory in bytes with an optional decimal (`k`,
+`M`, `G`, ...) or binary (`Ki`, `Mi`, `Gi`, ...) suffix.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Union
+
+QUANTITY_REGEX = re.compile(
+    r"^\s*([0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*([a-zA-Z]*)\s*$"
+)
+MEMORY_SUFFIXES: dict[str, float] = {
+    "": 1,
+    "m": 1e-3,
+    "k": 1e3,
+    "M": 1e6,
+    "G": 1e9,
+    "T": 1e12,
+    "P": 1e15,
+    "E": 1e18,
+    "Ki": 2**10,
+    "Mi": 2**20,
+    "Gi": 2**30,
+    "Ti": 2**40,
+    "Pi": 2**50,
+    "Ei": 2**60,
+}
+CPU_SUFFIXES: dict[str, float] = {"": 1000, "m": 1}
+
+Quantity = Union[str, int, float, None]
+
+
+def _parse(value: Quantity, suffixes: dict[str, float]) -> Optional[int]:
+    """Return a quantity in the unit of `suffixes`, None if not valid."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return round(value * suffixes[""])
+    match = QUANTITY_REGEX.match(value)
+    if match is None or match.group(2) not in suffixes:
+        return None
+    return round(float(match.group(1)) * suffixes[match.group(2)])
+
+
+@lru_cache(maxsize=4096, typed=True)
+def parse_cpu(value: Quantity) -> Optional[int]:
+    """Return a CPU quantity (e.g. `100m`, `2`) in millicores, None if not valid."""
+    return _parse(value, CPU_SUFFIXES)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def parse_memory(value: Quantity) -> Optional[int]:
+    """Return a memory quantity (e.g. `129Mi`, `2G`) in bytes, None if not valid."""
+    return _parse(value, MEMORY_SUFFIXES)
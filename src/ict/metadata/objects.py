@@ -1,7 +1,7 @@
 """Metadata Model."""
 
 import re
-from functools import singledispatchmethod
+from functools import lru_cache, singledispatchmethod
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -19,6 +19,14 @@ from typing_extensions import Annotated
 
 from ict.semver import Version
 
+CONTAINER_REGEX = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+:[a-zA-Z0-9_\.\-]+$")
+
+
+@lru_cache(maxsize=4096)
+def _is_container(value: str) -> bool:
+    """Return True if `value` is a valid container reference."""
+    return bool(CONTAINER_REGEX.match(value))
+
 
 class Author(RootModel):
     """Author object."""
@@ -169,9 +177,7 @@ class Metadata(BaseModel):
     @classmethod
     def check_container(cls, value):
         """Check the container follows the correct format."""
-        if not bool(
-            re.match(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+:[a-zA-Z0-9_\.\-]+$", value)
-        ):
+        if not _is_container(value):
             raise ValueError(
                 "The name must be in the format <registry path>/<image repository>:<tag>"
             )
@@ -1,33 +1,89 @@
 # pylint: disable=no-member, no-name-in-module, import-error
 """ICT model."""
 
+import copy
 import logging
+from collections.abc import Sequence
 from functools import singledispatchmethod
 from pathlib import Path
-from typing import Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
-import yaml  # type: ignore
-from polus.plugins import Plugin  # type: ignore
-from polus.plugins._plugins.classes import _load_plugin  # type: ignore
 from pydantic import model_validator
 
+from ict._yaml import dump, safe_dump
 from ict.hardware import HardwareRequirements
 from ict.io import IO
 from ict.metadata import Metadata
-from ict.tools import clt_dict
+from ict.tools import cached_clt_dict
 from ict.ui import UIItem
-from ict.wipp_utils import (
-    convert_wipp_hardware_to_ict,
-    convert_wipp_io_to_ict,
-    convert_wipp_metadata_to_ict,
-    convert_wipp_ui_to_ict,
-)
+
+if TYPE_CHECKING:
+    from ict.wipp_utils import WIPPPlugin
 
 StrPath = TypeVar("StrPath", str, Path)
 
 logger = logging.getLogger("ict")
 
 
+# (JSON pointer, code, subject) of an io/ui mismatch
+IOUIErrorTuple = tuple[str, str, str]
+_IO_UI_MESSAGES = {
+    "ui_unmatched": "The ui keys must match the inputs and outputs keys. Unmatched:",
+    "duplicate_io": "The inputs and outputs names must be unique. Duplicated:",
+    "duplicate_ui": "The ui keys must be unique. Duplicated:",
+}
+
+
+def io_ui_errors(
+    inputs: Sequence[Any], outputs: Sequence[Any], ui_keys: Sequence[Any]
+) -> list[IOUIErrorTuple]:
+    """Return the duplicate names and keys, and the ui keys without io.
+
+    Names and keys that are not strings are skipped, so that the
+    arguments can come from a document that failed validation.
+    """
+    errors = []
+    io_names: dict[str, set[str]] = {"inputs": set(), "outputs": set()}
+    for io_kind, names in (("inputs", inputs), ("outputs", outputs)):
+        seen = io_names[io_kind]
+        for position, name in enumerate(names):
+            if not isinstance(name, str):
+                continue
+            if name in seen:
+                errors.append(
+                    (f"/{io_kind}/{position}/name", "duplicate_io", f"{io_kind}.{name}")
+                )
+            seen.add(name)
+    ui_keys_: set[str] = set()
+    for position, key in enumerate(ui_keys):
+        if not isinstance(key, str):
+            continue
+        if key in ui_keys_:
+            errors.append((f"/ui/{position}/key", "duplicate_ui", key))
+        ui_keys_.add(key)
+        io_kind, _, name = key.partition(".")
+        if name not in io_names.get(io_kind, ()):
+            errors.append((f"/ui/{position}/key", "ui_unmatched", key))
+    return errors
+
+
+class IOUIError(ValueError):
+    """Mismatch between the ui and the inputs and outputs of an ICT.
+
+    `errors` holds every problem, as returned by `io_ui_errors`.
+    """
+
+    def __init__(self, errors: list[IOUIErrorTuple]):
+        self.errors = errors
+        messages = []
+        for code, prefix in _IO_UI_MESSAGES.items():
+            # dicts keep the order of errors
+            subjects = dict.fromkeys(s for _, c, s in errors if c == code)
+            if subjects:
+                messages.append(f"{prefix} {', '.join(subjects)}")
+        super().__init__(" ".join(messages))
+
+
 class ICT(Metadata):
     """ICT object."""
 
@@ -38,24 +94,18 @@ class ICT(Metadata):
 
     @model_validator(mode="after")
     def validate_ui(self) -> "ICT":
-        """Validate that the ui matches the inputs and outputs."""
-        io_dict = {"inputs": [], "outputs": []}  # type: ignore
-        ui_keys = [ui.key.root.split(".") for ui in self.ui]
-        for ui_ in ui_keys:
-            io_dict[ui_[0]].append(ui_[1])
-        input_names = [io.name for io in self.inputs]
-        output_names = [io.name for io in self.outputs]
-        inp_bool = [x in input_names for x in io_dict["inputs"]]
-        out_bool = [x in output_names for x in io_dict["outputs"]]
-
-        if not all(inp_bool):
-            raise ValueError(
-                f"The ui keys must match the inputs and outputs keys. Unmatched: inputs.{set(io_dict['inputs'])-set(input_names)}"
-            )
-        if not all(out_bool):
-            raise ValueError(
-                f"The ui keys must match the inputs and outputs keys. Unmatched: outputs.{set(io_dict['outputs'])-set(output_names)}"
-            )
+        """Validate that the ui matches the inputs and outputs.
+
+        Reports every duplicate input/output name, duplicate ui key and
+        ui key without a matching input/output at once.
+        """
+        errors = io_ui_errors(
+            [io.name for io in self.inputs],
+            [io.name for io in self.outputs],
+            [ui.key.root for ui in self.ui],
+        )
+        if errors:
+            raise IOUIError(errors)
         return self
 
     def to_clt(self, network_access: bool = False) -> dict:
@@ -68,14 +118,15 @@ class ICT(Metadata):
                 requirements of the CLT will include
                 `networkAccess`: `True`.
 
-        Returns: `dict` representation of the CLT.
+        Returns: `dict` representation of the CLT. It is a copy of the
+            cached CLT and can be modified freely.
         """
-        return clt_dict(self, network_access)
+        return copy.deepcopy(cached_clt_dict(self, network_access))
 
     @property
     def clt(self) -> dict:
         """Convenience property of object as CommandLineTool with no network access."""
-        return clt_dict(self, network_access=False)
+        return self.to_clt(network_access=False)
 
     def save_clt(self, cwl_path: StrPath, network_access: bool = False) -> Path:
         """Save the ICT as CommandLineTool to a file."""
@@ -83,7 +134,7 @@ class ICT(Metadata):
             str(cwl_path).rsplit(".", maxsplit=1)[-1] == "cwl"
         ), "Path must end in .cwl"
         with Path(cwl_path).open("w", encoding="utf-8") as file:
-            yaml.dump(self.to_clt(network_access), file)
+            dump(cached_clt_dict(self, network_access), file)
         return Path(cwl_path)
 
     def save_yaml(self, yaml_path: StrPath) -> Path:
@@ -93,7 +144,7 @@ class ICT(Metadata):
             "yml",
         ], "Path must end in .yaml or .yml"
         with Path(yaml_path).open("w", encoding="utf-8") as file:
-            yaml.dump(
+            safe_dump(
                 self.model_dump(mode="json", exclude_none=True, by_alias=True), file
             )
         return Path(yaml_path)
@@ -105,10 +156,47 @@ class ICT(Metadata):
         """
         return self.save_yaml(yml_path)
 
+    def to_bytes(self) -> bytes:
+        """Serialize the ICT to a compact binary format.
+
+        Requires the optional `msgpack` dependency.
+        """
+        from ict.binary import dumps  # pylint: disable=import-outside-toplevel
+
+        return dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, trusted: bool = False) -> "ICT":
+        """Deserialize an ICT from `to_bytes` output.
+
+        Args:
+            data: bytes returned by `to_bytes`.
+            trusted: skip validation, only for bytes produced by this
+                library from a validated ICT and read from storage only
+                you can write to.
+        """
+        from ict.binary import loads  # pylint: disable=import-outside-toplevel
+
+        return loads(data, trusted=trusted)
+
     @singledispatchmethod
     @classmethod
-    def from_wipp(cls, wipp: Plugin, **kwargs) -> "ICT":
-        """Convert WIPP Plugin to ICT."""
+    def from_wipp(cls, wipp: "WIPPPlugin", **kwargs) -> "ICT":
+        """Convert WIPP Plugin to ICT.
+
+        `wipp` is a `WIPPPlugin`, the dict or path of a WIPP manifest,
+        or a plugin object of `polus.plugins`.
+        """
+        # ict.wipp_utils depends on this module
+        from ict.wipp_utils import (  # pylint: disable=import-outside-toplevel
+            WIPPPlugin,
+            convert_wipp_hardware_to_ict,
+            convert_wipp_io_to_ict,
+            convert_wipp_metadata_to_ict,
+            convert_wipp_ui_list,
+        )
+
+        wipp = WIPPPlugin.from_object(wipp)
         metadata = convert_wipp_metadata_to_ict(wipp, **kwargs)
         if wipp.resourceRequirements is not None:
             hardware = convert_wipp_hardware_to_ict(wipp.resourceRequirements)
@@ -116,7 +204,7 @@ class ICT(Metadata):
             hardware = None
         inputs = [convert_wipp_io_to_ict(inp) for inp in wipp.inputs]
         outputs = [convert_wipp_io_to_ict(out) for out in wipp.outputs]
-        ui = [convert_wipp_ui_to_ict(ui_, wipp.inputs) for ui_ in wipp.ui]
+        ui = convert_wipp_ui_list(wipp.ui, wipp.inputs)
         return cls(
             **metadata.model_dump(),
             inputs=inputs,
@@ -129,12 +217,14 @@ class ICT(Metadata):
     @classmethod
     def _(cls, wipp, **kwargs) -> "ICT":
         """Convert WIPP Plugin to ICT."""
-        wipp_ = _load_plugin(wipp)
-        return cls.from_wipp(wipp_, **kwargs)
+        from ict.wipp_utils import (  # pylint: disable=import-outside-toplevel
+            WIPPPlugin,
+        )
+
+        return cls.from_wipp(WIPPPlugin.from_file(wipp), **kwargs)
 
     @from_wipp.register(str)  # type: ignore
     @classmethod
     def _(cls, wipp, **kwargs) -> "ICT":
         """Convert WIPP Plugin to ICT."""
-        wipp_ = _load_plugin(wipp)
-        return cls.from_wipp(wipp_, **kwargs)
+        return cls.from_wipp(Path(wipp), **kwargs)
@@ -0,0 +1,319 @@
+"""Persistent SQLite registry of validated ICT objects."""
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, TypeVar, Union
+
+from ict._construct import construct_ict
+from ict._rows import hardware_data, hardware_row, optional_str
+from ict.model import ICT
+from ict.semver import Version
+
+StrPath = TypeVar("StrPath", str, Path)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS registry_info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS metadata (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    major INTEGER NOT NULL,
+    minor INTEGER NOT NULL,
+    patch INTEGER NOT NULL,
+    prerelease TEXT,
+    spec_version TEXT NOT NULL,
+    container TEXT NOT NULL,
+    entrypoint TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    author TEXT NOT NULL,
+    contact TEXT NOT NULL,
+    repository TEXT NOT NULL,
+    documentation TEXT,
+    citation TEXT,
+    UNIQUE (name, version)
+);
+CREATE INDEX IF NOT EXISTS metadata_container ON metadata (container);
+CREATE TABLE IF NOT EXISTS io (
+    tool_id INTEGER NOT NULL REFERENCES metadata (id) ON DELETE CASCADE,
+    direction TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT,
+    required INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    PRIMARY KEY (tool_id, direction, position)
+);
+CREATE INDEX IF NOT EXISTS io_type ON io (type);
+CREATE TABLE IF NOT EXISTS ui (
+    tool_id INTEGER NOT NULL REFERENCES metadata (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    type TEXT NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (tool_id, position)
+);
+CREATE TABLE IF NOT EXISTS hardware (
+    tool_id INTEGER PRIMARY KEY REFERENCES metadata (id) ON DELETE CASCADE,
+    has_cpu INTEGER NOT NULL,
+    cpu_type TEXT,
+    cpu_min TEXT,
+    cpu_recommended TEXT,
+    has_memory INTEGER NOT NULL,
+    memory_min TEXT,
+    memory_recommended TEXT,
+    has_gpu INTEGER NOT NULL,
+    gpu_enabled INTEGER,
+    gpu_required INTEGER,
+    gpu_type TEXT
+);
+"""
+
+_METADATA_COLUMNS = (
+    "name, version, major, minor, patch, prerelease, spec_version, container, "
+    "entrypoint, title, description, author, contact, repository, documentation, "
+    "citation"
+)
+
+
+class RegistryEntry(NamedTuple):
+    """Row of the registry, hydrated into an ICT with `ICTRegistry.load`."""
+
+    id: int
+    name: str
+    version: str
+    container: str
+
+
+class ICTRegistry:
+    """ICT objects stored in normalized tables of a SQLite database.
+
+    Opening a registry is cheap: ICTs are only rebuilt when loaded, and
+    lookups by name, version and container use indexes.
+
+    Args:
+        path: path of the SQLite database, created if missing.
+    """
+
+    def __init__(self, path: StrPath):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO registry_info VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+
+    def __enter__(self) -> "ICTRegistry":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the database on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def add(self, ict_: ICT) -> int:
+        """Store an ICT, replacing one with the same name and version."""
+        return self.add_many([ict_])
+
+    def add_many(self, icts: Iterable[ICT]) -> int:
+        """Store many ICTs in a single transaction, return how many.
+
+        When several ICTs have the same name and version, the last one is
+        stored.
+        """
+        # child rows are inserted after the loop, so each (name, version)
+        # must be inserted once: a replaced metadata row may reuse its id
+        unique: dict[tuple[str, str], ICT] = {}
+        for ict_ in icts:
+            key = (ict_.name, ict_.version.root)
+            unique.pop(key, None)
+            unique[key] = ict_
+        io_rows: list[tuple] = []
+        ui_rows: list[tuple] = []
+        hardware_rows: list[tuple] = []
+        count = 0
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for ict_ in unique.values():
+                conn.execute(
+                    "DELETE FROM metadata WHERE name = ? AND version = ?",
+                    (ict_.name, ict_.version.root),
+                )
+                info = ict_.version.info
+                cursor = conn.execute(
+                    f"INSERT INTO metadata ({_METADATA_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        ict_.name,
+                        ict_.version.root,
+                        info.major,
+                        info.minor,
+                        info.patch,
+                        info.prerelease,
+                        ict_.specVersion.root,
+                        ict_.container,
+                        str(ict_.entrypoint),
+                        ict_.title,
+                        ict_.description,
+                        json.dumps([str(author) for author in ict_.author]),
+                        str(ict_.contact),
+                        str(ict_.repository),
+                        optional_str(ict_.documentation),
+                        optional_str(ict_.citation),
+                    ),
+                )
+                tool_id = cursor.lastrowid
+                for direction in ("inputs", "outputs"):
+                    for position, io in enumerate(getattr(ict_, direction)):
+                        io_rows.append(
+                            (
+                                tool_id,
+                                direction,
+                                position,
+                                io.name,
+                                io.io_type.value,
+                                io.description,
+                                io.required,
+                                json.dumps(io.io_format),
+                            )
+                        )
+                for position, ui in enumerate(ict_.ui):
+                    item = ui.model_dump(mode="json", exclude_none=True, by_alias=True)
+                    ui_rows.append(
+                        (tool_id, position, ui.key.root, ui.ui_type, json.dumps(item))
+                    )
+                if ict_.hardware is not None:
+                    hardware_rows.append((tool_id, *hardware_row(ict_.hardware)))
+                count += 1
+            conn.executemany("INSERT INTO io VALUES (?, ?, ?, ?, ?, ?, ?, ?)", io_rows)
+            conn.executemany("INSERT INTO ui VALUES (?, ?, ?, ?, ?)", ui_rows)
+            conn.executemany(
+                "INSERT INTO hardware VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                hardware_rows,
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return count
+
+    def remove(self, name: str, version: Union[Version, str]) -> bool:
+        """Remove an ICT, return False if it was not stored."""
+        cursor = self._conn.execute(
+            "DELETE FROM metadata WHERE name = ? AND version = ?", (name, str(version))
+        )
+        return cursor.rowcount > 0
+
+    def find(
+        self,
+        name: Optional[str] = None,
+        version: Union[Version, str, None] = None,
+        container: Optional[str] = None,
+    ) -> list[RegistryEntry]:
+        """Return the entries matching every given filter, without loading them."""
+        clauses, params = [], []
+        for column, value in (
+            ("name", name),
+            ("version", version),
+            ("container", container),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(str(value))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT id, name, version, container FROM metadata {where} ORDER BY id",
+            params,
+        )
+        return [RegistryEntry(*row) for row in rows]
+
+    def versions(self, name: str) -> list[Version]:
+        """Return every stored version of `name`, in ascending order."""
+        rows = self._conn.execute(
+            "SELECT version FROM metadata WHERE name = ?", (name,)
+        )
+        return sorted(Version(version) for (version,) in rows)
+
+    def get(self, name: str, version: Union[Version, str]) -> Optional[ICT]:
+        """Return the ICT with the given name and version, if stored."""
+        entries = self.find(name=name, version=version)
+        return self.load(entries[0]) if entries else None
+
+    def load(self, entry: Union[RegistryEntry, int]) -> ICT:
+        """Rebuild the ICT of an entry (or entry id) from its rows."""
+        tool_id = entry.id if isinstance(entry, RegistryEntry) else entry
+        conn = self._conn
+        row = conn.execute("SELECT * FROM metadata WHERE id = ?", (tool_id,)).fetchone()
+        if row is None:
+            raise KeyError(tool_id)
+        data: dict[str, Any] = {
+            "specVersion": row["spec_version"],
+            "name": row["name"],
+            "version": row["version"],
+            "container": row["container"],
+            "entrypoint": row["entrypoint"],
+            "title": row["title"],
+            "description": row["description"],
+            "author": json.loads(row["author"]),
+            "contact": row["contact"],
+            "repository": row["repository"],
+            "documentation": row["documentation"],
+            "citation": row["citation"],
+            "inputs": [],
+            "outputs": [],
+        }
+        for direction, name_, type_, description_, required, format_ in conn.execute(
+            "SELECT direction, name, type, description, required, format FROM io "
+            "WHERE tool_id = ? ORDER BY direction, position",
+            (tool_id,),
+        ):
+            data[direction].append(
+                {
+                    "name": name_,
+                    "type": type_,
+                    "description": description_,
+                    "required": bool(required),
+                    "format": json.loads(format_),
+                }
+            )
+        data["ui"] = [
+            json.loads(item)
+            for (item,) in conn.execute(
+                "SELECT item FROM ui WHERE tool_id = ? ORDER BY position", (tool_id,)
+            )
+        ]
+        hardware = conn.execute(
+            "SELECT * FROM hardware WHERE tool_id = ?", (tool_id,)
+        ).fetchone()
+        if hardware is not None:
+            data["hardware"] = hardware_data(hardware)
+        # rows are only written from validated ICTs by add_many
+        return construct_ict(data)
+
+    def __iter__(self) -> Iterator[ICT]:
+        """Load every stored ICT, one at a time."""
+        for entry in self.find():
+            yield self.load(entry)
+
+    def __contains__(self, ict_: ICT) -> bool:
+        """Return True if an ICT with the same name and version is stored."""
+        return bool(self.find(name=ict_.name, version=ict_.version))
+
+    def __len__(self) -> int:
+        """Return the number of stored ICTs."""
+        return self._conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
@@ -1,5 +1,6 @@
 """Version objects."""
 
-from .semver import Version
+from .constraints import VersionConstraint
+from .semver import Version, VersionInfo
 
-__all__ = ["Version"]
+__all__ = ["Version", "VersionConstraint", "VersionInfo"]
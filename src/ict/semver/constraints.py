@@ -0,0 +1,132 @@
+# pylint: disable=E0213
+"""Version constraints."""
+
+import re
+from functools import cached_property
+from typing import NamedTuple, Optional
+
+from pydantic import RootModel, ValidationError, field_validator
+
+from .semver import Version
+
+CLAUSE_REGEX = re.compile(r"^\s*(==|!=|>=|<=|>|<|\^|~|=)?\s*([^\s,]+)\s*$")
+WILDCARDS = ("", "*")
+
+
+class Bound(NamedTuple):
+    """Lower or upper bound of a version range."""
+
+    key: tuple
+    inclusive: bool
+
+
+def _expand(operator: str, version: Version) -> list[tuple[str, Version]]:
+    """Expand caret and tilde operators into simple comparisons."""
+    major, minor, _, _ = version.info
+    if operator == "^":  # compatible with: same leftmost non-zero part
+        if major > 0:
+            upper = f"{major + 1}.0.0"
+        else:
+            upper = f"0.{minor + 1}.0"
+        return [(">=", version), ("<", Version(upper))]
+    if operator == "~":  # same major and minor
+        return [(">=", version), ("<", Version(f"{major}.{minor + 1}.0"))]
+    if operator == "=":
+        return [("==", version)]
+    return [(operator, version)]
+
+
+class VersionConstraint(RootModel):
+    """Comma separated list of version clauses that must all hold.
+
+    Each clause is an operator followed by a version, e.g.
+    `>=1.1.0,<2.0.0`. Supported operators are `==`, `!=`, `>=`, `<=`,
+    `>`, `<`, `^` (same major, or same minor for 0.y.z) and `~` (same
+    major and minor). A version without operator means `==`, and `*`
+    matches any version.
+    """
+
+    root: str
+
+    @field_validator("root")
+    @classmethod
+    def check_constraint(cls, value):
+        """Check every clause has a valid operator and version."""
+        for clause in value.split(","):
+            if clause.strip() in WILDCARDS:
+                continue
+            match = CLAUSE_REGEX.match(clause)
+            if match is None:
+                raise ValueError(f"Invalid version constraint clause ({clause}).")
+            try:
+                Version(match.group(2))
+            except ValidationError as exc:
+                raise ValueError(
+                    f"Invalid version in constraint clause ({clause})."
+                ) from exc
+        return value
+
+    @cached_property
+    def clauses(self) -> list[tuple[str, Version]]:
+        """Return the clauses as (operator, Version) pairs."""
+        clauses = []
+        for clause in self.root.split(","):
+            if clause.strip() in WILDCARDS:
+                continue
+            operator, version = CLAUSE_REGEX.match(clause).groups()  # type: ignore
+            clauses.extend(_expand(operator or "==", Version(version)))
+        return clauses
+
+    @cached_property
+    def lower(self) -> Optional[Bound]:
+        """Return the tightest lower bound, if any."""
+        bounds = [
+            Bound(ver.sort_key, op != ">")
+            for op, ver in self.clauses
+            if op in (">=", ">", "==")
+        ]
+        # highest key wins, exclusive before inclusive on ties
+        return max(bounds, key=lambda b: (b.key, not b.inclusive), default=None)
+
+    @cached_property
+    def upper(self) -> Optional[Bound]:
+        """Return the tightest upper bound, if any."""
+        bounds = [
+            Bound(ver.sort_key, op != "<")
+            for op, ver in self.clauses
+            if op in ("<=", "<", "==")
+        ]
+        # lowest key wins, exclusive before inclusive on ties
+        return min(bounds, key=lambda b: (b.key, b.inclusive), default=None)
+
+    @cached_property
+    def excluded(self) -> frozenset:
+        """Return the sort keys excluded with `!=`."""
+        return frozenset(ver.sort_key for op, ver in self.clauses if op == "!=")
+
+    def allows_key(self, key: tuple) -> bool:
+        """Return True if the version with sort key `key` satisfies the constraint."""
+        lower, upper = self.lower, self.upper
+        if lower is not None and (
+            key < lower.key or (key == lower.key and not lower.inclusive)
+        ):
+            return False
+        if upper is not None and (
+            key > upper.key or (key == upper.key and not upper.inclusive)
+        ):
+            return False
+        return key not in self.excluded
+
+    def __contains__(self, version) -> bool:
+        """Return True if `version` (Version or str) satisfies the constraint."""
+        if not isinstance(version, Version):
+            version = Version(version)
+        return self.allows_key(version.sort_key)
+
+    def __str__(self) -> str:
+        """Return string representation of VersionConstraint object."""
+        return self.root
+
+    def __repr__(self) -> str:
+        """Return string representation of VersionConstraint object."""
+        return self.root
@@ -2,12 +2,16 @@
 """SemVer object."""
 # TODO make this better in JSON schema
 import re
-from functools import singledispatchmethod
-from typing import Any, Union
+from functools import cached_property, lru_cache
+from typing import Any, NamedTuple, Optional, Union
 
 from pydantic import RootModel, field_validator
 
+NUMBER_REGEX = re.compile(r"^\d+$")
+IDENTIFIER_REGEX = re.compile("[0-9A-Za-z-]+")
 
+
+@lru_cache(maxsize=4096)
 def _check_version_number(value: Union[str, int]) -> bool:
     if isinstance(value, int):
         value = str(value)
@@ -15,7 +19,55 @@ def _check_version_number(value: Union[str, int]) -> bool:
         value = value.split("-")[0]
     if len(value) > 1 and value[0] == "0":
         return False
-    return bool(re.match(r"^\d+$", value))
+    return bool(NUMBER_REGEX.match(value))
+
+
+@lru_cache(maxsize=4096)
+def _is_semver(value: str) -> bool:
+    """Return True if `value` is a valid x.y.z[-identifier] version."""
+    version = value.split(".")
+    if not len(version) == 3:  # ruff: noqa: PLR2004
+        return False
+    if "-" in version[0] or "-" in version[1]:  # prerelease only after z
+        return False
+    if "-" in version[-1]:  # with hyphen
+        idn = version[-1].split("-")[-1]
+        if not IDENTIFIER_REGEX.match(idn):
+            return False
+    return all(map(_check_version_number, version))
+
+
+class VersionInfo(NamedTuple):
+    """Parsed x.y.z[-prerelease] version."""
+
+    major: int
+    minor: int
+    patch: int
+    prerelease: Optional[str] = None
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(value: str) -> VersionInfo:
+    """Parse a valid version string."""
+    major, minor, patch = value.split(".")
+    patch, _, prerelease = patch.partition("-")
+    return VersionInfo(int(major), int(minor), int(patch), prerelease or None)
+
+
+@lru_cache(maxsize=4096)
+def _sort_key(value: str) -> tuple:
+    """Return the precedence key of a valid version string.
+
+    A prerelease has lower precedence than the associated release.
+    Numeric prerelease identifiers compare as integers and have lower
+    precedence than alphanumeric ones, which compare lexically.
+    """
+    major, minor, patch, prerelease = _parse_version(value)
+    if prerelease is None:
+        return (major, minor, patch, 1, ())
+    if prerelease.isdigit():
+        return (major, minor, patch, 0, (0, int(prerelease)))
+    return (major, minor, patch, 0, (1, prerelease))
 
 
 class Version(RootModel):
@@ -30,115 +82,82 @@ class Version(RootModel):
         value,
     ):  # ruff: noqa: ANN202, N805, ANN001
         """Pydantic Validator to check semver."""
-        version = value.split(".")
-
-        if not len(version) == 3:  # ruff: noqa: PLR2004
-            raise ValueError(
-                f"""Invalid version ({value}). 
-            Version must follow semantic versioning (see semver.org)"""
-            )
-        if "-" in version[-1]:  # with hyphen
-            idn = version[-1].split("-")[-1]
-            id_reg = re.compile("[0-9A-Za-z-]+")
-            assert bool(
-                id_reg.match(idn),
-            ), f"""Invalid version ({value}).
-                Version must follow semantic versioning (see semver.org)"""
-
-        if not all(map(_check_version_number, version)):
+        if not _is_semver(value):
             raise ValueError(
                 f"""Invalid version ({value}).
                 Version must follow semantic versioning (see semver.org)"""
             )
         return value
 
+    @cached_property
+    def info(self) -> VersionInfo:
+        """Return the version parsed into integers and a prerelease identifier."""
+        return _parse_version(self.root)
+
+    @cached_property
+    def sort_key(self) -> tuple:
+        """Return a tuple that orders versions by semver precedence.
+
+        Useful to sort many versions, e.g. `sorted(v, key=attrgetter("sort_key"))`.
+        """
+        return _sort_key(self.root)
+
     @property
     def major(self):
         """Return x from x.y.z ."""
-        return self.root.split(".")[0]
+        return str(self.info.major)
 
     @property
     def minor(self):
         """Return y from x.y.z ."""
-        return self.root.split(".")[1]
+        return str(self.info.minor)
 
     @property
     def patch(self):
         """Return z from x.y.z ."""
-        return self.root.split(".")[2]
+        return str(self.info.patch)
 
     def __str__(self) -> str:
         """Return string representation of Version object."""
         return self.root
 
-    @singledispatchmethod
+    def __eq__(self, other: Any) -> bool:
+        """Compare if two Version objects are equal."""
+        return self.sort_key == _other_key(other)
+
     def __lt__(self, other: Any) -> bool:
         """Compare if Version is less than other object."""
-        msg = "invalid type for comparison."
-        raise TypeError(msg)
+        return self.sort_key < _other_key(other)
+
+    def __le__(self, other: Any) -> bool:
+        """Compare if Version is less than or equal to other object."""
+        return self.sort_key <= _other_key(other)
 
-    @singledispatchmethod
     def __gt__(self, other: Any) -> bool:
-        """Compare if Version is less than other object."""
-        msg = "invalid type for comparison."
-        raise TypeError(msg)
+        """Compare if Version is greater than other object."""
+        return self.sort_key > _other_key(other)
 
-    @singledispatchmethod
-    def __eq__(self, other: Any) -> bool:
-        """Compare if two Version objects are equal."""
-        msg = "invalid type for comparison."
-        raise TypeError(msg)
+    def __ge__(self, other: Any) -> bool:
+        """Compare if Version is greater than or equal to other object."""
+        return self.sort_key >= _other_key(other)
 
     def __hash__(self) -> int:
-        """Needed to use Version objects as dict keys."""
-        return hash(self.root)
+        """Needed to use Version objects as dict keys.
+
+        Hashes the precedence key, consistently with `__eq__`.
+        """
+        return hash(self.sort_key)
 
     def __repr__(self) -> str:
         """Return string representation of Version object."""
         return self.root
 
 
-@Version.__eq__.register(Version)  # pylint: disable=no-member
-def _(self, other):
-    return (
-        other.major == self.major
-        and other.minor == self.minor
-        and other.patch == self.patch
-    )
-
-
-@Version.__eq__.register(str)  # pylint: disable=no-member
-def _(self, other):
-    return self == Version(other)
-
-
-@Version.__lt__.register(Version)  # pylint: disable=no-member
-def _(self, other):
-    if other.major > self.major:
-        return True
-    if other.major == self.major:
-        if other.minor > self.minor:
-            return True
-        if other.minor == self.minor:
-            if other.patch > self.patch:
-                return True
-            return False
-        return False
-    return False
-
-
-@Version.__lt__.register(str)  # pylint: disable=no-member
-def _(self, other):
-    v = Version(other)
-    return self < v
-
-
-@Version.__gt__.register(Version)  # pylint: disable=no-member
-def _(self, other):
-    return other < self
-
-
-@Version.__gt__.register(str)  # pylint: disable=no-member
-def _(self, other):
-    v = Version(other)
-    return self > v
+def _other_key(other: Any) -> tuple:
+    """Return the sort key of the right-hand side of a comparison."""
+    if isinstance(other, Version):
+        return other.sort_key
+    if isinstance(other, str):
+        return Version(other).sort_key
+    msg = "invalid type for comparison."
+    raise TypeError(msg)
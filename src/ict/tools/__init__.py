@@ -1,4 +1,4 @@
 """CWL generation for ICT objects."""
-from .cwl_ict import clt_dict
+from .cwl_ict import cached_clt_dict, clear_clt_cache, clt_dict, to_clt_many
 
-__all__ = ["clt_dict"]
+__all__ = ["cached_clt_dict", "clear_clt_cache", "clt_dict", "to_clt_many"]
@@ -1,9 +1,14 @@
 """CWL generation for ICT objects.""" ""
 
+from collections.abc import Iterable
 from typing import TypeVar
 
 ICT = TypeVar("ICT")
 
+# maximum number of CommandLineTools kept by `cached_clt_dict`
+CLT_CACHE_SIZE = 4096
+_clt_cache: dict[tuple, dict] = {}
+
 
 def requirements(ict_: ICT, network_access: bool) -> dict:
     """Return the requirements from an ICT object."""
@@ -36,3 +41,45 @@ def clt_dict(ict_: ICT, network_access: bool) -> dict:
         "requirements": requirements(ict_, network_access),
     }
     return clt_
+
+
+def _clt_content(ict_: ICT) -> tuple:
+    """Return the content of an ICT its CommandLineTool is built from."""
+    return (
+        ict_.container,  # type: ignore
+        tuple((io.name, io.io_type, io.required) for io in ict_.inputs),  # type: ignore
+        tuple((io.name, io.io_type, io.required) for io in ict_.outputs),  # type: ignore
+    )
+
+
+def cached_clt_dict(ict_: ICT, network_access: bool) -> dict:
+    """Return `clt_dict(ict_, network_access)`, memoized on the ICT content.
+
+    The cache key is made of the fields the CommandLineTool depends on, so
+    a modified ICT never gets a stale result. The returned dict is shared
+    between calls and must not be modified, copy it first if needed.
+    """
+    key = (_clt_content(ict_), network_access)
+    clt_ = _clt_cache.get(key)
+    if clt_ is None:
+        clt_ = clt_dict(ict_, network_access)
+        if len(_clt_cache) >= CLT_CACHE_SIZE:
+            # evict the oldest entry
+            _clt_cache.pop(next(iter(_clt_cache)), None)
+        _clt_cache[key] = clt_
+    return clt_
+
+
+def clear_clt_cache() -> None:
+    """Empty the cache of `cached_clt_dict`."""
+    _clt_cache.clear()
+
+
+def to_clt_many(icts: Iterable[ICT], network_access: bool = False) -> list[dict]:
+    """Return the CommandLineTool of every ICT, in order.
+
+    ICTs with the same content share one CommandLineTool, which is only
+    built once. The returned dicts are shared with the cache and must not
+    be modified.
+    """
+    return [cached_clt_dict(ict_, network_access) for ict_ in icts]
@@ -0,0 +1,79 @@
+"""Load already validated ICT objects without validating them again.
+
+`dumps_trusted` serializes a validated ICT as JSON, preceded by a header
+line holding a digest of the JSON. `loads_trusted` checks the digest and
+rebuilds the ICT without running any validator.
+
+Without a key the digest is a plain SHA-256, which anyone can recompute
+over modified data: it only catches accidental corruption, such as a
+truncated file, and the data must come from a source you trust. With a
+secret `key` the digest is an HMAC, which also proves the data was
+produced by a holder of the key, so it can be kept in storage that other
+processes can write to.
+"""
+
+import hashlib
+import hmac
+import json
+from typing import Optional
+
+from ict._construct import construct_ict
+from ict._version import __version__
+from ict.model import ICT
+
+TRUSTED_FORMAT = 1
+
+# the layout of the JSON follows the models, so it is tied to the library version
+_PREFIX = f"ict-trusted/{TRUSTED_FORMAT} ict={__version__} ".encode("ascii")
+
+
+def _digest(payload: bytes, key: Optional[bytes]) -> bytes:
+    """Return the header field holding the digest of `payload`.
+
+    The SHA-256 digest only detects corruption, the HMAC also detects
+    tampering by anyone without the key.
+    """
+    if key is None:
+        return b"sha256=" + hashlib.sha256(payload).hexdigest().encode("ascii")
+    return b"hmac-sha256=" + hmac.new(key, payload, hashlib.sha256).hexdigest().encode(
+        "ascii"
+    )
+
+
+def dumps_trusted(ict_: ICT, key: Optional[bytes] = None) -> bytes:
+    """Serialize a validated ICT with a digest of its content.
+
+    Args:
+        ict_: validated ICT.
+        key: optional secret, the digest is then a HMAC-SHA256. Without
+            it, only load the data back from a trusted source.
+    """
+    payload = ict_.model_dump_json(by_alias=True).encode("utf-8")
+    return _PREFIX + _digest(payload, key) + b"\n" + payload
+
+
+def loads_trusted(data: bytes, key: Optional[bytes] = None) -> ICT:
+    """Rebuild an ICT from `dumps_trusted` output, without validation.
+
+    Without `key`, the data must come from a trusted source, since the
+    digest only catches accidental corruption.
+
+    Args:
+        data: bytes returned by `dumps_trusted`.
+        key: secret given to `dumps_trusted`, if any.
+
+    Raises:
+        ValueError: if the header is invalid, the data was produced by
+            another version of the library, or the digest does not match.
+    """
+    header, sep, payload = data.partition(b"\n")
+    if not sep or not header.startswith(b"ict-trusted/"):
+        raise ValueError("Not a trusted ICT: missing header")
+    if not header.startswith(_PREFIX):
+        raise ValueError(
+            f"Trusted ICT written by another library version: {header!r}, "
+            f"expected {_PREFIX.decode('ascii')!r}"
+        )
+    if not hmac.compare_digest(header[len(_PREFIX) :], _digest(payload, key)):
+        raise ValueError("Trusted ICT digest mismatch, the content was modified")
+    return construct_ict(json.loads(payload))
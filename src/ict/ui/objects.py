@@ -6,6 +6,8 @@ from typing import Annotated, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, RootModel, field_validator
 
+CONDITION_REGEX = re.compile(r"^(inputs|outputs)\.\w+(==|!=|<|>|<=|>=|&&)'?\w+'?$")
+
 
 class UIKey(RootModel):
     """UIKey object."""
@@ -55,9 +57,7 @@ class ConditionalStatement(RootModel):
     @classmethod
     def check_conditional_statement(cls, value):
         """Check the conditional statement follows the correct format."""
-        if not bool(
-            re.match(r"^(inputs|outputs)\.\w+(==|!=|<|>|<=|>=|&&)'?\w+'?$", value)
-        ):
+        if not bool(CONDITION_REGEX.match(value)):
             raise ValueError(
                 "The conditional statement must be in the format <inputs or outputs>.<parameter name><operator><value>"
             )
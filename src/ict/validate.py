@@ -1,11 +1,33 @@
+"""Validation of ICT specifications."""
+
 import json
+import os
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
 from functools import singledispatch
 from pathlib import Path
-from typing import Any
+from typing import IO, Annotated, Any, Optional, TypeVar, Union
+
+from pydantic import BaseModel, Field, ValidationError
+
+from ict._construct import UI_MODELS
+from ict._yaml import YAMLError, safe_load, safe_load_all
+from ict.cache import CachedValidationError, ValidationCache
+from ict.io import IO as ICTIO
+from ict.model import ICT, IOUIError, IOUIErrorTuple, io_ui_errors
+from ict.ui import UIItem
 
-from yaml import safe_load
+T = TypeVar("T")
 
-from ict.model import ICT
+# suffixes of the ICT manifest files
+SUFFIXES = (".yaml", ".yml", ".json")
+_JSONL_SUFFIXES = (".jsonl", ".ndjson")
+_IO_UI_RECORD_MESSAGES = {
+    "ui_unmatched": "The ui key does not match any input or output: {}",
+    "duplicate_io": "Duplicated input/output name: {}",
+    "duplicate_ui": "Duplicated ui key: {}",
+}
 
 
 @singledispatch
@@ -15,34 +37,440 @@ def validate(file: Any) -> ICT:
 
 
 @validate.register  # no Union[Path, str] <3.11
-def _(file: str) -> ICT:
+def _(file: str, cache: Optional[ValidationCache] = None) -> ICT:
     """Validate an ICT specification."""
-    if str(file).endswith(".yaml") or str(file).endswith(".yml"):
-        with open(file, "r", encoding="utf-8") as f_o:
-            data = safe_load(f_o)
-    elif str(file).endswith(".json"):
-        with open(file, "r", encoding="utf-8") as f_o:
-            data = json.load(f_o)
-    else:
-        raise ValueError(f"File extension not supported: {file}")
-    return validate(data)
+    return validate(Path(file), cache=cache)
 
 
 @validate.register  # no Union[Path, str] <3.11
-def _(file: Path) -> ICT:
-    """Validate an ICT specification."""
-    if str(file).endswith(".yaml") or str(file).endswith(".yml"):
-        with open(file, "r", encoding="utf-8") as f_o:
-            data = safe_load(f_o)
-    elif str(file).endswith(".json"):
-        with open(file, "r", encoding="utf-8") as f_o:
-            data = json.load(f_o)
-    else:
+def _(file: Path, cache: Optional[ValidationCache] = None) -> ICT:
+    """Validate an ICT specification.
+
+    If a `ValidationCache` is given, the result of validating a file
+    with the same content is returned from the cache when available, and
+    an invalid file raises `CachedValidationError` on every call.
+    """
+    if file.suffix not in SUFFIXES:
         raise ValueError(f"File extension not supported: {file}")
-    return validate(data)
+    if cache is None:
+        with open(file, "r", encoding="utf-8") as f_o:
+            data = safe_load(f_o) if file.suffix != ".json" else json.load(f_o)
+        return validate(data)
+    raw = file.read_bytes()
+    key = cache.key(raw, file.suffix)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    try:
+        data = safe_load(raw) if file.suffix != ".json" else json.loads(raw)
+        ict_ = validate(data)
+    except (ValueError, YAMLError) as exc:
+        failure = ValidationFailure.from_exception(exc)
+        records = [record.model_dump() for record in failure.records]
+        cache.put_error(
+            key, failure.error_type, failure.message, failure.details, records
+        )
+        raise CachedValidationError(
+            failure.error_type, failure.message, failure.details, records
+        ) from exc
+    cache.put(key, ict_)
+    return ict_
 
 
 @validate.register
 def _(ict: dict) -> ICT:
     """Validate an ICT specification."""
     return ICT(**ict)
+
+
+class ErrorRecord(BaseModel):
+    """One problem found in an ICT specification."""
+
+    pointer: str = Field(
+        description="JSON pointer (RFC 6901) to the invalid value, "
+        "empty for the whole document."
+    )
+    code: str = Field(description="Machine-readable error code, e.g. `missing`.")
+    message: str = Field(description="Human-readable error message.")
+
+
+def _pointer(loc: Iterable[Union[str, int]]) -> str:
+    """Return the JSON pointer of a pydantic error location."""
+    loc = list(loc)
+    if len(loc) > 2 and loc[0] == "ui" and loc[2] in UI_MODELS:
+        del loc[2]  # type of the ui item, used to select its model
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in loc
+    )
+
+
+def _io_ui_records(errors: list[IOUIErrorTuple]) -> list[ErrorRecord]:
+    """Return the records of io/ui mismatches."""
+    return [
+        ErrorRecord(
+            pointer=pointer,
+            code=code,
+            message=_IO_UI_RECORD_MESSAGES[code].format(subject),
+        )
+        for pointer, code, subject in errors
+    ]
+
+
+def _error_records(errors: list[dict]) -> list[ErrorRecord]:
+    """Return the records of pydantic errors, with or without context."""
+    records = []
+    for err in errors:
+        cause = err.get("ctx", {}).get("error")
+        if isinstance(cause, IOUIError):
+            records.extend(_io_ui_records(cause.errors))
+            continue
+        records.append(
+            ErrorRecord(
+                pointer=_pointer(err["loc"]),
+                code=err["type"],
+                message=str(cause) if isinstance(cause, Exception) else err["msg"],
+            )
+        )
+    return records
+
+
+def _exception_records(exc: Exception) -> list[ErrorRecord]:
+    """Return the records of an exception raised by validation."""
+    if isinstance(exc, ValidationError):
+        return _error_records(exc.errors(include_url=False, include_input=False))
+    if isinstance(exc, CachedValidationError):
+        if exc.records is not None:
+            return [ErrorRecord(**record) for record in exc.records]
+        if exc.details:
+            return _error_records(exc.details)
+    code = (
+        "parse_error"
+        if isinstance(exc, (YAMLError, json.JSONDecodeError))
+        else "invalid"
+    )
+    return [ErrorRecord(pointer="", code=code, message=str(exc))]
+
+
+class ValidationFailure(BaseModel):
+    """Structured description of a failed validation."""
+
+    error_type: str = Field(description="Name of the exception raised.")
+    message: str = Field(description="Human-readable error message.")
+    details: list[dict] = Field(
+        default_factory=list,
+        description="Per-field errors reported by pydantic, if any.",
+    )
+    records: list[ErrorRecord] = Field(
+        default_factory=list, description="One record per problem found."
+    )
+
+    @classmethod
+    def from_exception(cls, exc: Exception) -> "ValidationFailure":
+        """Build a ValidationFailure from a raised exception."""
+        records = _exception_records(exc)
+        if isinstance(exc, CachedValidationError):
+            return cls(
+                error_type=exc.error_type,
+                message=str(exc),
+                details=exc.details,
+                records=records,
+            )
+        details: list[dict] = []
+        if isinstance(exc, ValidationError):
+            details = [
+                dict(err)
+                for err in exc.errors(
+                    include_url=False, include_context=False, include_input=False
+                )
+            ]
+        return cls(
+            error_type=type(exc).__name__,
+            message=str(exc),
+            details=details,
+            records=records,
+        )
+
+
+def _raw_io_ui_errors(data: dict) -> list[ErrorRecord]:
+    """Return the io/ui mismatches of a document that failed validation."""
+
+    def values(field: str, key: str) -> list:
+        items = data.get(field)
+        if not isinstance(items, list):
+            return []
+        return [item.get(key) if isinstance(item, dict) else None for item in items]
+
+    return _io_ui_records(
+        io_ui_errors(
+            values("inputs", "name"), values("outputs", "name"), values("ui", "key")
+        )
+    )
+
+
+class _FailFastICT(ICT):
+    """ICT whose lists stop validating at their first invalid item."""
+
+    inputs: Annotated[list[ICTIO], Field(fail_fast=True)]
+    outputs: Annotated[list[ICTIO], Field(fail_fast=True)]
+    ui: Annotated[list[UIItem], Field(fail_fast=True)]
+
+
+def check(spec: Any, fail_fast: bool = False) -> list[ErrorRecord]:
+    """Return every problem of an ICT specification, an empty list if valid.
+
+    Unlike `validate`, which raises on invalid specifications, the
+    problems are returned as records pointing to the invalid values. The
+    ui/io mismatches are reported even when other fields are invalid.
+
+    Args:
+        spec: specification as a dict, or path of a `.yaml`, `.yml` or
+            `.json` file.
+        fail_fast: return the first problem only. Validation of the
+            inputs, outputs and ui stops at their first invalid item.
+    """
+    if isinstance(spec, (str, Path)):
+        path = Path(spec)
+        if path.suffix not in SUFFIXES:
+            return [
+                ErrorRecord(
+                    pointer="",
+                    code="invalid",
+                    message=f"File extension not supported: {path}",
+                )
+            ]
+        try:
+            raw = path.read_bytes()
+            spec = safe_load(raw) if path.suffix != ".json" else json.loads(raw)
+        except (OSError, ValueError, YAMLError) as exc:
+            return _exception_records(exc)
+    try:
+        (_FailFastICT if fail_fast else ICT).model_validate(spec)
+    except ValidationError as exc:
+        records = _error_records(exc.errors(include_url=False, include_input=False))
+        if fail_fast:
+            return records[:1]
+        if isinstance(spec, dict) and not any(
+            record.code in _IO_UI_RECORD_MESSAGES for record in records
+        ):
+            records.extend(_raw_io_ui_errors(spec))
+        return records
+    return []
+
+
+class ValidationResult(BaseModel):
+    """Outcome of validating a single ICT specification."""
+
+    source: str = Field(description="Where the specification was read from.")
+    index: Optional[int] = Field(
+        None, description="Position of the document in a multi-document stream."
+    )
+    ict: Optional[ICT] = Field(None, description="Validated ICT, if successful.")
+    error: Optional[ValidationFailure] = Field(
+        None, description="Failure description, if unsuccessful."
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the specification is valid."""
+        return self.error is None
+
+
+def find_manifests(paths: Iterable[Union[str, Path]]) -> list[Path]:
+    """Return the manifest files of `paths`, in order.
+
+    Directories are replaced by the files below them with one of
+    `SUFFIXES`, sorted. Other paths are kept as they are.
+    """
+    manifests: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            manifests.extend(
+                source
+                for source in sorted(path.rglob("*"))
+                if source.suffix in SUFFIXES and source.is_file()
+            )
+        else:
+            manifests.append(path)
+    return manifests
+
+
+def _validate_path(
+    path: Path, cache: Optional[ValidationCache] = None
+) -> ValidationResult:
+    """Validate one file, capturing any error in the result."""
+    try:
+        return ValidationResult(source=str(path), ict=validate(path, cache=cache))
+    except Exception as exc:  # pylint: disable=broad-except
+        return ValidationResult(
+            source=str(path), error=ValidationFailure.from_exception(exc)
+        )
+
+
+def _run_chunked(
+    func: Callable[..., list[T]],
+    tasks: Sequence[Any],
+    workers: int,
+    *args: Any,
+    chunksize: Optional[int] = None,
+    on_error: Callable[[Any, ValidationFailure], T],
+) -> Iterator[tuple[int, list[T]]]:
+    """Run `func(chunk, *args)` over chunks of `tasks` in a process pool.
+
+    Yields `(start, results)` as each chunk completes, `start` being the
+    position of its first task. If a worker fails, e.g. because it was
+    killed, `on_error(task, failure)` gives the result of every task of
+    its chunk. Closing the iterator cancels the chunks not started yet.
+    """
+    if chunksize is None:
+        # give each worker several chunks
+        chunksize = max(1, min(64, len(tasks) // (workers * 4)))
+    starts = range(0, len(tasks), chunksize)
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(starts)))
+    try:
+        futures = {
+            pool.submit(func, tasks[start : start + chunksize], *args): start
+            for start in starts
+        }
+        for future in as_completed(futures):
+            start = futures[future]
+            try:
+                results = future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                failure = ValidationFailure.from_exception(exc)
+                results = [
+                    on_error(task, failure) for task in tasks[start : start + chunksize]
+                ]
+            yield start, results
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _validate_chunk(
+    paths: list[Path], cache: Optional[ValidationCache] = None
+) -> list[ValidationResult]:
+    """Validate a chunk of files inside a worker process."""
+    results = [_validate_path(path, cache) for path in paths]
+    if cache is not None:
+        cache.close()
+    return results
+
+
+def validate_many(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    cache: Optional[ValidationCache] = None,
+    fail_fast: bool = False,
+) -> Iterator[ValidationResult]:
+    """Validate many ICT specifications in parallel.
+
+    Files are distributed over a process pool in chunks and results are
+    yielded as soon as each chunk completes, so the order of results is
+    not the order of `paths`. A file that fails to validate produces a
+    `ValidationResult` with `error` set and never aborts the batch.
+
+    Args:
+        paths: files to validate (`.yaml`, `.yml` or `.json`).
+        workers: number of worker processes. Defaults to the number
+            of CPUs. With `workers=1` validation runs in this process.
+        chunksize: number of files sent to a worker at once. Defaults
+            to a value that gives each worker several chunks.
+        cache: optional `ValidationCache` shared by all workers. Hit and
+            miss counters are only updated when `workers=1`.
+        fail_fast: stop after the first invalid file, e.g. to gate CI.
+            Files of chunks already running are still validated, but
+            their results are not yielded.
+
+    Returns: iterator of `ValidationResult`.
+    """
+    paths_ = [Path(path) for path in paths]
+    workers_ = workers or os.cpu_count() or 1
+    if workers_ == 1 or len(paths_) <= 1:
+        for path in paths_:
+            result = _validate_path(path, cache)
+            yield result
+            if fail_fast and not result.ok:
+                return
+        return
+    chunks = _run_chunked(
+        _validate_chunk,
+        paths_,
+        workers_,
+        cache,
+        chunksize=chunksize,
+        on_error=lambda path, failure: ValidationResult(
+            source=str(path), error=failure
+        ),
+    )
+    with closing(chunks):
+        for _, results in chunks:
+            for result in results:
+                yield result
+                if fail_fast and not result.ok:
+                    return
+
+
+def _validate_document(source: str, index: int, data: Any) -> ValidationResult:
+    """Validate one parsed document, capturing any error in the result."""
+    try:
+        return ValidationResult(source=source, index=index, ict=validate(data))
+    except Exception as exc:  # pylint: disable=broad-except
+        return ValidationResult(
+            source=source, index=index, error=ValidationFailure.from_exception(exc)
+        )
+
+
+def iter_validate(stream: IO, fmt: Optional[str] = None) -> Iterator[ValidationResult]:
+    """Validate every ICT specification in a stream, one at a time.
+
+    Documents are parsed incrementally, so memory use is bounded by the
+    largest document rather than by the size of the stream.
+
+    Args:
+        stream: file object holding a multi-document YAML stream
+            (documents separated by `---`) or JSON Lines (one JSON
+            object per line).
+        fmt: `"yaml"` or `"jsonl"`. Inferred from the name of the
+            stream if omitted, defaulting to `"yaml"`.
+
+    Returns: iterator of `ValidationResult`, in stream order. A YAML
+        syntax error ends the stream, since the parser cannot resume
+        after it; invalid JSON lines are reported and skipped.
+    """
+    source = str(getattr(stream, "name", "<stream>"))
+    if fmt is None:
+        fmt = "jsonl" if source.endswith(_JSONL_SUFFIXES) else "yaml"
+    if fmt == "jsonl":
+        for index, line in enumerate(stream):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as exc:
+                yield ValidationResult(
+                    source=source,
+                    index=index,
+                    error=ValidationFailure.from_exception(exc),
+                )
+                continue
+            yield _validate_document(source, index, data)
+    elif fmt == "yaml":
+        index = 0
+        documents = safe_load_all(stream)
+        while True:
+            try:
+                data = next(documents)
+            except StopIteration:
+                return
+            except YAMLError as exc:
+                yield ValidationResult(
+                    source=source,
+                    index=index,
+                    error=ValidationFailure.from_exception(exc),
+                )
+                return
+            if data is not None:  # empty document, e.g. a trailing `---`
+                yield _validate_document(source, index, data)
+            index += 1
+    else:
+        raise ValueError(f"Stream format not supported: {fmt}")
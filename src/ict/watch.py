@@ -0,0 +1,174 @@
+"""Re-validate ICT manifests of a directory tree as they change."""
+
+import hashlib
+import json
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal, NamedTuple, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from ict._yaml import safe_load
+from ict.model import ICT
+from ict.validate import SUFFIXES, ValidationFailure, validate
+
+StrPath = TypeVar("StrPath", str, Path)
+
+
+class _FileState(NamedTuple):
+    """What is known about a watched manifest."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+    ict: Optional[ICT]  # last valid content, kept while the file is invalid
+    error: Optional[ValidationFailure]
+
+
+def _validate_raw(
+    path: Path, raw: bytes
+) -> tuple[Optional[ICT], Optional[ValidationFailure]]:
+    """Validate the content of a manifest, capturing any error."""
+    try:
+        data = json.loads(raw) if path.suffix == ".json" else safe_load(raw)
+        return validate(data), None
+    except Exception as exc:  # pylint: disable=broad-except
+        return None, ValidationFailure.from_exception(exc)
+
+
+class WatchEvent(BaseModel):
+    """Change of a watched manifest, with its validation status."""
+
+    source: str = Field(description="Path of the manifest.")
+    change: Literal["added", "modified", "removed"] = Field(
+        description="What happened to the file."
+    )
+    ok: Optional[bool] = Field(
+        None, description="Whether the file is valid now, None if removed."
+    )
+    was_ok: Optional[bool] = Field(
+        None, description="Whether the file was valid before, None if added."
+    )
+    error: Optional[ValidationFailure] = Field(
+        None, description="Failure description, if the file is invalid."
+    )
+
+    @property
+    def status(self) -> str:
+        """Return a short description of the change of validation status."""
+        if self.change == "removed":
+            return "removed"
+        if self.was_ok is None or self.ok == self.was_ok:
+            return "valid" if self.ok else "invalid"
+        return "fixed" if self.ok else "broken"
+
+
+class ManifestWatcher:
+    """Track the manifests below a directory and re-validate the changed ones.
+
+    Changes are found by polling: a file is only read again when its
+    modification time or size changed, and only validated again when
+    the hash of its content changed. The last valid ICT of each file is
+    kept, so a file being edited into an invalid state does not lose it.
+
+    Args:
+        root: directory of the manifests (`.yaml`, `.yml` or `.json`).
+    """
+
+    def __init__(self, root: StrPath):
+        self.root = Path(root)
+        self._files: dict[Path, _FileState] = {}
+
+    def scan(self) -> list[WatchEvent]:
+        """Look for changed manifests once, return what changed."""
+        events: list[WatchEvent] = []
+        seen: set[Path] = set()
+        for path in sorted(self.root.rglob("*")):
+            if path.suffix not in SUFFIXES:
+                continue
+            try:
+                stat = path.stat()
+                if not path.is_file():
+                    continue
+                state = self._files.get(path)
+                seen.add(path)
+                if (
+                    state is not None
+                    and state.mtime_ns == stat.st_mtime_ns
+                    and state.size == stat.st_size
+                ):
+                    continue
+                raw = path.read_bytes()
+            except OSError:  # removed while scanning
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            if state is not None and state.digest == digest:
+                self._files[path] = state._replace(
+                    mtime_ns=stat.st_mtime_ns, size=stat.st_size
+                )
+                continue
+            ict_, error = _validate_raw(path, raw)
+            self._files[path] = _FileState(
+                stat.st_mtime_ns,
+                stat.st_size,
+                digest,
+                ict_ if ict_ is not None else state and state.ict,
+                error,
+            )
+            events.append(
+                WatchEvent(
+                    source=str(path),
+                    change="added" if state is None else "modified",
+                    ok=error is None,
+                    was_ok=None if state is None else state.error is None,
+                    error=error,
+                )
+            )
+        for path in [path for path in self._files if path not in seen]:
+            state = self._files.pop(path)
+            events.append(
+                WatchEvent(
+                    source=str(path), change="removed", was_ok=state.error is None
+                )
+            )
+        return events
+
+    def watch(self, interval: float = 1.0) -> Iterator[list[WatchEvent]]:
+        """Scan every `interval` seconds, yield the changes of each scan.
+
+        The first scan reports every manifest as added.
+        """
+        while True:
+            events = self.scan()
+            if events:
+                yield events
+            time.sleep(interval)
+
+    def last_good(self, path: StrPath) -> Optional[ICT]:
+        """Return the last valid ICT of a manifest, if it was ever valid."""
+        state = self._files.get(Path(path))
+        return None if state is None else state.ict
+
+    @property
+    def icts(self) -> dict[Path, ICT]:
+        """Return the last valid ICT of every manifest that has one."""
+        return {
+            path: state.ict
+            for path, state in self._files.items()
+            if state.ict is not None
+        }
+
+    @property
+    def valid(self) -> int:
+        """Return the number of manifests currently valid."""
+        return sum(state.error is None for state in self._files.values())
+
+    @property
+    def errors(self) -> dict[Path, ValidationFailure]:
+        """Return the failure of every manifest currently invalid."""
+        return {
+            path: state.error
+            for path, state in self._files.items()
+            if state.error is not None
+        }
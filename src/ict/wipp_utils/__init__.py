@@ -1,13 +1,36 @@
 """Utils for conversion from WIPP to ICT."""
 
+from .batch import (
+    WIPPConversionReport,
+    WIPPConversionResult,
+    convert_wipp_file,
+    convert_wipp_many,
+)
 from .hardware import convert_wipp_hardware_to_ict
 from .io import convert_wipp_io_to_ict
 from .metadata import convert_wipp_metadata_to_ict
-from .ui import convert_wipp_ui_to_ict
+from .objects import (
+    WIPPUI,
+    WIPPInput,
+    WIPPOutput,
+    WIPPPlugin,
+    WIPPResourceRequirements,
+)
+from .ui import convert_wipp_ui_list, convert_wipp_ui_to_ict
 
 __all__ = [
+    "WIPPPlugin",
+    "WIPPInput",
+    "WIPPOutput",
+    "WIPPUI",
+    "WIPPResourceRequirements",
+    "WIPPConversionReport",
+    "WIPPConversionResult",
+    "convert_wipp_file",
+    "convert_wipp_many",
     "convert_wipp_hardware_to_ict",
     "convert_wipp_io_to_ict",
     "convert_wipp_metadata_to_ict",
+    "convert_wipp_ui_list",
     "convert_wipp_ui_to_ict",
 ]
@@ -0,0 +1,207 @@
+"""Batch conversion of WIPP plugin manifests to ICT."""
+
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional, TypeVar, Union
+
+from pydantic import BaseModel, Field
+
+from ict.model import ICT
+from ict.validate import ValidationFailure, _run_chunked
+
+from .hardware import convert_wipp_hardware_to_ict
+from .io import convert_wipp_io_to_ict
+from .metadata import convert_wipp_metadata_to_ict
+from .objects import WIPPPlugin
+from .ui import convert_wipp_ui_list
+
+StrPath = TypeVar("StrPath", str, Path)
+
+STAGES = ("load", "convert", "validate", "write")
+
+
+class WIPPConversionResult(BaseModel):
+    """Outcome of converting one WIPP manifest."""
+
+    source: str = Field(description="Path of the WIPP manifest.")
+    output: Optional[str] = Field(None, description="Path of the ICT YAML written.")
+    defaults: list[str] = Field(
+        default_factory=list,
+        description="Fields that could not be converted and were set to a default.",
+    )
+    timings: dict[str, float] = Field(
+        default_factory=dict, description="Duration of each stage, in seconds."
+    )
+    error: Optional[ValidationFailure] = Field(
+        None, description="Failure description, if unsuccessful."
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the manifest was converted."""
+        return self.error is None
+
+
+class WIPPConversionReport(BaseModel):
+    """Outcome of `convert_wipp_many`."""
+
+    results: list[WIPPConversionResult] = Field(default_factory=list)
+    elapsed: float = Field(0.0, description="Duration of the batch, in seconds.")
+
+    @property
+    def converted(self) -> int:
+        """Return the number of manifests converted."""
+        return sum(result.ok for result in self.results)
+
+    @property
+    def failed(self) -> int:
+        """Return the number of manifests that could not be converted."""
+        return len(self.results) - self.converted
+
+    @property
+    def with_defaults(self) -> int:
+        """Return the number of converted manifests that use defaults."""
+        return sum(result.ok and bool(result.defaults) for result in self.results)
+
+    @property
+    def stage_totals(self) -> dict[str, float]:
+        """Return the total duration of each stage, over all manifests."""
+        return {
+            stage: sum(result.timings.get(stage, 0.0) for result in self.results)
+            for stage in STAGES
+        }
+
+
+def convert_wipp_file(
+    path: StrPath, out_dir: StrPath, **kwargs
+) -> WIPPConversionResult:
+    """Convert one WIPP manifest and save it as ICT YAML in `out_dir`.
+
+    The output is named after the ICT name and version. Errors are
+    captured in the result. Extra keyword arguments are passed to
+    `convert_wipp_metadata_to_ict`.
+    """
+    result = WIPPConversionResult(source=str(path))
+    timings = result.timings
+    try:
+        start = time.perf_counter()
+        wipp = WIPPPlugin.from_file(path)
+        timings["load"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        metadata = convert_wipp_metadata_to_ict(wipp, result.defaults, **kwargs)
+        inputs = [convert_wipp_io_to_ict(inp, result.defaults) for inp in wipp.inputs]
+        outputs = [convert_wipp_io_to_ict(out, result.defaults) for out in wipp.outputs]
+        ui = convert_wipp_ui_list(wipp.ui, wipp.inputs, result.defaults)
+        hardware = (
+            None
+            if wipp.resourceRequirements is None
+            else convert_wipp_hardware_to_ict(wipp.resourceRequirements)
+        )
+        timings["convert"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ict_ = ICT(
+            **metadata.model_dump(),
+            inputs=inputs,
+            outputs=outputs,
+            ui=ui,
+            hardware=hardware,
+        )
+        timings["validate"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        output = Path(out_dir).joinpath(
+            f"{ict_.name.replace('/', '-')}-{ict_.version}.yaml"
+        )
+        ict_.save_yaml(output)
+        result.output = str(output)
+        timings["write"] = time.perf_counter() - start
+    except Exception as exc:  # pylint: disable=broad-except
+        result.error = ValidationFailure.from_exception(exc)
+    return result
+
+
+def _convert_chunk(
+    paths: list[Path], out_dir: Path, kwargs: dict
+) -> list[WIPPConversionResult]:
+    """Convert a chunk of WIPP manifests inside a worker process."""
+    return [convert_wipp_file(path, out_dir, **kwargs) for path in paths]
+
+
+def _fail_collisions(results: list[WIPPConversionResult]) -> None:
+    """Fail the manifests that were written to the same output.
+
+    Only one of them survives on disk and which one is arbitrary, so the
+    output is removed and every manifest involved is marked as failed.
+    """
+    by_output: dict[str, list[WIPPConversionResult]] = {}
+    for result in results:
+        if result.output is not None:
+            by_output.setdefault(result.output, []).append(result)
+    for output, group in by_output.items():
+        if len(group) < 2:
+            continue
+        Path(output).unlink(missing_ok=True)
+        failure = ValidationFailure(
+            error_type="ValueError",
+            message=", ".join(result.source for result in group)
+            + f" were all converted to {output}",
+        )
+        for result in group:
+            result.output = None
+            result.error = failure
+
+
+def convert_wipp_many(
+    paths: Iterable[Union[str, Path]],
+    out_dir: StrPath,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    **kwargs,
+) -> WIPPConversionReport:
+    """Convert many WIPP manifests to ICT YAML files in parallel.
+
+    A manifest that fails to convert is reported in its result and
+    never aborts the batch. Manifests with the same ICT name and version
+    would be written to the same file, they are all reported as failed
+    and their output is removed. The report can be saved with
+    `report.model_dump_json()` to audit the fields set to defaults.
+
+    Args:
+        paths: WIPP manifests (`plugin.json` files).
+        out_dir: directory of the ICT YAML files, created if missing.
+        workers: number of worker processes. Defaults to the number
+            of CPUs. With `workers=1` the conversion runs in this process.
+        chunksize: number of manifests sent to a worker at once.
+        kwargs: passed to `convert_wipp_metadata_to_ict`.
+
+    Returns: a `WIPPConversionReport`, with results in the order of `paths`.
+    """
+    start = time.perf_counter()
+    paths_ = [Path(path) for path in paths]
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers_ = min(workers or os.cpu_count() or 1, len(paths_))
+    if workers_ <= 1:
+        results = _convert_chunk(paths_, out_dir, kwargs)
+    else:
+        # results of each chunk, by position of its first manifest
+        done = dict(
+            _run_chunked(
+                _convert_chunk,
+                paths_,
+                workers_,
+                out_dir,
+                kwargs,
+                chunksize=chunksize,
+                on_error=lambda path, failure: WIPPConversionResult(
+                    source=str(path), error=failure
+                ),
+            )
+        )
+        results = [result for first in sorted(done) for result in done[first]]
+    _fail_collisions(results)
+    return WIPPConversionReport(results=results, elapsed=time.perf_counter() - start)
@@ -1,12 +1,9 @@
 """WIPP Hardware Requirements Functions."""
 
-# import polus.plugins as pp
-from polus.plugins._plugins.models.pydanticv2.wipp import (
-    ResourceRequirements as WIPPResourceRequirements,
-)
-
 from ict.hardware import CPU, GPU, HardwareRequirements, Memory
 
+from .objects import WIPPResourceRequirements
+
 
 def convert_wipp_hardware_to_ict(
     wipp: WIPPResourceRequirements,
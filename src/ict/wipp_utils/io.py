@@ -1,12 +1,11 @@
-# pylint: disable=no-name-in-module, import-error
 """WIPP I/O functions."""
 
-from typing import Union
-
-from polus.plugins._plugins.io import Input, Output  # type: ignore
+from typing import Optional, Union
 
 from ict.io import IO
 
+from .objects import WIPPInput, WIPPOutput
+
 WIPP_IO_DICT: dict[str, str] = {
     "string": "string",
     "boolean": "boolean",
@@ -24,24 +23,38 @@ def _wipp_to_ict_type(wipp_type: str) -> str:
     return "path"  # default to path
 
 
-def convert_wipp_io_to_ict(wipp: Union[Input, Output]) -> IO:
-    """Convert WIPP I/O to ICT."""
+def convert_wipp_io_to_ict(
+    wipp: Union[WIPPInput, WIPPOutput], defaults: Optional[list[str]] = None
+) -> IO:
+    """Convert WIPP I/O to ICT.
+
+    The names of the fields set to a default value are appended to
+    `defaults`, if given, e.g. `inputs.<name>.format`.
+    """
     name_ = wipp.name
     type_ = _wipp_to_ict_type(wipp.type)
     description_ = wipp.description
-    if isinstance(wipp, Input):
+    if isinstance(wipp, WIPPInput):
         required_ = wipp.required
     else:
         # output default to required
         required_ = True
     if wipp.options is not None and "format" in wipp.options:
         format_ = [wipp.options["format"]]
+        default_format = False
     else:
         # default to [<inputname>] just for conversion
         format_ = [wipp.name]
+        default_format = True
+    name_ = name_.replace("_", "")  # ICT does not allow underscores in names
+    if defaults is not None:
+        kind = "inputs" if isinstance(wipp, WIPPInput) else "outputs"
+        if default_format:
+            defaults.append(f"{kind}.{name_}.format")
+        if description_ is None:
+            defaults.append(f"{kind}.{name_}.description")
     if description_ is None:
         description_ = ""
-    name_ = name_.replace("_", "")  # ICT does not allow underscores in names
     return IO(
         name=name_,
         type=type_,  # type: ignore
@@ -1,17 +1,25 @@
-# pylint: disable=no-name-in-module, import-error
 """Convert from WIPP Plugin Manifest to ICT."""
 
 import logging
 import re
-from typing import Any, Union
-
-from polus.plugins import Plugin  # type: ignore
+from typing import Any, Optional, Union
 
 from ict.metadata import Metadata as ICTMetadata
 
+from .objects import WIPPPlugin
+
 logger = logging.getLogger("ict")
 
 SPEC_VERSION = "1.0.0"
+EMAIL_REGEX = re.compile(r"[^()\s]+@\S+\.[^()\s.]+")
+# values used when a field cannot be read from the WIPP manifest
+METADATA_DEFAULTS: dict[str, Any] = {
+    "name": "organization/ICTname",
+    "author": ["First Last"],
+    "contact": "author@ict.com",
+    "entrypoint": "[python3, main.py]",
+    "repository": "https://github.com/polusai/image-tools",
+}
 
 
 def _get_ict_name(container: str, name: str) -> Union[str, None]:
@@ -35,17 +43,24 @@ def _get_ict_author(author: str) -> Union[list[str], None]:
     return r_s
 
 
-def _get_ict_email(author: str) -> Union[str, None]:
+def _get_ict_email(author: Optional[str]) -> Union[str, None]:
     """Get the email for the ICT from WIPP author, if any."""
-    email_regex = re.compile(r"[^()\s]+@\S+\.[^()\s.]+")
-    emails = email_regex.findall(author)
+    if author is None:
+        return None
+    emails = EMAIL_REGEX.findall(author)
     if len(emails) > 0:
         return emails[0]
     return None
 
 
-def convert_wipp_metadata_to_ict(wipp: Plugin, **kwargs) -> ICTMetadata:
-    """Convert WIPP Metadata to ICT Metadata."""
+def convert_wipp_metadata_to_ict(
+    wipp: WIPPPlugin, defaults: Optional[list[str]] = None, **kwargs
+) -> ICTMetadata:
+    """Convert WIPP Metadata to ICT Metadata.
+
+    The names of the fields set to a default value are appended to
+    `defaults`, if given.
+    """
     spec_version_ = SPEC_VERSION
     _args_set = {
         "name",
@@ -83,16 +98,11 @@ def convert_wipp_metadata_to_ict(wipp: Plugin, **kwargs) -> ICTMetadata:
         logger.warning(
             f"Check values of metadata in {wipp.name}. Defaults used for conversion."
         )
-    if _args["name"] is None:
-        _args["name"] = "organization/ICTname"
-    if _args["author"] is None:
-        _args["author"] = ["First Last"]
-    if _args["contact"] is None:
-        _args["contact"] = "author@ict.com"
-    if _args["entrypoint"] is None:
-        _args["entrypoint"] = "[python3, main.py]"
-    if _args["repository"] is None or _args["repository"] == "":
-        _args["repository"] = "https://github.com/polusai/image-tools"
+    for field, default in METADATA_DEFAULTS.items():
+        if _args[field] is None or _args[field] == "":
+            _args[field] = default
+            if defaults is not None and field not in kwargs:
+                defaults.append(field)
     _kwargs_keys = set(kwargs.keys())
     _double_args = _args_set.intersection(_kwargs_keys)
     for arg in _double_args:
@@ -0,0 +1,98 @@
+"""WIPP plugin manifest objects.
+
+A minimal model of the WIPP plugin manifest, covering the fields used by
+the conversion to ICT. Unknown fields are ignored, and field types are
+loose so that any manifest accepted by WIPP can be read.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Optional, TypeVar, Union
+
+from pydantic import BaseModel, Field
+
+StrPath = TypeVar("StrPath", str, Path)
+
+
+class WIPPInput(BaseModel):
+    """Input of a WIPP plugin."""
+
+    name: str
+    type: str = Field(description="WIPP type, e.g. `collection` or `enum`.")
+    description: Optional[str] = None
+    required: bool = False
+    options: Optional[dict[str, Any]] = None
+
+
+class WIPPOutput(BaseModel):
+    """Output of a WIPP plugin."""
+
+    name: str
+    type: str
+    description: Optional[str] = None
+    options: Optional[dict[str, Any]] = None
+
+
+class WIPPUI(BaseModel):
+    """UI element of a WIPP plugin.
+
+    The item with key `fieldsets` holds the groups of the other items in
+    `fieldsets` instead of describing an input.
+    """
+
+    key: str
+    title: Optional[str] = None
+    description: Optional[str] = None
+    condition: Optional[str] = None
+    default: Optional[Union[str, float, int, bool]] = None
+    hidden: Optional[bool] = None
+    bind: Optional[str] = None
+    fieldsets: Optional[list[dict[str, Any]]] = None
+
+
+class WIPPResourceRequirements(BaseModel):
+    """Resource requirements of a WIPP plugin."""
+
+    ramMin: Optional[Union[int, float]] = None
+    coresMin: Optional[Union[int, float]] = None
+    cpuAVX: Optional[bool] = None
+    cpuAVX2: Optional[bool] = None
+    gpu: Optional[bool] = None
+    cudaRequirements: Optional[dict[str, Any]] = None
+
+
+class WIPPPlugin(BaseModel):
+    """WIPP plugin manifest."""
+
+    name: str
+    version: str
+    title: str
+    description: str
+    author: Optional[str] = None
+    institution: Optional[str] = None
+    repository: Optional[str] = None
+    website: Optional[str] = None
+    citation: Optional[str] = None
+    containerId: str
+    baseCommand: Optional[list[str]] = None
+    inputs: list[WIPPInput]
+    outputs: list[WIPPOutput]
+    ui: list[WIPPUI]
+    resourceRequirements: Optional[WIPPResourceRequirements] = None
+
+    @classmethod
+    def from_file(cls, path: StrPath) -> "WIPPPlugin":
+        """Read a WIPP manifest (`plugin.json`)."""
+        with Path(path).open("r", encoding="utf-8") as file:
+            return cls.model_validate(json.load(file))
+
+    @classmethod
+    def from_object(cls, plugin: Any) -> "WIPPPlugin":
+        """Convert a manifest model of another library, e.g. polus.plugins."""
+        if isinstance(plugin, cls):
+            return plugin
+        if isinstance(plugin, BaseModel):
+            return cls.model_validate(
+                plugin.model_dump(mode="json", by_alias=True, exclude_none=True)
+            )
+        return cls.model_validate(plugin)
@@ -1,40 +1,19 @@
-# pylint: disable=no-name-in-module, import-error
 """WIPP UI functions."""
 
 import logging
 import re
-from typing import Callable, Union
-
-from polus.plugins._plugins.io import Input as WIPPInput  # type: ignore
-from polus.plugins._plugins.models.pydanticv2.wipp import UI1, UI2  # type: ignore
-
-from ict.ui import (
-    UICheckbox,
-    UIColor,
-    UIDatetime,
-    UIFile,
-    UIItem,
-    UIMultiselect,
-    UINumber,
-    UIPath,
-    UISelect,
-    UIText,
-)
+from collections.abc import Iterable, Mapping
+from typing import Callable, Optional, Union
 
-logger = logging.getLogger("ict")
-INPUT_TYPE_TO_UI_TYPE: dict[str, str] = {
-    "string": "text",
-    "number": "number",
-    "boolean": "checkbox",
-    "enum": "select",
-    "array": "array",  # can be multiselect or just array
-    "integer": "number",
-}
+from ict._construct import UI_MODELS
+from ict.ui import UIItem
 
+from .objects import WIPPUI, WIPPInput
 
-def _input_type_to_ui_type(input_type: str) -> str:
-    """Convert WIPP input type to ICT UI type."""
-    if input_type in [
+logger = logging.getLogger("ict")
+CONDITION_REGEX = re.compile(r"(inputs|outputs)\.\w+(==|!=|<|>|<=|>=|&&)'?\w+'?$")
+PATH_TYPES = frozenset(
+    {
         "collection",
         "pyramid",
         "csvCollection",
@@ -44,111 +23,132 @@ def _input_type_to_ui_type(input_type: str) -> str:
         "tensorflowModel",
         "tensorboardLogs",
         "pyramidAnnotation",
-    ]:
-        return "path"
-    return INPUT_TYPE_TO_UI_TYPE[input_type]
+    }
+)
+INPUT_TYPE_TO_UI_TYPE: dict[str, str] = {
+    "string": "text",
+    "number": "number",
+    "boolean": "checkbox",
+    "enum": "select",
+    "array": "array",  # can be multiselect or just array
+    "integer": "number",
+    **{type_: "path" for type_ in PATH_TYPES},
+}
+# UI type of an input with a list of possible values, and without one
+_CHOICE_UI_TYPES: dict[str, tuple[str, str]] = {
+    "select": ("select", "text"),
+    "multiselect": ("multiselect", "text"),
+    "array": ("multiselect", "text"),
+}
+# UI types taking the default value of the WIPP UI
+_DEFAULT_UI_TYPES = frozenset({"checkbox", "number"})
+FIELDSETS_KEY = "fieldsets"
 
 
 def dispatch_ui(ui_type: str) -> Callable:
     """Match UI type (str) to relevant UI Model."""
-    if ui_type == "text":
-        return UIText
-    if ui_type == "number":
-        return UINumber
-    if ui_type == "checkbox":
-        return UICheckbox
-    if ui_type == "select":
-        return UISelect
-    if ui_type == "multiselect":
-        return UIMultiselect
-    if ui_type == "color":
-        return UIColor
-    if ui_type == "datetime":
-        return UIDatetime
-    if ui_type == "file":
-        return UIFile
-    if ui_type == "path":
-        return UIPath
-    raise ValueError(f"UI type {ui_type} not found")
+    try:
+        return UI_MODELS[ui_type]
+    except KeyError:
+        raise ValueError(f"UI type {ui_type} not found") from None
 
 
-def convert_wipp_ui_to_ict(
-    wipp_ui: Union[UI1, UI2], wipp_inputs: list[WIPPInput]
+def _convert_ui(
+    wipp_ui: WIPPUI,
+    inputs: Mapping[str, WIPPInput],
+    defaults: Optional[list[str]],
 ) -> UIItem:
-    """Convert WIPP UI to ICT."""
+    """Convert one WIPP UI item, given the WIPP inputs by name."""
     key_ = wipp_ui.key
-    title_ = wipp_ui.title
-    description_ = wipp_ui.description
+    if key_ == FIELDSETS_KEY:
+        raise ValueError(
+            "fieldsets group the other UI items, convert the whole UI list "
+            "with convert_wipp_ui_list"
+        )
+    inp_name = key_.split(".")[1]  # inputs.<name>
+    relevant_input = inputs.get(inp_name)
+    if relevant_input is None:
+        raise ValueError(f"UI key {key_} does not match any input name")
     if wipp_ui.condition is not None:
         # match using regex
-        condition_regex = re.compile(
-            r"(inputs|outputs)\.\w+(==|!=|<|>|<=|>=|&&)'?\w+'?$"
-        )
-        regex_match = re.search(condition_regex, wipp_ui.condition)
+        regex_match = CONDITION_REGEX.search(wipp_ui.condition)
         if regex_match is None:
             logger.warning(
                 "Condition statement for %s is not in the correct format,"
                 "default template will be used",
                 key_,
             )
-            condition_ = f"inputs.{key_.split('.')[1]}==value"
+            condition_ = f"inputs.{inp_name}==value"
+            if defaults is not None:
+                defaults.append(f"ui.{key_}.condition")
         else:  # regex matched
             condition_ = regex_match.group(0)
     else:
         condition_ = None
-    if key_ == "fieldsets":
-        raise NotImplementedError("fieldsets in UI not implemented")
-    else:
-        inp_name = key_.split(".")[1]  # inputs.<name>
-    relevant_input = [inp for inp in wipp_inputs if inp.name == inp_name]
-    if len(relevant_input) == 0:
-        raise ValueError(f"UI key {key_} does not match any input name")
-    relevant_input = relevant_input[0]
-    input_type = relevant_input.type  # type: ignore
-    ui_type = _input_type_to_ui_type(input_type)
-    if ui_type in ["checkbox", "number"]:
-        default_ = wipp_ui.default
-        return dispatch_ui(ui_type)(
-            key=key_,
-            title=title_,
-            description=description_,
-            condition=condition_,
-            default=default_,
-            type=ui_type,
-        )
-    if ui_type in ["select", "multiselect"]:
-        if "values" in relevant_input.options.keys():  # type: ignore
-            options_ = relevant_input.options["values"]  # type: ignore
-            return dispatch_ui(ui_type)(
-                key=key_,
-                title=title_,
-                description=description_,
-                condition=condition_,
-                fields=options_,
-                type=ui_type,
-            )
-        # possible values are missing
-        # change ui_type to text
-        ui_type = "text"
-
-    if ui_type == "array":
-        if "values" in relevant_input.options.keys():  # type: ignore
-            options_ = relevant_input.options["values"]  # type: ignore
-            return dispatch_ui("multiselect")(
-                key=key_,
-                title=title_,
-                description=description_,
-                condition=condition_,
-                fields=options_,
-                type=ui_type,
-            )
-        # change ui_type to text
-        ui_type = "text"
-
-    return dispatch_ui(ui_type)(
-        key=key_,
-        title=title_,
-        description=description_,
-        condition=condition_,
-        type=ui_type,
-    )
+    values = {
+        # the ICT IO name drops underscores, see convert_wipp_io_to_ict
+        "key": f"inputs.{inp_name.replace('_', '')}",
+        "title": wipp_ui.title,
+        "description": wipp_ui.description,
+        "condition": condition_,
+    }
+    ui_type = INPUT_TYPE_TO_UI_TYPE[relevant_input.type]
+    if ui_type in _DEFAULT_UI_TYPES:
+        values["default"] = wipp_ui.default
+    elif ui_type in _CHOICE_UI_TYPES:
+        options = relevant_input.options or {}
+        with_values, without_values = _CHOICE_UI_TYPES[ui_type]
+        if "values" in options:
+            ui_type = with_values
+            values["fields"] = options["values"]
+        else:
+            # possible values are missing
+            ui_type = without_values
+    return UI_MODELS[ui_type](type=ui_type, **values)
+
+
+def convert_wipp_ui_list(
+    wipp_ui: Iterable[WIPPUI],
+    wipp_inputs: Iterable[WIPPInput],
+    defaults: Optional[list[str]] = None,
+) -> list[UIItem]:
+    """Convert the UI of a WIPP plugin to ICT.
+
+    ICT has no fieldsets: when the WIPP UI has a `fieldsets` item, the
+    items are ordered as they appear in the fieldsets, followed by the
+    items missing from them.
+
+    The names of the fields set to a default value are appended to
+    `defaults`, if given, e.g. `ui.<key>.condition`.
+    """
+    inputs = {inp.name: inp for inp in wipp_inputs}
+    items: list[WIPPUI] = []
+    order: dict[str, int] = {}
+    for item in wipp_ui:
+        if item.key == FIELDSETS_KEY:
+            for fieldset in item.fieldsets or []:
+                for field in fieldset.get("fields", []):
+                    order.setdefault(f"inputs.{field}", len(order))
+        else:
+            items.append(item)
+    if order:
+        items.sort(key=lambda item: order.get(item.key, len(order)))
+    return [_convert_ui(item, inputs, defaults) for item in items]
+
+
+def convert_wipp_ui_to_ict(
+    wipp_ui: WIPPUI,
+    wipp_inputs: Union[Iterable[WIPPInput], Mapping[str, WIPPInput]],
+    defaults: Optional[list[str]] = None,
+) -> UIItem:
+    """Convert WIPP UI to ICT.
+
+    To convert the UI of a whole plugin, `convert_wipp_ui_list` is
+    faster and supports fieldsets.
+
+    The names of the fields set to a default value are appended to
+    `defaults`, if given, e.g. `ui.<key>.condition`.
+    """
+    if not isinstance(wipp_inputs, Mapping):
+        wipp_inputs = {inp.name: inp for inp in wipp_inputs}
+    return _convert_ui(wipp_ui, wipp_inputs, defaults)
@@ -0,0 +1,27 @@
+"""Fixtures shared by the tests."""
+import json
+from pathlib import Path
+
+import pytest
+
+from ict import ICT, validate
+from ict.semver import Version
+
+yml = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
+
+
+@pytest.fixture
+def example_icts() -> list[ICT]:
+    """Example ICT in several versions, with and without hardware."""
+    ict = validate(yml)
+    icts = [
+        ict.model_copy(update={"version": Version(ver), "hardware": None})
+        for ver in ["1.10.0", "1.9.0"]
+    ]
+    data = json.loads(ict.model_dump_json(by_alias=True, exclude_none=True))
+    data.update(
+        name="wipp/other",
+        container="wipp/other:0.1.0",
+        hardware={"gpu": {"required": True}},
+    )
+    return [ict, *icts, ICT(**data)]
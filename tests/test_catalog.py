@@ -0,0 +1,142 @@
+"""Test collections of ICT objects."""
+import json
+from pathlib import Path
+
+import pytest
+
+from ict import ICT
+from ict.catalog import ICTCatalog, VersionIndex
+
+json_file = Path(__file__).parent.parent.joinpath("example", "spec.json")
+VERSIONS = ["1.0.0", "1.1.0", "1.10.0", "1.9.3", "2.0.0-rc1", "2.0.0", "0.9.0"]
+
+
+def _ict(**kwargs) -> ICT:
+    """Return the example ICT with some fields replaced."""
+    with open(json_file, "r", encoding="utf-8") as f_o:
+        data = json.load(f_o)
+    data.update(kwargs)
+    return ICT(**data)
+
+
+@pytest.fixture(scope="module")
+def icts() -> list[ICT]:
+    """Several versions of two ICTs."""
+    icts = [_ict(version=ver) for ver in VERSIONS]
+    icts.append(_ict(name="wipp/other", version="3.0.0"))
+    return icts
+
+
+def test_version_index(icts):
+    """Test latest version lookups."""
+    index = VersionIndex(icts)
+    assert len(index) == len(icts)
+    assert [str(ver) for ver in index.versions("wipp/threshold")] == [
+        "0.9.0",
+        "1.0.0",
+        "1.1.0",
+        "1.9.3",
+        "1.10.0",
+        "2.0.0-rc1",
+        "2.0.0",
+    ]
+    assert index.latest("wipp/threshold").version == "2.0.0"
+    assert index.latest("wipp/threshold", ">=1.1.0,<2.0.0").version == "1.10.0"
+    assert index.latest("wipp/threshold", "<2.0.0", prerelease=True).version == (
+        "2.0.0-rc1"
+    )
+    assert index.latest("wipp/threshold", "~1.9.0").version == "1.9.3"
+    assert index.latest("wipp/threshold", "^1.0.0,!=1.10.0").version == "1.9.3"
+    assert index.latest("wipp/threshold", ">2.0.0") is None
+    assert index.latest("wipp/missing") is None
+    assert [str(i.version) for i in index.select("wipp/threshold", "<1.1.0")] == [
+        "1.0.0",
+        "0.9.0",
+    ]
+
+
+def test_version_index_update(icts):
+    """Test adding and removing ICTs."""
+    index = VersionIndex(icts)
+    index.add(_ict(version="1.10.0", title="Replaced"))
+    assert len(index) == len(icts)
+    assert index.get("wipp/threshold", "1.10.0").title == "Replaced"
+    removed = index.remove("wipp/other", "3.0.0")
+    assert removed.name == "wipp/other"
+    assert "wipp/other" not in index
+    with pytest.raises(KeyError):
+        index.remove("wipp/other", "3.0.0")
+
+
+def test_catalog_query(icts):
+    """Test catalog indexes."""
+    gpu = _ict(
+        name="nist/gpu",
+        container="nist/gpu-tool:1.0.0",
+        author=["Jane Doe"],
+        hardware={"cpu": {"min": "500m"}, "gpu": {"required": True}},
+    )
+    catalog = ICTCatalog(icts + [gpu])
+    assert len(catalog) == len(icts) + 1
+    assert catalog.latest("wipp/threshold", "<1.10.0").version == "1.9.3"
+    assert catalog.by_container("nist/gpu-tool:1.0.0") == [gpu]
+    assert catalog.by_author("Jane Doe") == [gpu]
+    assert len(catalog.by_format("OME-TIFF")) == len(catalog)
+    assert len(catalog.by_io_type("number", direction="inputs")) == len(catalog)
+    assert catalog.by_io_type("number", direction="outputs") == []
+    assert catalog.gpu_required() == [gpu]
+    # the example requires 100 cores
+    assert catalog.fits_cpu(1) == [gpu]
+    assert len(catalog.fits_cpu(100)) == len(catalog)
+    assert catalog.query(author="Mohammed Ouladi", gpu_required=True) == []
+    assert catalog.query(io_format="OME-TIFF", max_cpu=0.5) == [gpu]
+    assert len(catalog.query(gpu_required=False)) == len(icts)
+    found = catalog.query(name="wipp/threshold", constraint="^1.0.0")
+    assert sorted(str(ict.version) for ict in found) == [
+        "1.0.0",
+        "1.1.0",
+        "1.10.0",
+        "1.9.3",
+    ]
+
+
+def test_catalog_update(icts):
+    """Test indexes are updated when ICTs are added and removed."""
+    catalog = ICTCatalog(icts)
+    gpu = _ict(name="nist/gpu", hardware={"gpu": {"required": True}})
+    catalog.add(gpu)
+    assert gpu in catalog
+    assert catalog.gpu_required() == [gpu]
+    catalog.remove("nist/gpu", "1.1.1")
+    assert gpu not in catalog
+    assert catalog.gpu_required() == []
+    assert len(catalog.query(io_type="path")) == len(icts)
+    for ict in icts:
+        catalog.remove(ict.name, ict.version)
+    assert len(catalog) == 0
+    assert catalog.by_format("OME-TIFF") == []
+    assert catalog.fits_cpu(1000) == []
+
+
+def test_catalog_equal_versions():
+    """Test versions equal by precedence identify the same ICT."""
+    first = _ict(version="1.0.0-01")
+    second = _ict(version="1.0.0-1", title="Replaced")
+    catalog = ICTCatalog([first, second])
+    assert len(catalog) == 1
+    assert catalog.versions("wipp/threshold") == ["1.0.0-1"]
+    assert catalog.by_container(first.container) == [second]
+    assert catalog.get("wipp/threshold", "1.0.0-01") is second
+    assert catalog.remove("wipp/threshold", "1.0.0-01") is second
+    assert len(catalog) == 0
+    assert catalog.by_container(first.container) == []
+
+
+def test_catalog_invalid_hardware(icts):
+    """Test an ICT with an unparseable quantity is rejected, not given 0 cores."""
+    catalog = ICTCatalog(icts)
+    bad = _ict(name="nist/bad", hardware={"cpu": {"min": "lots"}})
+    with pytest.raises(ValueError, match="cpu_min='lots'"):
+        catalog.add(bad)
+    assert bad not in catalog
+    assert len(catalog) == len(icts)
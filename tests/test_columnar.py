@@ -0,0 +1,37 @@
+"""Test columnar export of ICT collections."""
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+from ict.columnar import ParquetCatalog, to_arrow, write_parquet  # noqa: E402
+
+
+def test_to_arrow(example_icts):
+    """Test ICTs are flattened into tables linked by tool_id."""
+    icts = example_icts
+    tables = to_arrow(icts, batch_size=2)
+    assert tables["metadata"].column("name").to_pylist()[-1] == "wipp/other"
+    assert tables["io"].num_rows == sum(
+        len(ict.inputs) + len(ict.outputs) for ict in icts
+    )
+    hardware = tables["hardware"].to_pylist()
+    assert [row["tool_id"] for row in hardware] == [0, 3]
+    assert hardware[0]["cpu_min_millicores"] == 100000
+    assert hardware[0]["memory_min_bytes"] == 100 * 10**6
+    assert hardware[1]["has_cpu"] is False
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_parquet_roundtrip(tmp_path, trusted, example_icts):
+    """Test ICTs are written to Parquet and read back lazily."""
+    icts = example_icts * 3
+    assert write_parquet(icts, tmp_path, batch_size=4) == len(icts)
+    catalog = ParquetCatalog(tmp_path, batch_size=3, trusted=trusted)
+    assert len(catalog) == len(icts)
+    assert list(catalog) == icts
+    assert catalog.load(3) == icts[3]
+    with pytest.raises(KeyError):
+        catalog.load(len(icts))
+    assert (
+        catalog.table("io", columns=["type"]).num_rows
+        == 3 * to_arrow(example_icts)["io"].num_rows
+    )
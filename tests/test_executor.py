@@ -0,0 +1,124 @@
+"""Test local execution of ICT tools."""
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ict import validate
+from ict._yaml import safe_load
+from ict.executor import (
+    Allocation,
+    CWLToolBackend,
+    Job,
+    LocalExecutor,
+    SubprocessBackend,
+)
+from ict.hardware import HardwareRequirements
+
+yml = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
+SLEEP = [sys.executable, "-c", "import sys, time; time.sleep(float(sys.argv[2]))"]
+
+
+def _ict(**hardware):
+    """Return the example ICT with the given hardware requirements."""
+    return validate(yml).model_copy(
+        update={"hardware": HardwareRequirements(**hardware)}
+    )
+
+
+def test_packing():
+    """Test jobs wait for cores, and get the recommended CPU when free."""
+    small = _ict(cpu={"min": "1"})
+    large = _ict(cpu={"min": "1", "recommended": "2"})
+    executor = LocalExecutor(SubprocessBackend(SLEEP), cores=2, memory=0)
+    report = executor.run(
+        [
+            Job(ict=large, params={"duration": 0.3}),
+            Job(ict=small, params={"duration": 0.3}),
+            Job(ict=small, params={"duration": 0.3}),
+        ]
+    )
+    assert [result.ok for result in report.results] == [True] * 3
+    # the large job takes both cores, the small ones wait for it
+    assert report.results[0].millicores == 2000
+    assert report.results[1].queue_latency >= 0.25
+    assert report.results[2].queue_latency >= 0.25
+    assert report.queue_latency.max >= 0.25
+    assert report.run_latency.p50 >= 0.25
+
+    # the minimum is given when the recommended CPU is not free
+    report = executor.run(
+        [
+            Job(ict=small, params={"duration": 0.3}),
+            Job(ict=large, params={"duration": 0}),
+        ]
+    )
+    assert report.results[1].millicores == 1000
+    assert report.results[1].queue_latency < 0.25
+
+
+def test_failures():
+    """Test jobs too large to run, and jobs exiting with an error."""
+    report = LocalExecutor(
+        SubprocessBackend([sys.executable, "-c", "import sys; sys.exit('boom')"]),
+        cores=1,
+        memory=2**30,
+    ).run(
+        [
+            Job(ict=_ict(cpu={"min": "500m"}, memory={"min": "2Gi"})),
+            Job(ict=_ict(cpu={"min": "500m"})),
+        ]
+    )
+    assert report.results[0].returncode is None
+    assert "more than available" in report.results[0].error
+    assert report.results[1].returncode == 1
+    assert "boom" in report.results[1].error
+    assert len(report.failed) == 2
+
+
+def test_invalid_requirements():
+    """Test a job with an unparseable quantity fails instead of running."""
+    report = LocalExecutor(SubprocessBackend(SLEEP), cores=1, memory=0).run(
+        [Job(ict=_ict(cpu={"min": "lots"}), params={"duration": 0})]
+    )
+    assert report.results[0].returncode is None
+    assert "cpu_min='lots'" in report.results[0].error
+
+
+def test_cwltool_backend(tmp_path, monkeypatch):
+    """Test the CommandLineTool given to cwltool, with cwltool mocked."""
+    commands = []
+
+    def run(command, **_):
+        commands.append(command)
+        return subprocess.CompletedProcess(command, 0, stderr=b"")
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: object())
+    monkeypatch.setattr(subprocess, "run", run)
+    backend = CWLToolBackend()
+    ict = validate(yml)
+    ict = ict.model_copy(
+        update={"outputs": [ict.outputs[0].model_copy(update={"name": "outDir"})]}
+    )
+    allocation = Allocation(500, 2**30)
+    result = backend.run(Job(ict=ict, params={"input": "x"}), allocation, tmp_path)
+    assert result.returncode == 0
+    assert commands[0][-2:] == [
+        str(tmp_path.joinpath("tool.cwl")),
+        str(tmp_path.joinpath("params.json")),
+    ]
+    clt = safe_load(tmp_path.joinpath("tool.cwl").read_text(encoding="utf-8"))
+    assert clt["baseCommand"] == str(ict.entrypoint)
+    assert clt["requirements"]["ResourceRequirement"] == {
+        "coresMin": 0.5,
+        "ramMin": 1024,
+    }
+    assert clt["outputs"]["outDir"]["type"] == "Directory"
+    # the cached CommandLineTool is left untouched
+    assert "ResourceRequirement" not in ict.clt["requirements"]
+
+    # only outDir outputs can be expressed in CWL
+    with pytest.raises(ValueError, match="no CWL equivalent: output"):
+        backend.run(Job(ict=validate(yml)), allocation, tmp_path)
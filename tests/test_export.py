@@ -0,0 +1,96 @@
+"""Test bulk CWL export."""
+import shutil
+from pathlib import Path
+
+from ict.cli import main
+from ict.export import export_cwl
+
+example = Path(__file__).parent.parent.joinpath("example")
+
+
+def _tree(tmp_path: Path) -> Path:
+    """Directory of two valid manifests and an invalid one."""
+    src = tmp_path.joinpath("src")
+    src.joinpath("tools").mkdir(parents=True)
+    shutil.copy(example.joinpath("spec.yaml"), src.joinpath("a.yaml"))
+    shutil.copy(example.joinpath("spec.json"), src.joinpath("tools", "b.json"))
+    src.joinpath("tools", "bad.yml").write_text("name: bad\n", encoding="utf-8")
+    return src
+
+
+def test_export_cwl(tmp_path):
+    """Test only changed sources are exported again."""
+    src, out = _tree(tmp_path), tmp_path.joinpath("out")
+    summary = export_cwl(src, out, jobs=1)
+    assert (summary.exported, summary.unchanged, len(summary.failures)) == (2, 0, 1)
+    assert summary.failures[0].source.endswith("bad.yml")
+    assert out.joinpath("a.cwl").exists()
+    assert out.joinpath("tools", "b.cwl").exists()
+
+    summary = export_cwl(src, out, jobs=1)
+    assert (summary.exported, summary.unchanged, len(summary.failures)) == (0, 2, 1)
+
+    src.joinpath("a.yaml").write_text(
+        example.joinpath("spec.yaml").read_text(encoding="utf-8") + "\n",
+        encoding="utf-8",
+    )
+    out.joinpath("tools", "b.cwl").unlink()
+    summary = export_cwl(src, out, jobs=2)
+    assert (summary.exported, summary.unchanged, len(summary.failures)) == (2, 0, 1)
+
+    summary = export_cwl(src, out, jobs=1, network_access=True)
+    assert summary.exported == 2
+    assert "NetworkAccess" in out.joinpath("a.cwl").read_text(encoding="utf-8")
+
+
+def test_cli(tmp_path, capsys):
+    """Test the export-cwl command."""
+    src, out = _tree(tmp_path), tmp_path.joinpath("out")
+    assert main(["export-cwl", str(src), str(out), "--jobs", "1"]) == 1
+    captured = capsys.readouterr()
+    assert "2 exported, 0 unchanged, 1 failed" in captured.out
+    assert "bad.yml" in captured.err
+    src.joinpath("tools", "bad.yml").unlink()
+    assert main(["export-cwl", str(src), str(out)]) == 0
+    assert "0 exported, 2 unchanged, 0 failed" in capsys.readouterr().out
+
+
+def test_export_collision(tmp_path):
+    """Test sources exported to the same path are reported, not overwritten."""
+    src, out = _tree(tmp_path), tmp_path.joinpath("out")
+    shutil.copy(example.joinpath("spec.json"), src.joinpath("a.json"))
+    summary = export_cwl(src, out, jobs=1)
+    assert (summary.exported, len(summary.failures)) == (1, 3)
+    collisions = [f for f in summary.failures if "a.cwl" in f.error.message]
+    assert sorted(Path(f.source).name for f in collisions) == ["a.json", "a.yaml"]
+    assert not out.joinpath("a.cwl").exists()
+
+
+def test_export_out_inside_src(tmp_path):
+    """Test the output tree and state file are not exported again."""
+    src = _tree(tmp_path)
+    out = src.joinpath("cwl")
+    out.joinpath("nested").mkdir(parents=True)
+    shutil.copy(example.joinpath("spec.yaml"), out.joinpath("nested", "c.yaml"))
+    summary = export_cwl(src, out, jobs=1)
+    assert (summary.exported, len(summary.failures)) == (2, 1)
+    summary = export_cwl(src, out, jobs=1)
+    assert (summary.exported, summary.unchanged, len(summary.failures)) == (0, 2, 1)
+    assert not out.joinpath("cwl").exists()
+
+
+def test_export_unreadable(tmp_path, monkeypatch):
+    """Test a source that cannot be read does not abort the export."""
+    src, out = _tree(tmp_path), tmp_path.joinpath("out")
+    read_bytes = Path.read_bytes
+
+    def fail_on_a(path):
+        if path.name == "a.yaml":
+            raise PermissionError(13, "Permission denied", str(path))
+        return read_bytes(path)
+
+    monkeypatch.setattr(Path, "read_bytes", fail_on_a)
+    summary = export_cwl(src, out, jobs=1)
+    assert (summary.exported, len(summary.failures)) == (1, 2)
+    assert summary.failures[0].error.error_type == "PermissionError"
+    assert out.joinpath(".ict-export.json").exists()
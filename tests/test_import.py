@@ -0,0 +1,36 @@
+"""Test import time of the ict package."""
+import os
+import subprocess
+import sys
+
+# budget for the cumulative import time of `ict`, in microseconds
+IMPORT_BUDGET_US = int(os.environ.get("ICT_IMPORT_BUDGET_US", 1_500_000))
+# modules that must only be imported on first use
+LAZY_MODULES = ["polus", "cwltool", "cwl_utils", "ict.wipp_utils"]
+
+
+def _import_times() -> dict[str, int]:
+    """Return the cumulative import time of each module imported by `ict`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ict"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time():
+    """Test `import ict` stays within budget and loads heavy modules lazily."""
+    times = _import_times()
+    assert times["ict"] < IMPORT_BUDGET_US
+    for name in times:
+        assert not any(
+            name == mod or name.startswith(mod + ".") for mod in LAZY_MODULES
+        ), f"{name} imported by `import ict`"
@@ -0,0 +1,68 @@
+"""Test matching of hardware requirements with nodes."""
+from pathlib import Path
+
+import pytest
+
+from ict import validate
+from ict.hardware import HardwareRequirements
+
+np = pytest.importorskip("numpy")
+from ict.hardware.matching import HardwareMatcher  # noqa: E402
+
+yml = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
+
+
+@pytest.fixture(name="icts")
+def fixture_icts():
+    """Return ICTs with various hardware requirements."""
+    base = validate(yml)
+    requirements = [
+        None,
+        HardwareRequirements(cpu={"min": "500m"}, memory={"min": "1Gi"}),
+        HardwareRequirements(
+            cpu={"min": "2", "recommended": "4"}, memory={"min": "4Gi"}
+        ),
+        HardwareRequirements(cpu={"min": "1"}, gpu={"required": True}),
+    ]
+    return [base.model_copy(update={"hardware": hw}) for hw in requirements]
+
+
+NODES = [
+    (1, 2 * 2**30, 0),  # small
+    (8, 32 * 2**30, 1),  # large, with GPU
+    (4, 8 * 2**30, 0),  # medium
+]
+
+
+def test_fits(icts):
+    """Test which nodes can run each tool."""
+    fits = HardwareMatcher(icts).fits(NODES)
+    assert fits.tolist() == [
+        [True, True, True],
+        [True, True, True],
+        [False, True, True],
+        [False, True, False],
+    ]
+
+
+def test_rank(icts):
+    """Test nodes are ranked by recommended resources, then by leftover."""
+    order, counts = HardwareMatcher(icts).rank(NODES)
+    assert counts.tolist() == [3, 3, 2, 1]
+    assert order[1, :3].tolist() == [0, 2, 1]
+    assert order[2, :2].tolist() == [2, 1]
+    assert order[3, :1].tolist() == [1]
+
+
+def test_no_nodes(icts):
+    """Test matching without nodes."""
+    order, counts = HardwareMatcher(icts).rank(np.empty((0, 3)))
+    assert order.shape == (4, 0)
+    assert counts.tolist() == [0, 0, 0, 0]
+
+
+def test_invalid_quantity(icts):
+    """Test a quantity that cannot be parsed is an error, not zero."""
+    hardware = HardwareRequirements(cpu={"min": "2"}, memory={"min": "lots"})
+    with pytest.raises(ValueError, match="memory_min='lots'"):
+        HardwareMatcher([*icts, icts[0].model_copy(update={"hardware": hardware})])
@@ -2,7 +2,12 @@
 import json
 from pathlib import Path
 
-from ict import validate
+import pytest
+from pydantic import ValidationError
+
+from ict import ICT, validate
+from ict.hardware import HardwareRequirements, parse_cpu, parse_memory
+from ict.tools import clt_dict, to_clt_many
 
 yml = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
 json_file = Path(__file__).parent.parent.joinpath("example", "spec.json")
@@ -51,3 +56,105 @@ def test_both():
     ict_yaml = validate(yml)
     ict_json = validate(json_file)
     assert ict_yaml == ict_json
+
+
+def test_save_yaml(tmp_path):
+    """Test YAML round trip."""
+    ict = validate(yml)
+    path = ict.save_yaml(tmp_path.joinpath("spec.yaml"))
+    assert validate(path) == ict
+
+
+def _manifest(n_inputs: int) -> dict:
+    """Return a manifest with `n_inputs` inputs and text ui items."""
+    with open(json_file, "r", encoding="utf-8") as f_o:
+        data = json.load(f_o)
+    data["inputs"] = [
+        {"name": f"in{i}", "type": "string", "required": True, "format": ["text"]}
+        for i in range(n_inputs)
+    ]
+    data["ui"] = [
+        {"key": f"inputs.in{i}", "title": f"In {i}", "type": "text"}
+        for i in range(n_inputs)
+    ]
+    return data
+
+
+def test_ui_errors():
+    """Test every ui/io mismatch is reported at once."""
+    data = _manifest(3)
+    data["inputs"].append(data["inputs"][0])
+    data["ui"].append(data["ui"][1])
+    data["ui"].append({"key": "inputs.missing", "title": "Missing", "type": "text"})
+    data["ui"].append({"key": "outputs.missing", "title": "Missing", "type": "text"})
+    with pytest.raises(ValidationError) as exc:
+        validate(data)
+    message = str(exc.value)
+    assert "Unmatched: inputs.missing, outputs.missing" in message
+    assert "Duplicated: inputs.in0" in message
+    assert "Duplicated: inputs.in1" in message
+
+
+def test_clt_cache():
+    """Test the CLT is memoized and follows changes of the ICT."""
+    ict = validate(yml)
+    assert ict.clt == clt_dict(ict, False)
+    # the public methods return copies, the cache stays untouched
+    assert ict.clt is not ict.clt
+    ict.clt["requirements"].clear()
+    assert ict.clt == clt_dict(ict, False)
+    assert ict.to_clt(network_access=True) == clt_dict(ict, True)
+    assert ict.to_clt(network_access=True) is not ict.clt
+    ict.container = "wipp/wipp-thresh-plugin:1.1.2"
+    assert ict.clt["requirements"]["DockerRequirement"]["dockerPull"].endswith("1.1.2")
+    ict.inputs[0].required = not ict.inputs[0].required
+    assert ict.clt == clt_dict(ict, False)
+
+
+def test_to_clt_many():
+    """Test batch CLT generation."""
+    icts = [validate(yml), validate(json_file), validate(yml)]
+    clts = to_clt_many(icts)
+    assert clts == [clt_dict(ict, False) for ict in icts]
+    assert clts[0] is clts[2]
+
+
+def test_hardware_missing_section():
+    """Test flattened hardware fields are None when their section is missing."""
+    hardware = HardwareRequirements(cpu={"min": "100m"})
+    assert hardware.cpu_min == "100m"
+    assert hardware.gpu_type is None
+    assert hardware.memory_min is None
+    assert HardwareRequirements().cpu_type is None
+
+
+def test_hardware_quantities():
+    """Test parsing of CPU and memory quantities."""
+    assert parse_cpu("100m") == 100
+    assert parse_cpu("2") == 2000
+    assert parse_cpu(0.5) == 500
+    assert parse_cpu("2Gi") is None
+    assert parse_memory("129Mi") == 129 * 2**20
+    assert parse_memory("2G") == 2 * 10**9
+    assert parse_memory(1024) == 1024
+    assert parse_memory("lots") is None
+    # True == 1, but only the number is a valid quantity
+    assert parse_cpu(1) == 1000
+    assert parse_cpu(True) is None
+    assert parse_memory(True) is None
+    assert parse_memory(1) == 1
+    hardware = HardwareRequirements(
+        cpu={"min": "100m", "recommended": 2}, memory={"min": "1Gi"}
+    )
+    assert hardware.cpu_min_millicores == 100
+    assert hardware.cpu_recommended_millicores == 2000
+    assert hardware.memory_min_bytes == 2**30
+    assert hardware.memory_recommended_bytes is None
+    assert hardware.quantities() == {
+        "cpu_min": 100,
+        "cpu_recommended": 2000,
+        "memory_min": 2**30,
+        "memory_recommended": None,
+    }
+    with pytest.raises(ValueError, match="cpu_min='2Gi'"):
+        HardwareRequirements(cpu={"min": "2Gi"}).quantities()
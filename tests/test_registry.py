@@ -0,0 +1,53 @@
+"""Test SQLite registry of ICT objects."""
+from ict.registry import ICTRegistry
+
+
+def test_registry(tmp_path, example_icts):
+    """Test ICTs are stored and loaded back."""
+    icts = example_icts
+    path = tmp_path.joinpath("registry.db")
+    with ICTRegistry(path) as registry:
+        assert registry.add_many(icts) == len(icts)
+    with ICTRegistry(path) as registry:
+        assert len(registry) == len(icts)
+        assert list(registry) == icts
+        other = registry.get("wipp/other", "1.1.1")
+        assert other.hardware.cpu is None
+        assert other.hardware.gpu.gpu_required
+        assert [str(v) for v in registry.versions("wipp/threshold")] == [
+            "1.1.1",
+            "1.9.0",
+            "1.10.0",
+        ]
+        entries = registry.find(container="wipp/other:0.1.0")
+        assert [entry.name for entry in entries] == ["wipp/other"]
+        assert registry.load(entries[0]) == icts[-1]
+        assert registry.get("wipp/threshold", "9.9.9") is None
+
+
+def test_registry_update(tmp_path, example_icts):
+    """Test ICTs are replaced and removed with their rows."""
+    icts = example_icts
+    with ICTRegistry(tmp_path.joinpath("registry.db")) as registry:
+        registry.add_many(icts)
+        registry.add(icts[0].model_copy(update={"title": "Replaced"}))
+        assert len(registry) == len(icts)
+        assert registry.get("wipp/threshold", "1.1.1").title == "Replaced"
+        assert registry.remove("wipp/other", "1.1.1")
+        assert not registry.remove("wipp/other", "1.1.1")
+        assert icts[-1] not in registry
+        (count,) = registry._conn.execute(  # pylint: disable=protected-access
+            "SELECT COUNT(*) FROM io"
+        ).fetchone()
+        assert count == 4 * (len(icts) - 1)
+
+
+def test_registry_duplicates(tmp_path, example_icts):
+    """Test the last ICT is stored when a batch repeats a name and version."""
+    icts = example_icts
+    replaced = icts[0].model_copy(update={"title": "Replaced"})
+    with ICTRegistry(tmp_path.joinpath("registry.db")) as registry:
+        registry.add(icts[0])
+        assert registry.add_many([icts[0], icts[1], replaced]) == 2
+        assert len(registry) == 2
+        assert registry.get("wipp/threshold", "1.1.1") == replaced
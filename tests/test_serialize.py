@@ -0,0 +1,64 @@
+"""Test serialization of ICT objects."""
+from pathlib import Path
+
+import pytest
+
+from ict import ICT, dumps_trusted, loads_trusted, validate
+from ict.binary import MAGIC
+
+yml = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
+
+
+@pytest.fixture
+def ict() -> ICT:
+    """Example ICT."""
+    return validate(yml)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_bytes(ict, trusted):
+    """Test binary round trip."""
+    pytest.importorskip("msgpack")
+    data = ict.to_bytes()
+    assert len(data) < len(ict.model_dump_json(by_alias=True, exclude_none=True))
+    loaded = ICT.from_bytes(data, trusted=trusted)
+    assert loaded == ict
+    assert loaded.model_dump(mode="json") == ict.model_dump(mode="json")
+
+
+def test_bytes_corrupted(ict):
+    """Test corrupted bytes are rejected."""
+    pytest.importorskip("msgpack")
+    data = bytearray(ict.to_bytes())
+    data[-1] ^= 0xFF
+    with pytest.raises(ValueError, match="digest"):
+        ICT.from_bytes(bytes(data), trusted=True)
+    with pytest.raises(ValueError, match="magic"):
+        ICT.from_bytes(b"not an ict, but long enough to hold a header")
+    for truncated in (b"", MAGIC, bytes(data[:-1])[: len(MAGIC) + 8]):
+        with pytest.raises(ValueError, match="Truncated"):
+            ICT.from_bytes(truncated)
+
+
+@pytest.mark.parametrize("key", [None, b"secret"])
+def test_trusted(ict, key):
+    """Test trusted round trip."""
+    data = dumps_trusted(ict, key=key)
+    loaded = loads_trusted(data, key=key)
+    assert loaded == ict
+    assert loaded.model_dump(mode="json") == ict.model_dump(mode="json")
+
+
+def test_trusted_tampered(ict):
+    """Test modified or foreign data is rejected."""
+    data = dumps_trusted(ict)
+    with pytest.raises(ValueError, match="digest"):
+        loads_trusted(data.replace(b'"name":"', b'"name":"x'))
+    with pytest.raises(ValueError, match="digest"):
+        loads_trusted(data, key=b"secret")
+    with pytest.raises(ValueError, match="digest"):
+        loads_trusted(dumps_trusted(ict, key=b"secret"), key=b"other")
+    with pytest.raises(ValueError, match="version"):
+        loads_trusted(data.replace(b" ict=", b" ict=0.0.0-", 1))
+    with pytest.raises(ValueError, match="header"):
+        loads_trusted(data.partition(b"\n")[2])
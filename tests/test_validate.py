@@ -0,0 +1,231 @@
+"""Test validation entry points."""
+import io
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from ict import (
+    ICT,
+    ValidationCache,
+    ValidationFailure,
+    check,
+    find_manifests,
+    iter_validate,
+    validate,
+    validate_many,
+)
+from ict.cache import CachedValidationError
+from ict.cli import main
+
+yml = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
+json_file = Path(__file__).parent.parent.joinpath("example", "spec.json")
+
+
+@pytest.fixture
+def manifests(tmp_path):
+    """Directory with valid and invalid manifests."""
+    with open(json_file, "r", encoding="utf-8") as f_o:
+        data = json.load(f_o)
+    good = []
+    for i in range(6):
+        data["version"] = f"1.{i}.0"
+        path = tmp_path.joinpath(f"good{i}.json")
+        path.write_text(json.dumps(data), encoding="utf-8")
+        good.append(path)
+    bad_version = dict(data, version="1.0")
+    bad = [tmp_path.joinpath("bad_version.json"), tmp_path.joinpath("bad.txt")]
+    bad[0].write_text(json.dumps(bad_version), encoding="utf-8")
+    bad[1].write_text("not a manifest", encoding="utf-8")
+    return good, bad
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many(manifests, workers):
+    """Test batch validation reports every file."""
+    good, bad = manifests
+    results = list(validate_many(good + bad, workers=workers, chunksize=2))
+    assert len(results) == len(good) + len(bad)
+    by_source = {res.source: res for res in results}
+    for path in good:
+        assert by_source[str(path)].ok
+        assert isinstance(by_source[str(path)].ict, ICT)
+    for path in bad:
+        assert not by_source[str(path)].ok
+        assert by_source[str(path)].ict is None
+    bad_version = by_source[str(bad[0])].error
+    assert bad_version.error_type == "ValidationError"
+    assert bad_version.details[0]["loc"] == ("version",)
+    assert by_source[str(bad[1])].error.error_type == "ValueError"
+
+
+def test_find_manifests(manifests, tmp_path):
+    """Test directories are expanded to their manifest files."""
+    good, bad = manifests
+    nested = tmp_path.joinpath("nested")
+    nested.mkdir()
+    nested.joinpath("spec.yml").write_text("", encoding="utf-8")
+    found = find_manifests([bad[1], str(tmp_path)])
+    assert found == [bad[1], bad[0], *good, nested.joinpath("spec.yml")]
+
+
+def test_validate_many_example():
+    """Test batch validation of the examples."""
+    results = list(validate_many([yml, json_file], workers=2))
+    assert all(res.ok for res in results)
+    assert results[0].ict == results[1].ict
+
+
+def test_validation_cache(tmp_path):
+    """Test validation results are served from the cache."""
+    cache = ValidationCache(tmp_path.joinpath("cache.db"))
+    first = validate(yml, cache=cache)
+    assert cache.stats == {"hits": 0, "misses": 1, "entries": 1}
+    second = validate(str(yml), cache=cache)
+    assert cache.stats == {"hits": 1, "misses": 1, "entries": 1}
+    assert first == second
+    assert second.hardware.cpu_min == "100"
+
+
+def test_validation_cache_error(tmp_path):
+    """Test validation errors are replayed from the cache."""
+    cache = ValidationCache(tmp_path.joinpath("cache.db"))
+    bad = tmp_path.joinpath("bad.yaml")
+    bad.write_text(yml.read_text(encoding="utf-8").replace("1.1.1", "1.1"))
+    with pytest.raises(CachedValidationError) as first:
+        validate(bad, cache=cache)
+    assert isinstance(first.value.__cause__, ValidationError)
+    with pytest.raises(CachedValidationError) as exc:
+        validate(bad, cache=cache)
+    assert exc.value.error_type == "ValidationError"
+    assert str(exc.value) == str(first.value)
+    assert cache.hits == 1
+
+
+def test_validation_cache_eviction(tmp_path):
+    """Test the least recently used entries are evicted."""
+    cache = ValidationCache(tmp_path.joinpath("cache.db"), max_entries=2)
+    text = yml.read_text(encoding="utf-8")
+    paths = []
+    for i in range(3):
+        path = tmp_path.joinpath(f"spec{i}.yaml")
+        path.write_text(text.replace("version: 1.1.1", f"version: 1.1.{i}"))
+        paths.append(path)
+    validate(paths[0], cache=cache)
+    validate(paths[1], cache=cache)
+    validate(paths[0], cache=cache)  # paths[1] is now least recently used
+    validate(paths[2], cache=cache)
+    assert len(cache) == 2
+    validate(paths[0], cache=cache)
+    assert cache.hits == 2
+    validate(paths[1], cache=cache)
+    assert cache.misses == 4
+
+
+def test_iter_validate_yaml():
+    """Test validation of a multi-document YAML stream."""
+    text = yml.read_text(encoding="utf-8")
+    bad = text.replace("version: 1.1.1", "version: 1.1")
+    stream = io.StringIO("\n---\n".join([text, bad, text] * 50) + "\n---\n")
+    results = iter_validate(stream)
+    first = next(results)
+    assert first.ok and first.index == 0
+    assert stream.tell() < len(stream.getvalue()) // 10  # parsed incrementally
+    results = [first] + list(results)
+    assert len(results) == 150
+    assert [res.ok for res in results[:3]] == [True, False, True]
+    assert results[1].index == 1
+    assert results[1].error.details[0]["loc"] == ("version",)
+
+
+def test_iter_validate_jsonl(tmp_path):
+    """Test validation of a JSON Lines file."""
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    path = tmp_path.joinpath("specs.jsonl")
+    lines = [json.dumps(data), "{not json", "", json.dumps(dict(data, name="a"))]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with open(path, "r", encoding="utf-8") as f_o:
+        results = list(iter_validate(f_o))
+    assert [(res.index, res.ok) for res in results] == [
+        (0, True),
+        (1, False),
+        (3, False),
+    ]
+    assert results[1].error.error_type == "JSONDecodeError"
+
+
+def test_check():
+    """Test every problem is reported with a JSON pointer and a code."""
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    assert not check(data)
+    assert not check(json_file)
+    data["version"] = "1.0"
+    del data["container"]
+    data["inputs"][0]["type"] = "bogus"
+    data["ui"][0]["title"] = 3
+    data["ui"][1]["key"] = "inputs.missing"
+    records = check(data)
+    assert [(record.pointer, record.code) for record in records] == [
+        ("/version", "value_error"),
+        ("/container", "missing"),
+        ("/inputs/0/type", "enum"),
+        ("/ui/0/title", "string_type"),
+        ("/ui/1/key", "ui_unmatched"),
+    ]
+    assert "inputs.missing" in records[-1].message
+    assert check(data, fail_fast=True) == records[:1]
+    assert check(Path("spec.txt"))[0].code == "invalid"
+
+
+def test_failure_records(tmp_path):
+    """Test validation failures hold one record per io/ui mismatch."""
+    data = json.loads(json_file.read_text(encoding="utf-8"))
+    data["inputs"].append(data["inputs"][0])
+    data["ui"][1]["key"] = "inputs.missing"
+    with pytest.raises(ValidationError) as exc:
+        validate(data)
+    records = ValidationFailure.from_exception(exc.value).records
+    assert [(record.pointer, record.code) for record in records] == [
+        (f"/inputs/{len(data['inputs']) - 1}/name", "duplicate_io"),
+        ("/ui/1/key", "ui_unmatched"),
+    ]
+    # records are rebuilt from the details of cached errors
+    cache = ValidationCache(tmp_path.joinpath("cache.db"))
+    bad = tmp_path.joinpath("bad.yaml")
+    bad.write_text(yml.read_text(encoding="utf-8").replace("1.1.1", "1.1"))
+    for _ in range(2):
+        with pytest.raises(ValueError) as exc:
+            validate(bad, cache=cache)
+        records = ValidationFailure.from_exception(exc.value).records
+        assert [record.pointer for record in records] == ["/version"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_many_fail_fast(manifests, workers):
+    """Test batch validation stops at the first invalid file."""
+    good, bad = manifests
+    results = list(
+        validate_many(bad + good, workers=workers, chunksize=1, fail_fast=True)
+    )
+    assert not results[-1].ok
+    assert all(result.ok for result in results[:-1])
+    assert len(results) < len(good) + len(bad)
+
+
+def test_cli_validate(manifests, capsys):
+    """Test the validate command prints one record per problem."""
+    good, bad = manifests
+    assert main(["validate", str(good[0].parent), "-j", "1", "--json"]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report == [
+        {
+            "source": str(bad[0]),
+            "errors": [report[0]["errors"][0]],
+        }
+    ]
+    assert report[0]["errors"][0]["pointer"] == "/version"
+    assert main(["validate", str(good[0]), str(good[1])]) == 0
+    capsys.readouterr()
+    assert main(["validate", str(bad[0]), str(good[0]), "-j", "1", "--fail-fast"]) == 1
+    assert "stopped at the first invalid manifest of 2" in capsys.readouterr().out
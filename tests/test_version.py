@@ -3,7 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
-from ict.semver import Version
+from ict.semver import Version, VersionConstraint
 
 G = [
     "1.2.3",
@@ -87,3 +87,78 @@ def test_eq2():
 def test_eq3():
     """Test equality operator."""
     assert Version("1.3.3") != Version("1.3.8")
+
+
+def test_hash():
+    """Test equal versions have equal hashes."""
+    assert Version("1.0.0-01") == Version("1.0.0-1")
+    assert hash(Version("1.0.0-01")) == hash(Version("1.0.0-1"))
+    assert len({Version("1.0.0-01"), Version("1.0.0-1"), Version("1.0.0")}) == 2
+
+
+def test_numeric_order():
+    """Test version parts are compared as integers."""
+    assert Version("10.0.0") > Version("9.0.0")
+    assert Version("1.10.0") > Version("1.9.0")
+    assert Version("1.2.10") > "1.2.9"
+
+
+def test_prerelease_order():
+    """Test prerelease precedence."""
+    ordered = ["1.0.0-2", "1.0.0-10", "1.0.0-alpha", "1.0.0-beta", "1.0.0", "1.0.1"]
+    versions = [Version(ver) for ver in reversed(ordered)]
+    assert [str(ver) for ver in sorted(versions)] == ordered
+    assert Version("1.0.0-rc1") < Version("1.0.0")
+    assert Version("1.0.0-rc1") != Version("1.0.0")
+    assert Version("1.0.0-rc1") <= "1.0.0-rc1"
+    assert Version("1.0.0-rc1") >= "1.0.0-rc1"
+
+
+def test_info():
+    """Test parsed version."""
+    info = Version("12.8.3-rc2").info
+    assert (info.major, info.minor, info.patch) == (12, 8, 3)
+    assert info.prerelease == "rc2"
+    assert Version("12.8.3").info.prerelease is None
+
+
+@pytest.mark.parametrize("ver", ["1-rc.2.3", "1.2-rc.3", "1.2.3-"])
+def test_bad_prerelease(ver):
+    """Test prerelease identifiers only follow the patch number."""
+    with pytest.raises(ValidationError):
+        Version(ver)
+
+
+def test_bad_comparison():
+    """Test comparison with unsupported types."""
+    with pytest.raises(TypeError):
+        Version("1.0.0") < 1  # pylint: disable=expression-not-assigned
+
+
+@pytest.mark.parametrize(
+    "constraint,inside,outside",
+    [
+        (">=1.1.0,<2.0.0", ["1.1.0", "1.9.9"], ["1.0.9", "2.0.0"]),
+        (">1.1.0,<=2.0.0", ["1.1.1", "2.0.0"], ["1.1.0", "2.0.1"]),
+        ("^1.2.3", ["1.2.3", "1.9.0"], ["1.2.2", "2.0.0"]),
+        ("^0.2.3", ["0.2.3", "0.2.9"], ["0.3.0"]),
+        ("~1.2.3", ["1.2.3", "1.2.9"], ["1.3.0"]),
+        ("1.2.3", ["1.2.3"], ["1.2.4"]),
+        ("!=1.2.3", ["1.2.4"], ["1.2.3"]),
+        ("*", ["0.0.1", "9.9.9"], []),
+    ],
+)
+def test_constraint(constraint, inside, outside):
+    """Test version constraints."""
+    constraint_ = VersionConstraint(constraint)
+    for ver in inside:
+        assert ver in constraint_
+    for ver in outside:
+        assert Version(ver) not in constraint_
+
+
+@pytest.mark.parametrize("constraint", [">=1.2", "=>1.2.3", ">=1.2.3,<x"])
+def test_bad_constraint(constraint):
+    """Test invalid version constraints."""
+    with pytest.raises(ValidationError):
+        VersionConstraint(constraint)
@@ -0,0 +1,79 @@
+"""Test watch mode."""
+import os
+import shutil
+from pathlib import Path
+
+from ict import watch
+from ict.cli import main
+from ict.watch import ManifestWatcher
+
+yml = Path(__file__).parent.parent.joinpath("example", "spec.yaml")
+
+
+def _touch(path: Path, text: str) -> None:
+    """Write a file and move its modification time forward."""
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_watcher(tmp_path):
+    """Test changes are detected and the last valid ICT is kept."""
+    spec = tmp_path.joinpath("tool", "spec.yaml")
+    spec.parent.mkdir()
+    shutil.copy(yml, spec)
+    watcher = ManifestWatcher(tmp_path)
+    events = watcher.scan()
+    assert [(e.change, e.status) for e in events] == [("added", "valid")]
+    good = watcher.last_good(spec)
+    assert good is not None and good.name == "wipp/threshold"
+    assert watcher.scan() == []
+
+    # same content, new mtime: not validated again
+    _touch(spec, yml.read_text(encoding="utf-8"))
+    assert watcher.scan() == []
+
+    _touch(spec, "name: broken\n")
+    events = watcher.scan()
+    assert [(e.change, e.status) for e in events] == [("modified", "broken")]
+    assert watcher.last_good(spec) is good
+    assert list(watcher.errors) == [spec]
+    assert (watcher.valid, len(watcher.icts)) == (0, 1)
+
+    _touch(spec, yml.read_text(encoding="utf-8").replace("1.1.1", "1.1.2"))
+    events = watcher.scan()
+    assert [e.status for e in events] == ["fixed"]
+    assert watcher.last_good(spec).version == "1.1.2"
+
+    spec.unlink()
+    assert [e.status for e in watcher.scan()] == ["removed"]
+    assert watcher.icts == {}
+
+
+def test_cli_watch_once(tmp_path, capsys):
+    """Test a single scan from the command line."""
+    shutil.copy(yml, tmp_path.joinpath("spec.yaml"))
+    tmp_path.joinpath("bad.json").write_text("{}", encoding="utf-8")
+    assert main(["watch", str(tmp_path), "--once"]) == 1
+    out = capsys.readouterr().out
+    assert "VALID" in out and "INVALID" in out
+
+
+def test_cli_watch(tmp_path, capsys, monkeypatch):
+    """Test the summary counts a broken manifest as invalid only."""
+    spec = tmp_path.joinpath("spec.yaml")
+    shutil.copy(yml, spec)
+    changes = iter([lambda: _touch(spec, "name: broken\n")])
+
+    def sleep(_):
+        change = next(changes, None)
+        if change is None:
+            raise KeyboardInterrupt
+        change()
+
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+    assert main(["watch", str(tmp_path), "--interval", "0"]) == 0
+    out = capsys.readouterr().out
+    assert "1 valid, 0 invalid" in out
+    assert "0 valid, 1 invalid" in out
+    assert "1 valid, 1 invalid" not in out
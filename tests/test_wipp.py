@@ -0,0 +1,138 @@
+"""Test conversion from WIPP."""
+import json
+from pathlib import Path
+
+import pytest
+
+from ict import ICT
+from ict.ui import UISelect
+from ict.wipp_utils import WIPPPlugin, convert_wipp_many
+from ict.wipp_utils.ui import dispatch_ui
+
+MANIFEST = {
+    "name": "Threshold Plugin",
+    "version": "1.1.1",
+    "title": "Threshold",
+    "description": "Threshold an image collection",
+    "author": "Jane Doe (jane.doe@example.com)",
+    "containerId": "wipp/wipp-thresh-plugin:1.1.1",
+    "baseCommand": ["python3", "main.py"],
+    "inputs": [
+        {
+            "name": "inputDir",
+            "type": "collection",
+            "description": "Input images",
+            "required": True,
+        },
+        {
+            "name": "method",
+            "type": "enum",
+            "required": False,
+            "options": {"values": ["otsu", "mean"]},
+        },
+    ],
+    "outputs": [{"name": "outDir", "type": "collection", "description": "Output"}],
+    "ui": [
+        {"key": "inputs.inputDir", "title": "Input"},
+        {"key": "inputs.method", "title": "Method", "condition": "model.x"},
+    ],
+    "resourceRequirements": {"ramMin": 2048, "coresMin": 1, "gpu": False},
+}
+
+
+@pytest.fixture
+def wipp_file(tmp_path):
+    """WIPP manifest written as JSON."""
+    path = tmp_path.joinpath("plugin.json")
+    path.write_text(json.dumps(MANIFEST), encoding="utf-8")
+    return path
+
+
+def test_from_wipp(wipp_file):
+    """Test conversion without polus.plugins."""
+    ict = ICT.from_wipp(wipp_file)
+    assert ict == ICT.from_wipp(str(wipp_file))
+    assert ict == ICT.from_wipp(MANIFEST)
+    assert ict == ICT.from_wipp(WIPPPlugin(**MANIFEST))
+    assert ict.name == "wipp/Threshold"
+    assert ict.contact == "jane.doe@example.com"
+    assert [io.name for io in ict.inputs] == ["inputDir", "method"]
+    assert ict.ui[1].ui_type == "select"
+    assert ict.hardware.cpu_min == "1"
+    assert ict.hardware.memory_min == "2048Mi"
+
+
+def test_convert_wipp_many(wipp_file, tmp_path):
+    """Test batch conversion and its report."""
+    missing = tmp_path.joinpath("missing.json")
+    report = convert_wipp_many([wipp_file, missing], tmp_path.joinpath("out"), 1)
+    assert (report.converted, report.failed) == (1, 1)
+    result = report.results[0]
+    assert ICT.from_wipp(wipp_file) == ICT(**_load_yaml(result.output))
+    assert "repository" in result.defaults
+    assert "inputs.method.description" in result.defaults
+    assert "ui.inputs.method.condition" in result.defaults
+    assert set(result.timings) == {"load", "convert", "validate", "write"}
+    assert report.results[1].source == str(missing)
+    assert not report.results[1].ok
+
+
+def test_convert_wipp_many_collision(wipp_file, tmp_path):
+    """Test manifests converted to the same output are reported."""
+    copy = tmp_path.joinpath("copy.json")
+    copy.write_text(json.dumps(MANIFEST), encoding="utf-8")
+    other = tmp_path.joinpath("other.json")
+    other.write_text(json.dumps({**MANIFEST, "version": "1.2.0"}), encoding="utf-8")
+    out = tmp_path.joinpath("out")
+    report = convert_wipp_many([wipp_file, copy, other], out, 2, chunksize=1)
+    assert (report.converted, report.failed) == (1, 2)
+    assert "were all converted to" in report.results[0].error.message
+    assert report.results[0].error == report.results[1].error
+    assert [path.name for path in out.iterdir()] == [
+        Path(report.results[2].output).name
+    ]
+
+
+def _load_yaml(path):
+    """Read a YAML file."""
+    from ict._yaml import safe_load  # pylint: disable=import-outside-toplevel
+
+    with open(path, encoding="utf-8") as file:
+        return safe_load(file)
+
+
+def test_ui_fieldsets():
+    """Test UI items are ordered by fieldsets and keys follow IO names."""
+    manifest = {
+        **MANIFEST,
+        "inputs": [
+            *MANIFEST["inputs"],
+            {"name": "out_type", "type": "array", "options": {"values": ["a", "b"]}},
+        ],
+        "ui": [
+            *MANIFEST["ui"],
+            {"key": "inputs.out_type", "title": "Types"},
+            {
+                "key": "fieldsets",
+                "fieldsets": [
+                    {"title": "Options", "fields": ["method", "out_type"]},
+                    {"title": "Input", "fields": ["inputDir"]},
+                ],
+            },
+        ],
+    }
+    ict = ICT.from_wipp(manifest)
+    assert [ui.key.root for ui in ict.ui] == [
+        "inputs.method",
+        "inputs.outtype",
+        "inputs.inputDir",
+    ]
+    assert ict.ui[1].ui_type == "multiselect"
+    assert ict.ui[1].fields == ["a", "b"]
+
+
+def test_dispatch_ui():
+    """Test the UI model lookup kept for compatibility."""
+    assert dispatch_ui("select") is UISelect
+    with pytest.raises(ValueError, match="not found"):
+        dispatch_ui("slider")